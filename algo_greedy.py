@@ -1,6 +1,51 @@
+import os
+import tempfile
+
 import pandas as pd
 import numpy as np
 
+from atama_durumu import AtamaDurumu, BOS
+
+
+def gno_sirasi(gno):
+    """
+    Öğrenci indexlerini GNO'ya göre azalan sırada döndürür (argsort(-GNO)).
+    Eşit GNO'lu öğrencilerin sırası pandas sort_values(ascending=False) ile aynıdır,
+    GNO'su boş olanlar en sona kalır.
+    """
+    gno = np.asarray(gno, dtype=float)
+    bos = np.isnan(gno)
+    idx = np.arange(len(gno))[~bos][::-1]
+    sira = idx[gno[~bos][::-1].argsort(kind='quicksort')][::-1]
+    return np.concatenate([sira, np.flatnonzero(bos)])
+
+
+def greedy_yerlestir(tercihler, kontenjan, sira):
+    """
+    Dizi tabanlı greedy motoru.
+    tercihler: (N x k) firma id matrisi, kontenjan: firma id -> kontenjan,
+    sira: öğrencilerin seçim sırası.
+    (atama, tercih_no, kalan_kontenjan) döndürür; yerleşmeyenin tercih_no'su 0'dır.
+    Her kontenjan kontrolü O(1), toplam maliyet O(N log N + k*N).
+    """
+    # Python listeleri döngü içinde NumPy skalerlerinden çok daha hızlı
+    tercih_listesi = np.asarray(tercihler).tolist()
+    kalan = np.asarray(kontenjan).tolist()
+    atama = [BOS] * len(tercih_listesi)
+    tercih_no = [0] * len(tercih_listesi)
+
+    for idx in np.asarray(sira).tolist():
+        for i, firma_id in enumerate(tercih_listesi[idx], start=1):
+            # firma listede yoksa (-1) geç, kontenjan varsa yerleştir
+            if firma_id >= 0 and kalan[firma_id] > 0:
+                atama[idx] = firma_id
+                tercih_no[idx] = i
+                kalan[firma_id] -= 1
+                break
+
+    return (np.array(atama, dtype=np.int32), np.array(tercih_no, dtype=np.int8),
+            np.array(kalan, dtype=np.int64))
+
 
 def greedy_atama(ogrenciler_df, firmalar_df):
     ogrenciler = ogrenciler_df.copy().reset_index(drop=True)
@@ -8,125 +53,226 @@ def greedy_atama(ogrenciler_df, firmalar_df):
 
     # Kolonları temizle/başlat
     ogrenciler['Yerleştiği_Firma'] = None
-    ogrenciler['Tercih_Sırası'] = "-"
-    firmalar['Yerlesenler'] = None
+
+    # Firma isimleri bir kere id'ye çevrilir (hash), döngü diziler üzerinde çalışır
+    durum = AtamaDurumu.dataframe_den(ogrenciler, firmalar)
 
     # GNO'ya göre sırala (En yüksek puanlı en önce seçer)
-    sirali_ogrenciler = ogrenciler.sort_values('GNO', ascending=False)
+    sira = gno_sirasi(ogrenciler['GNO'].to_numpy())
+    durum.atama, _, durum.kontenjan = greedy_yerlestir(durum.tercihler, durum.kontenjan, sira)
+
+    # Yerleştiği_Firma, Tercih_Sırası ve firmalara Yerlesenler (ortak son işlem)
+    return durum.sonuclari_yaz(ogrenciler, firmalar)
+
+# Disk üzerindeki (out-of-core) greedy'nin bellekte tuttuğu en fazla öğrenci sayısı
+DISK_PARCASI = 1_000_000
 
 
-    for idx, ogrenci in sirali_ogrenciler.iterrows():  # enumerate ile aynı işi yapıyor 
-        # 1'den 5'e kadar tercihleri dön
-        for i in range(1, 6):
-            tercih_col = f'Tercih{i}'
+def _siralama_parcalari(gno, parca, klasor):
+    """
+    Harici sıralamanın ilk adımı: GNO'yu parça parça (azalan, eşitlerde index sırası,
+    boşlar en sonda) sıralar ve her sıralı parçayı (anahtar, index) .npy dosyalarına yazar.
+    Dosyalar burada eşlenmez (memmap değil); yollarını döndürür.
+    """
+    parcalar = []
+    for bas in range(0, len(gno), parca):
+        # Azalan sıra için anahtar -GNO; boş GNO +inf olur, en sona kalır
+        anahtar = -np.asarray(gno[bas:bas + parca], dtype=np.float64)
+        anahtar[np.isnan(anahtar)] = np.inf
+        sira = np.argsort(anahtar, kind='stable')
+
+        anahtar_yolu = os.path.join(klasor, f"anahtar_{bas}.npy")
+        index_yolu = os.path.join(klasor, f"index_{bas}.npy")
+        np.save(anahtar_yolu, anahtar[sira])
+        np.save(index_yolu, sira + bas)
+        parcalar.append((anahtar_yolu, index_yolu))
+    return parcalar
+
+
+def _birlestir(parcalar, blok):
+    """
+    Sıralı parçaların blok blok k-yollu birleştirmesi (vektörel).
 
-            if tercih_col not in ogrenci:
-                continue
+    Her parçadan bir blok okunur. Diskte okunmamış verisi kalan parçaların tampondaki son
+    (anahtar, index) değerlerinin en küçüğü bir eşik verir: eşiğe kadar olan tüm elemanlar
+    kesin sıralarına gelmiştir, birlikte sıralanıp döndürülür.
 
-            # öğrencinin ilk tercihini alıyor
-            tercih_firma = ogrenci[tercih_col]
+    Parça dosyaları sadece bu generator içinde eşlenir (memmap) ve tamponlara kopyalanarak
+    okunur; generator bitince veya close() edilince eşlemeler bırakılır.
+    """
+    parcalar = [(np.load(a, mmap_mode='r'), np.load(i, mmap_mode='r')) for a, i in parcalar]
+    okunan = [0] * len(parcalar)
+    tamponlar = [(np.empty(0), np.empty(0, dtype=np.int64))] * len(parcalar)
+
+    while True:
+        for p, (anahtar_mm, index_mm) in enumerate(parcalar):
+            if len(tamponlar[p][1]) == 0 and okunan[p] < len(index_mm):
+                tamponlar[p] = (np.array(anahtar_mm[okunan[p]:okunan[p] + blok]),
+                                np.array(index_mm[okunan[p]:okunan[p] + blok]))
+                okunan[p] += len(tamponlar[p][1])
+        if not any(len(idx) for _, idx in tamponlar):
+            return
+
+        # Eşik: devamı diskte olan parçaların tampondaki son elemanlarının en küçüğü
+        esik = min(((a[-1], i[-1]) for p, (a, i) in enumerate(tamponlar)
+                    if okunan[p] < len(parcalar[p][1])), default=(np.inf, np.iinfo(np.int64).max))
+
+        alinan_anahtar, alinan_index = [], []
+        for p, (anahtar, idx) in enumerate(tamponlar):
+            # (anahtar, index) <= eşik olan önek
+            kucuk = np.searchsorted(anahtar, esik[0], side='left')
+            esit = np.searchsorted(anahtar, esik[0], side='right')
+            sayi = kucuk + np.searchsorted(idx[kucuk:esit], esik[1], side='right')
+            alinan_anahtar.append(anahtar[:sayi])
+            alinan_index.append(idx[:sayi])
+            tamponlar[p] = (anahtar[sayi:], idx[sayi:])
+
+        anahtar, idx = np.concatenate(alinan_anahtar), np.concatenate(alinan_index)
+        yield idx[np.lexsort((idx, anahtar))]
+
+
+def gno_sirasi_disk(gno, parca=DISK_PARCASI, gecici_klasor=None):
+    """
+    gno_sirasi'nin disk üzerinde çalışan hali (harici birleştirmeli sıralama, generator).
 
-            # boolean mask yapıp o firmanın satırını getiriyor
-            firma_row = firmalar[firmalar['Firma'] == tercih_firma]
-            if firma_row.empty:
-                continue
+    GNO dizisi (memmap olabilir) parça parça sıralanıp geçici dosyalara yazılır, sonra
+    parçalar k-yollu birleştirilir. Öğrenci index'leri GNO'ya göre azalan sırada, en fazla
+    'parca' elemanlık diziler halinde döndürülür. Bellekte aynı anda tek parça tutulur.
 
-            firma_idx = firma_row.index[0]
+    GNO tek parçaya sığıyorsa sıralama bellekte gno_sirasi ile yapılır, sonuç (eşitlikler dahil)
+    greedy_atama ile birebir aynıdır. Birden çok parçada eşit GNO'lu öğrenciler index sırasıyla
+    gelir; gno_sirasi pandas'ın kararsız quicksort sırasını izlediği için eşitlikler (GNO'lar
+    2 ondalıklı olduğundan pratikte sık) farklı sıralanabilir.
+    """
+    if len(gno) <= parca:
+        yield gno_sirasi(gno)
+        return
+
+    with tempfile.TemporaryDirectory(dir=gecici_klasor) as klasor:
+        parcalar = _siralama_parcalari(gno, parca, klasor)
+        birlestirici = _birlestir(parcalar, max(1, parca // len(parcalar)))
+        try:
+            # Birleştirilen sıra 'parca' elemanlık dizilere bölünür
+            tampon, tampon_boyu = [], 0
+            for idx in birlestirici:
+                tampon.append(idx)
+                tampon_boyu += len(idx)
+                while tampon_boyu >= parca:
+                    hepsi = np.concatenate(tampon)
+                    yield hepsi[:parca]
+                    tampon, tampon_boyu = [hepsi[parca:]], tampon_boyu - parca
+            if tampon_boyu:
+                yield np.concatenate(tampon)
+        finally:
+            # Windows eşlenmiş dosyayı silmez: klasör silinmeden önce memmap'ler kapanmalı
+            # (generator yarıda bırakılsa da)
+            birlestirici.close()
+
+
+def greedy_atama_disk(tercihler, gno, kontenjan, atama_yolu, parca=DISK_PARCASI, gecici_klasor=None):
+    """
+    Bellek yerine diskle sınırlı greedy (ulusal ölçekli veri setleri için).
 
-            # Kontenjan varsa yerleştir
-            if firmalar.at[firma_idx, 'Kontenjan'] > 0:
-                ogrenciler.at[idx, 'Yerleştiği_Firma'] = tercih_firma
-                ogrenciler.at[idx, 'Tercih_Sırası'] = i
-                firmalar.at[firma_idx, 'Kontenjan'] -= 1
-                break
+    tercihler: (N x k) firma id matrisi, gno: (N,) dizi; ikisi de np.load(..., mmap_mode='r')
+    ile açılmış memmap olabilir. Öğrenciler gno_sirasi_disk ile GNO sırasında parça parça
+    işlenir; bellekte sadece firma kontenjanları ve o anki parça tutulur.
+    Atama (int32, yerleşmeyen -1) atama_yolu'na .npy memmap olarak yazılır.
+    (atama memmap, kalan_kontenjan) döndürür.
+    """
+    ogrenci_sayisi = tercihler.shape[0]
+    kalan = np.asarray(kontenjan, dtype=np.int64).copy()
+
+    atama = np.lib.format.open_memmap(atama_yolu, mode='w+', dtype=np.int32, shape=(ogrenci_sayisi,))
+    atama[:] = BOS
+
+    for sira in gno_sirasi_disk(gno, parca, gecici_klasor):
+        # Satırlar diskten artan index sırasıyla okunur, sonra GNO sırasına dizilir
+        okuma_sirasi = np.argsort(sira, kind='stable')
+        satirlar = np.empty((len(sira), tercihler.shape[1]), dtype=np.int32)
+        satirlar[okuma_sirasi] = tercihler[sira[okuma_sirasi]]
+
+        parca_atama, _, kalan = greedy_yerlestir(satirlar, kalan, np.arange(len(sira)))
+        atama[sira] = parca_atama
 
-    # firmalara yerleşen öğrencileri gruplar firma dataframeinde Yerlesenler sütununa yerleşenleri ekler
-    yerlesen_grup = ogrenciler[ogrenciler['Yerleştiği_Firma'].notna()].groupby('Yerleştiği_Firma')['Öğrenci'].apply(
-        lambda x: ", ".join(x))
-    firmalar['Yerlesenler'] = firmalar['Firma'].map(yerlesen_grup).fillna("-")
+    atama.flush()
+    return atama, kalan
 
-    return ogrenciler, firmalar
 
-ogrenciler1 = pd.read_csv("proje_ogrenciler.csv")
-firmalar1 = pd.read_csv("proje_firmalar.csv")
-# greedy_atama(ogrenciler1, firmalar1)
+# Red simülasyonu parametreleri: red olasılığı %15 ile başlar, her tur %3 azalır
+MAX_TUR = 10
+BASE_RED_OLASILIGI = 0.15
+RED_AZALMA = 0.03
 
-def simulasyon_dongusu(ogrenciler_df, firmalar_df):
+
+def red_orani(tur, base_red_olasiligi=BASE_RED_OLASILIGI):
     """
-    Simülasyon Mantığı:
-    1. Greedy ile yerleştir.
-    2. Firmalar "red_olasiligi" oranında öğrenciyi kovar.
-    3. red_olasiligi her turda azalır (Sistem oturmaya başlar).
-    4. Kontenjan dolana veya hareket bitene kadar devam eder.
+    Turdaki red olasılığı. Sistem otursun (converge etsin) diye her turda azalır.
+    Örnek: Tur 1 -> %12, Tur 2 -> %9 ... Tur 5 -> %0 (Artık kimse atılmasın)
     """
-    ogr = ogrenciler_df.copy().reset_index(drop=True)
-    frm = firmalar_df.copy().reset_index(drop=True)
+    return max(0, base_red_olasiligi - (tur * RED_AZALMA))
 
-    # Temizlik
-    if 'Yerleştiği_Firma' not in ogr.columns:
-        ogr['Yerleştiği_Firma'] = None
-    ogr['Tercih_Sırası'] = "-"
 
-    gecmis_log = []
-    max_tur = 10
+def simulasyon_turlari(durum, gno, ogrenci_isimleri, tercih_no=None, max_tur=MAX_TUR,
+                       base_red_olasiligi=BASE_RED_OLASILIGI, rng=None):
+    """
+    Red simülasyonunun tur tur çalışan hali (generator).
 
-    # Başlangıç Red Olasılığı (%15 ile başla, giderek düşür)
-    base_red_olasiligi = 0.15
+    durum (AtamaDurumu) yerinde güncellenir, her tur hesaplanır hesaplanmaz turun
+    log kaydı döndürülür; arayüz turları bekletmeden gösterebilir.
+    tercih_no verilirse öğrencilerin tercih numaraları (0 = yerleşmedi) da güncellenir.
+    Red kararları tek seferde vektörel (Bernoulli) çekilir; rng verilmezse np.random kullanılır.
+    """
+    rng = np.random if rng is None else rng
+    gno = np.asarray(gno, dtype=float)
+    ogrenci_isimleri = np.asarray(ogrenci_isimleri, dtype=object)
+    if tercih_no is None:
+        tercih_no = np.zeros(durum.ogrenci_sayisi, dtype=np.int8)
 
     for tur in range(1, max_tur + 1):
 
-        # boştakileri yerleştir
-        bostakiler = ogr[ogr['Yerleştiği_Firma'].isnull()].sort_values('GNO', ascending=False)
-        yerlesen_bu_tur = 0
-
-        for idx, ogrenci in bostakiler.iterrows():
-            for i in range(1, 6):
-                tercih = ogrenci[f'Tercih{i}']
-                f_idx = frm[frm['Firma'] == tercih].index
-                # print(f_idx)
-                if not f_idx.empty and frm.at[f_idx[0], 'Kontenjan'] > 0:
-                    ogr.at[idx, 'Yerleştiği_Firma'] = tercih
-                    ogr.at[idx, 'Tercih_Sırası'] = i
-                    frm.at[f_idx[0], 'Kontenjan'] -= 1
-                    yerlesen_bu_tur += 1
-                    break
+        # --- ADIM 1: BOŞTAKİLERİ YERLEŞTİR (GNO sırasıyla greedy) ---
+        bostakiler = np.flatnonzero(durum.atama == BOS)
+        # Greedy sadece boştakilerin tercih satırlarıyla çalışır (zaten sıralı verilir)
+        sira = bostakiler[gno_sirasi(gno[bostakiler])]
+        yeni_atama, yeni_tercih_no, durum.kontenjan = greedy_yerlestir(durum.tercihler[sira], durum.kontenjan,
+                                                                      np.arange(sira.size))
+        durum.atama[sira] = yeni_atama
+        tercih_no[sira] = yeni_tercih_no
+        yerlesen_bu_tur = int(np.count_nonzero(yeni_atama != BOS))
 
         # --- ADIM 2: RED SİMÜLASYONU (DİNAMİK ORAN) ---
-        # Her turda red olasılığını azaltıyoruz ki sistem otursun (Converge etsin)
-        # Örnek: Tur 1 -> %15, Tur 2 -> %12 ... Tur 5 -> %0 (Artık kimse atılmasın)
-        guncel_red_orani = max(0, base_red_olasiligi - (tur * 0.03))
-
-        reddedilen_sayisi = 0
-        red_listesi_text = []
-
         # Sadece bu tur yerleşenler değil, halihazırda çalışanlar da risk altında olsun
-        calisanlar = ogr[ogr['Yerleştiği_Firma'].notna()]
+        guncel_red_orani = red_orani(tur, base_red_olasiligi)
+        reddedilenler = np.empty(0, dtype=np.int64)
+        red_firmalari = np.empty(0, dtype=np.int32)
 
-        if not calisanlar.empty and guncel_red_orani > 0:
-            for idx, row in calisanlar.iterrows():
-                # Her öğrenci için zar at
-                if np.random.rand() < guncel_red_orani:
-                    firma = row['Yerleştiği_Firma']
-                    ogr.at[idx, 'Yerleştiği_Firma'] = None
-                    ogr.at[idx, 'Tercih_Sırası'] = "-"  # Sırası silinir
+        calisanlar = np.flatnonzero(durum.atama != BOS)
+        if calisanlar.size and guncel_red_orani > 0:
+            # Her çalışan için tek seferde zar at
+            reddedilenler = calisanlar[rng.random(calisanlar.size) < guncel_red_orani]
+            red_firmalari = durum.atama[reddedilenler]
 
-                    # Firmanın kontenjanını geri ver
-                    f_idx = frm[frm['Firma'] == firma].index[0]
-                    frm.at[f_idx, 'Kontenjan'] += 1
+            # Firmaların kontenjanını geri ver
+            durum.kontenjan += np.bincount(red_firmalari, minlength=durum.firma_sayisi)
+            durum.atama[reddedilenler] = BOS
+            tercih_no[reddedilenler] = 0
 
-                    reddedilen_sayisi += 1
-                    red_listesi_text.append(f"{firma}->{row['Öğrenci']}")
+        # atama dizisine doğrudan yazıldı
+        durum.sakin_indeksini_sifirla()
 
         # --- LOGLAMA ---
-        kalan_kontenjan = frm['Kontenjan'].sum()
+        kalan_kontenjan = int(durum.kontenjan.sum())
+        reddedilen_sayisi = int(reddedilenler.size)
+        red_listesi_text = [f"{durum.firma_isimleri[f]}->{o}"
+                            for f, o in zip(red_firmalari[:3], ogrenci_isimleri[reddedilenler[:3]])]
 
-        gecmis_log.append({
+        yield {
             "Tur": tur,
             "Yerleşen": yerlesen_bu_tur,
             "Reddedilen": reddedilen_sayisi,
             "Kalan_Kontenjan": kalan_kontenjan,
-            "Red_Detay": ", ".join(red_listesi_text[:3]) + ("..." if len(red_listesi_text) > 3 else "")
-        })
+            "Red_Detay": ", ".join(red_listesi_text) + ("..." if reddedilen_sayisi > 3 else "")
+        }
 
         # --- ÇIKIŞ KOŞULU ---
         # Eğer kimse yerleşmediyse VE kimse reddedilmediyse döngü bitmiştir.
@@ -137,6 +283,37 @@ def simulasyon_dongusu(ogrenciler_df, firmalar_df):
         if kalan_kontenjan == 0 and reddedilen_sayisi == 0:
             break
 
+
+def simulasyon_dongusu(ogrenciler_df, firmalar_df, max_tur=MAX_TUR, base_red_olasiligi=BASE_RED_OLASILIGI,
+                       rng=None):
+    """
+    Simülasyon Mantığı:
+    1. Greedy ile yerleştir.
+    2. Firmalar "red_olasiligi" oranında öğrenciyi kovar.
+    3. red_olasiligi her turda azalır (Sistem oturmaya başlar).
+    4. Kontenjan dolana veya hareket bitene kadar devam eder.
+
+    Turlar simulasyon_turlari() ile hesaplanır; (ogrenciler, firmalar, gecmis_log) döner.
+    """
+    ogr = ogrenciler_df.copy().reset_index(drop=True)
+    frm = firmalar_df.copy().reset_index(drop=True)
+
+    # Temizlik
+    if 'Yerleştiği_Firma' not in ogr.columns:
+        ogr['Yerleştiği_Firma'] = None
+
+    durum = AtamaDurumu.dataframe_den(ogr, frm)
+    gecmis_log = list(simulasyon_turlari(durum, ogr['GNO'].to_numpy(), ogr['Öğrenci'].to_numpy(),
+                                         max_tur=max_tur, base_red_olasiligi=base_red_olasiligi, rng=rng))
+
+    ogr, frm = durum.sonuclari_yaz(ogr, frm)
     return ogr, frm, gecmis_log
 
-simulasyon_dongusu(ogrenciler1, firmalar1)
\ No newline at end of file
+
+if __name__ == "__main__":
+    # Örnek: proje CSV'leri üzerinde red simülasyonu (import edilince hiçbir şey çalışmaz)
+    ogr, _, gecmis_log = simulasyon_dongusu(pd.read_csv("proje_ogrenciler.csv"), pd.read_csv("proje_firmalar.csv"))
+    for log in gecmis_log:
+        print(f"Tur {log['Tur']}: {log['Yerleşen']} yerleşti, {log['Reddedilen']} reddedildi, "
+              f"kalan kontenjan {log['Kalan_Kontenjan']}")
+    print(f"Toplam yerleşen: {ogr['Yerleştiği_Firma'].notna().sum()} / {len(ogr)}")
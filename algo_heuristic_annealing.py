@@ -1,122 +1,180 @@
-import pandas as pd
-import numpy as np
-
+import bisect
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 
-def memnuniyet_skoru_hesapla(ogrenciler_df):
-    """
-    Öğrencilerin yerleştiği firmaya göre puanını hesaplar.
-    """
-    puanlar = {1: 100, 2: 80, 3: 60, 4: 40, 5: 20}
-    toplam_puan = 0
+import numpy as np
 
-    # Yerleşenleri filtrele (Hata almamak için kopyasıyla çalış)
-    df = ogrenciler_df.copy()
-    if 'Yerleştiği_Firma' not in df.columns:
-        return 0
+from atama_durumu import AtamaDurumu, BOS
+from skorlama import memnuniyet_skoru_hesapla  # eski importlar için burada da erişilebilir
+from telemetri import Telemetri
 
-    yerlesenler = df[df['Yerleştiği_Firma'].notna()]
 
-    for _, ogrenci in yerlesenler.iterrows():
-        yerlesen_firma = ogrenci['Yerleştiği_Firma']
-        # 1'den 5'e kadar tercihleri kontrol et
-        for i in range(1, 6):
-            col_name = f'Tercih{i}'
-            # Eğer tercih sütunu varsa ve eşleşiyorsa
-            if col_name in ogrenci and ogrenci[col_name] == yerlesen_firma:
-                toplam_puan += puanlar[i]
-                break
-    return toplam_puan
+DURMA_NEDENLERI = ("iterasyon_limiti", "durgunluk")
 
 
-def heuristic_atama(ogrenciler_df, firmalar_df, iterasyon=10000, step_callback=None):
+def tavlama(current, iterasyon=10000, rng=None, step_callback=None, dogrulama_araligi=None,
+            sicaklik=150, soguma_orani=0.99, uyarlamali=False, hedef_kabul_orani=0.2, pencere=100,
+            yeniden_isitma=None, isitma_orani=0.5, durgunluk_limiti=None, yazdir=True, telemetri=None,
+            tercih_egilimi=1.0):
     """
-    Simulated Annealing - Hassas Ayar Modu (Greedy üzerine iyileştirme)
+    Tek bir Simulated Annealing zinciri (dizi tabanlı durum üzerinde).
+    current yerinde değişir; (en iyi durum, en iyi skor, rapor) döndürür.
+
+    - uyarlamali: her 'pencere' iterasyonda kötüleştiren hamlelerin kabul oranına bakılır;
+      oran hedefin üstündeyse ek soğutma yapılır, altındaysa sıcaklık biraz artırılır.
+    - yeniden_isitma: bu kadar iterasyon gelişme olmazsa sıcaklık başlangıcın
+      isitma_orani katına çıkarılır.
+    - durgunluk_limiti: bu kadar iterasyon en iyi skor değişmezse koşu erken biter.
+    - tercih_egilimi: hamle karışımı; öğrencinin k. tercihine gitme hamlesi tercih_egilimi**(k-1)
+      ile orantılı olasılıkla önerilir (1 = tüm tercihler eşit, küçüldükçe üst tercihler ağır basar).
+    rapor['Durma_Nedeni'] koşunun neden bittiğini söyler ('iterasyon_limiti' / 'durgunluk').
+
+    telemetri: Telemetri nesnesi (verilmezse varsayılan ayarlarla oluşturulur). Hamle sayaçları,
+    süre dağılımı ve skor/sıcaklık izi rapor['Telemetri'] içinde döner. yazdir sadece
+    başlangıç/bitiş özetini basar; döngü içinde stdout'a yazılmaz.
     """
-    # 1. Verileri Güvenli Kopyala
-    current_ogrenciler = ogrenciler_df.copy().reset_index(drop=True)
-    current_firmalar = firmalar_df.copy().reset_index(drop=True)
-
-    # Kolon yoksa oluştur
-    if 'Yerleştiği_Firma' not in current_ogrenciler.columns:
-        current_ogrenciler['Yerleştiği_Firma'] = None
+    if rng is None:
+        rng = np.random.default_rng()
+    if telemetri is None:
+        telemetri = Telemetri()
+    zamanlama = telemetri.zamanlama
+    adim_araligi = telemetri.adim_araligi
+    saat = time.perf_counter
+
+    baslangic_sicakligi = sicaklik
+    son_gelisme = 0       # en iyi skorun son değiştiği iterasyon
+    son_isitma = 0        # son yeniden ısıtma (veya gelişme) iterasyonu
+    isitma_sayisi = 0
+    kotu_denenen = 0      # penceredeki kötüleştiren (delta <= 0) hamle sayısı
+    kotu_kabul = 0
+    durma_nedeni = "iterasyon_limiti"
+    yapilan = iterasyon
 
     # Başlangıç Skoru (Genelde Greedy'den gelir)
-    current_score = memnuniyet_skoru_hesapla(current_ogrenciler)
+    current_score = current.skor()
 
     # EN İYİ Çözümü Sakla
-    best_ogrenciler = current_ogrenciler.copy()
-    best_firmalar = current_firmalar.copy()
+    best = current.kopya()
     best_score = current_score
 
-    # --- AYARLAR (GÜNCELLENDİ) ---
-    # Önceden 5000 idi, şimdi 150 yapıyoruz.
-    # Bu sayede eldeki güzel çözümü bozmadan ufak iyileştirmeler arayacak.
-    sicaklik = 150
-    soguma_orani = 0.99
+    ogrenci_sayisi = current.ogrenci_sayisi
+    tercih_sayisi = current.tercihler.shape[1]
+
+    # Eşit olmayan tercih dağılımı için kümülatif olasılıklar (eşitse eski rng.integers yolu)
+    if tercih_egilimi <= 0:
+        raise ValueError(f"tercih_egilimi pozitif olmalı ({tercih_egilimi} verildi)")
+    if not 0 < soguma_orani <= 1:
+        raise ValueError(f"soguma_orani (0, 1] aralığında olmalı ({soguma_orani} verildi)")
+    kumulatif = None
+    if tercih_egilimi != 1:
+        agirlik = np.cumsum(float(tercih_egilimi) ** np.arange(tercih_sayisi))
+        kumulatif = (agirlik / agirlik[-1]).tolist()
+        kumulatif[-1] = 1.0
 
-    ogrenci_indexleri = current_ogrenciler.index.tolist()
+    baslangic_skoru = current_score
 
-    print(f"--- HEURISTIC BAŞLIYOR (Fine-Tuning Modu) ---")
-    print(f"Başlangıç Skoru: {current_score}")
+    if yazdir:
+        print(f"--- HEURISTIC BAŞLIYOR (Fine-Tuning Modu) ---")
+        print(f"Başlangıç Skoru: {current_score}")
 
+    telemetri.baslat(current_score)
     for i in range(iterasyon):
         # Arayüze sinyal gönder (Progress Bar)
         if step_callback and i % 50 == 0:
             step_callback(i)
+        # İz örneklemesi ve telemetri callback'i (yapılandırılmış, print yok); döngü başında
+        # çağrılır ki atlanan hamleyle biten iterasyonlar örnek / callback kaçırmasın
+        if i % adim_araligi == 0:
+            telemetri.adim(i, current_score, best_score, sicaklik)
+
+        # --- 0. DURMA / ISITMA / UYARLAMALI SOĞUTMA ---
+        if durgunluk_limiti and i - son_gelisme >= durgunluk_limiti:
+            durma_nedeni = "durgunluk"
+            yapilan = i
+            break
+
+        if yeniden_isitma and i - max(son_gelisme, son_isitma) >= yeniden_isitma:
+            sicaklik = baslangic_sicakligi * isitma_orani
+            son_isitma = i
+            isitma_sayisi += 1
+
+        if uyarlamali and i > 0 and i % pencere == 0:
+            if kotu_denenen:
+                # Çok fazla kötü hamle kabul ediliyorsa hızlı soğut, sistem donuyorsa yavaşlat
+                kabul_orani = kotu_kabul / kotu_denenen
+                sicaklik = min(sicaklik * (0.9 if kabul_orani > hedef_kabul_orani else 1.05),
+                               baslangic_sicakligi)
+            kotu_denenen = kotu_kabul = 0
 
         # --- 1. KOMŞU ÇÖZÜM ÜRET (HAMLE) ---
+        if zamanlama:
+            t0 = saat()
         # Rastgele bir öğrenci seç
-        secilen_idx = np.random.choice(ogrenci_indexleri)
-        eski_firma = current_ogrenciler.at[secilen_idx, 'Yerleştiği_Firma']
+        secilen_idx = rng.integers(ogrenci_sayisi)
+        eski_firma = current.atama[secilen_idx]
 
         # Rastgele bir tercihine gitmeye çalış (1..5)
-        tercih_no = np.random.randint(1, 6)
-        col_name = f'Tercih{tercih_no}'
-
-        if col_name not in current_ogrenciler.columns: continue
-        hedef_firma = current_ogrenciler.at[secilen_idx, col_name]
+        if kumulatif is None:
+            tercih_no = rng.integers(1, tercih_sayisi + 1)
+        else:
+            tercih_no = bisect.bisect(kumulatif, rng.random()) + 1
+        hedef_firma = current.tercihler[secilen_idx, tercih_no - 1]
 
         # Boş tercih, aynı yer veya tercih yoksa pas geç
-        if pd.isna(hedef_firma) or eski_firma == hedef_firma:
+        if hedef_firma == BOS or eski_firma == hedef_firma:
             # Boşa dönmesin, soğutmayı hafiflet
+            telemetri.atlanan += 1
+            if zamanlama:
+                telemetri.uretim_suresi += saat() - t0
             continue
 
-        # Hedef firmanın verisine ulaş
-        f_rows = current_firmalar[current_firmalar['Firma'] == hedef_firma]
-        if f_rows.empty: continue
-        f_idx = f_rows.index[0]
-
         islem_tipi = None
         takas_edilen_idx = None
 
-        # A) Kontenjan Var -> MOVE
-        if current_firmalar.at[f_idx, 'Kontenjan'] > 0:
+        # A) Kontenjan Var -> MOVE (eski yerinden de düşer)
+        if current.kontenjan[hedef_firma] > 0:
             islem_tipi = "MOVE"
-            current_ogrenciler.at[secilen_idx, 'Yerleştiği_Firma'] = hedef_firma
-            current_firmalar.at[f_idx, 'Kontenjan'] -= 1
-
-            # Eski yerinden düş (Eğer bir yerde çalışıyorduysa)
-            if pd.notna(eski_firma):
-                eski_rows = current_firmalar[current_firmalar['Firma'] == eski_firma]
-                if not eski_rows.empty:
-                    current_firmalar.at[eski_rows.index[0], 'Kontenjan'] += 1
+            if zamanlama:
+                t1 = saat()
+            delta = current.tasima_deltasi(secilen_idx, hedef_firma)
+            if zamanlama:
+                t2 = saat()
+            current.tasi(secilen_idx, hedef_firma)
+            telemetri.move += 1
 
         # B) Kontenjan Yok -> SWAP (Takas)
         else:
             islem_tipi = "SWAP"
-            # O firmadaki öğrencilerden birini seç
-            ordaki_ogrenciler = current_ogrenciler[current_ogrenciler['Yerleştiği_Firma'] == hedef_firma]
-            if ordaki_ogrenciler.empty: continue
+            # O firmadaki öğrencilerden birini seç (ters indeks, O(1))
+            ordaki_ogrenciler = current.sakinler(hedef_firma)
+            if not ordaki_ogrenciler:
+                telemetri.atlanan += 1
+                if zamanlama:
+                    telemetri.uretim_suresi += saat() - t0
+                continue
 
-            takas_edilen_idx = np.random.choice(ordaki_ogrenciler.index)
+            takas_edilen_idx = ordaki_ogrenciler[rng.integers(len(ordaki_ogrenciler))]
 
             # Değiştir
-            current_ogrenciler.at[secilen_idx, 'Yerleştiği_Firma'] = hedef_firma
-            current_ogrenciler.at[takas_edilen_idx, 'Yerleştiği_Firma'] = eski_firma
+            if zamanlama:
+                t1 = saat()
+            delta = current.takas_deltasi(secilen_idx, takas_edilen_idx)
+            if zamanlama:
+                t2 = saat()
+            current.takas(secilen_idx, takas_edilen_idx)
+            telemetri.swap += 1
+
+        telemetri.onerilen += 1
+        if zamanlama:
+            # Hamle üretimi: seçimler + uygulama; skorlama: delta hesabı
+            t3 = saat()
+            telemetri.uretim_suresi += (t1 - t0) + (t3 - t2)
+            telemetri.skorlama_suresi += t2 - t1
 
         # --- 2. DEĞERLENDİRME ---
-        yeni_score = memnuniyet_skoru_hesapla(current_ogrenciler)
-        delta = yeni_score - current_score
+        # Sadece 1-2 öğrenci değişti, tüm listeyi tekrar puanlamaya gerek yok
+        yeni_score = current_score + delta
 
         kabul_edildi = False
 
@@ -125,58 +183,200 @@ def heuristic_atama(ogrenciler_df, firmalar_df, iterasyon=10000, step_callback=N
         else:
             # Delta negatifse (skor düşüyorsa)
             # Sıcaklık düşük olduğu için, büyük düşüşleri kabul etmeyecek
+            kotu_denenen += 1
             if sicaklik > 0.001:
                 olasilik = np.exp(delta / sicaklik)
-                if np.random.rand() < olasilik:
+                if rng.random() < olasilik:
                     kabul_edildi = True
+                    kotu_kabul += 1
 
         # --- 3. SONUÇ ---
         if kabul_edildi:
+            telemetri.kabul += 1
             current_score = yeni_score
             if current_score > best_score:
                 best_score = current_score
-                best_ogrenciler = current_ogrenciler.copy()
-                best_firmalar = current_firmalar.copy()
-                print(f"!!! GELİŞME VAR: {best_score} (+{best_score - 12660} puan) (Iterasyon {i})")
+                best = current.kopya()
+                son_gelisme = i
+                telemetri.gelisme += 1
         else:
+            telemetri.red += 1
             # GERİ AL (UNDO)
             if islem_tipi == "MOVE":
-                current_ogrenciler.at[secilen_idx, 'Yerleştiği_Firma'] = eski_firma
-                current_firmalar.at[f_idx, 'Kontenjan'] += 1
-                if pd.notna(eski_firma):
-                    eski_rows = current_firmalar[current_firmalar['Firma'] == eski_firma]
-                    if not eski_rows.empty:
-                        current_firmalar.at[eski_rows.index[0], 'Kontenjan'] -= 1
+                current.tasimayi_geri_al(secilen_idx, eski_firma)
 
             elif islem_tipi == "SWAP":
-                current_ogrenciler.at[secilen_idx, 'Yerleştiği_Firma'] = eski_firma
-                current_ogrenciler.at[takas_edilen_idx, 'Yerleştiği_Firma'] = hedef_firma
+                current.takas(secilen_idx, takas_edilen_idx)
+
+        # Periyodik tutarlılık kontrolü (tam hesaplama)
+        if dogrulama_araligi and i % dogrulama_araligi == 0:
+            tam_score = current.skor()
+            if tam_score != current_score:
+                raise RuntimeError(f"Artımlı skor tutarsız: {current_score} != {tam_score} (Iterasyon {i})")
 
         # Soğutma
         sicaklik *= soguma_orani
 
-        # Loglama (Sıklığı azalttım)
-        if i % 1000 == 0:
-            print(f"Iterasyon {i}: Skor {current_score}, Best {best_score}, T={sicaklik:.2f}")
-
-    print(f"--- HEURISTIC BİTTİ. Final Skor: {best_score} ---")
-
-    # --- RAPORLAMA HAZIRLIĞI ---
-    # Yerleşenleri yaz
-    best_firmalar['Yerlesenler'] = None
-    yerlesen_grup = best_ogrenciler[best_ogrenciler['Yerleştiği_Firma'].notna()].groupby('Yerleştiği_Firma')[
-        'Öğrenci'].apply(lambda x: ", ".join(str(s) for s in x))
-    best_firmalar['Yerlesenler'] = best_firmalar['Firma'].map(yerlesen_grup).fillna("-")
-
-    # Sıralamayı güncelle
-    best_ogrenciler['Tercih_Sırası'] = "-"
-    for idx, row in best_ogrenciler.iterrows():
-        firma = row['Yerleştiği_Firma']
-        if pd.notna(firma):
-            for k in range(1, 6):
-                col = f'Tercih{k}'
-                if col in row and row[col] == firma:
-                    best_ogrenciler.at[idx, 'Tercih_Sırası'] = k
-                    break
-
-    return best_ogrenciler, best_firmalar
\ No newline at end of file
+    telemetri.bitir()
+    telemetri.son_iterasyon = yapilan
+    if yazdir:
+        print(f"--- HEURISTIC BİTTİ ({durma_nedeni}). Final Skor: {best_score} "
+              f"(+{best_score - baslangic_skoru} puan, {telemetri.gelisme} gelişme) ---")
+
+    rapor = {
+        "Durma_Nedeni": durma_nedeni,
+        "Iterasyon": yapilan,
+        "Yeniden_Isitma": isitma_sayisi,
+        "Son_Sicaklik": sicaklik,
+        "Baslangic_Skoru": baslangic_skoru,
+        "Final_Skor": best_score,
+        "Telemetri": telemetri.ozet(),
+    }
+    return best, best_score, rapor
+
+
+def heuristic_atama(ogrenciler_df, firmalar_df, iterasyon=10000, step_callback=None, dogrulama_araligi=None,
+                    seed=None, uyarlamali=False, yeniden_isitma=None, durgunluk_limiti=None, rapor_dondur=False,
+                    telemetri=None, sicaklik=150, soguma_orani=0.99, tercih_egilimi=1.0):
+    """
+    Simulated Annealing - Hassas Ayar Modu (Greedy üzerine iyileştirme)
+
+    Hamlelerin skoru sadece etkilenen öğrencilerin tercih sırasından (delta) hesaplanır.
+    dogrulama_araligi verilirse o kadar iterasyonda bir tam skor hesaplanıp
+    artımlı skorla karşılaştırılır (tutarlılık kontrolü).
+    Uyarlamalı soğutma / yeniden ısıtma / erken durma ayarları tavlama() ile aynıdır;
+    rapor_dondur=True ise (ogrenciler, firmalar, rapor) döner, rapor durma nedenini ve
+    telemetri özetini (rapor['Telemetri']) içerir. Canlı takip için callback'li bir
+    Telemetri nesnesi verilebilir; step_callback eskisi gibi sadece iterasyon numarasını alır.
+
+    sicaklik / soguma_orani / tercih_egilimi varsayılanları 150 öğrencilik veri için el ile
+    seçilmiştir; kayıt (cozucu_kayit) üzerinden çalıştırıldığında veri profili için
+    tavlama_ayari ile ayarlanmış değerler varsa onlar verilir.
+    """
+    # 1. Verileri Güvenli Kopyala
+    ogrenciler = ogrenciler_df.copy().reset_index(drop=True)
+    firmalar = firmalar_df.copy().reset_index(drop=True)
+
+    # Döngü DataFrame yerine dizi tabanlı durum üzerinde çalışır
+    current = AtamaDurumu.dataframe_den(ogrenciler, firmalar)
+
+    # Başlangıç sıcaklığı düşük (150): eldeki güzel çözümü bozmadan ufak iyileştirmeler arar
+    best, _, rapor = tavlama(current, iterasyon, rng=np.random.default_rng(seed), step_callback=step_callback,
+                             dogrulama_araligi=dogrulama_araligi, sicaklik=sicaklik, soguma_orani=soguma_orani,
+                             uyarlamali=uyarlamali, yeniden_isitma=yeniden_isitma,
+                             durgunluk_limiti=durgunluk_limiti, telemetri=telemetri, tercih_egilimi=tercih_egilimi)
+
+    best_ogrenciler, best_firmalar = best.sonuclari_yaz(ogrenciler, firmalar)
+    if rapor_dondur:
+        return best_ogrenciler, best_firmalar, rapor
+    return best_ogrenciler, best_firmalar
+
+
+def tavlama_durumu(durum, iterasyon=10000, seed=None, **ayarlar):
+    """
+    heuristic_atama'nın DataFrame'siz hali: durum (AtamaDurumu) üzerinde tavlama yapar ve en iyi
+    durumu döndürür (ayrı süreçte sadece diziler geri gönderilir). ayarlar tavlama()'ya aynen geçer.
+    """
+    best, _, _ = tavlama(durum, iterasyon, rng=np.random.default_rng(seed), **ayarlar)
+    return best
+
+
+# --- ÇOKLU BAŞLANGIÇ (PARALEL) ---
+BASLANGIC_TIPLERI = ("greedy", "rastgele", "bozulmus_greedy", "mevcut")
+
+
+def _baslangic_atamasi(durum, baslangic, rng, gno=None, bozma_orani=0.1):
+    """Zincirin başlangıç atamasını üretir; durum.kontenjan kalan kontenjan olarak güncellenir."""
+    from algo_greedy import gno_sirasi, greedy_yerlestir
+
+    if baslangic not in BASLANGIC_TIPLERI:
+        raise ValueError(f"Bilinmeyen başlangıç tipi: {baslangic} ({', '.join(BASLANGIC_TIPLERI)})")
+    if baslangic == "mevcut":
+        return durum
+
+    # Mevcut yerleşenlerin tuttuğu kontenjanlar geri verilir
+    yerlesen = durum.atama != BOS
+    toplam_kontenjan = durum.kontenjan + np.bincount(durum.atama[yerlesen], minlength=durum.firma_sayisi)
+
+    if baslangic == "rastgele":
+        # Rastgele sırayla gelen öğrenci, tercihlerinden rastgele birine (kontenjan varsa) yerleşir
+        karisik_tercihler = rng.permuted(durum.tercihler, axis=1)
+        sira = rng.permutation(durum.ogrenci_sayisi)
+        durum.atama, _, durum.kontenjan = greedy_yerlestir(karisik_tercihler, toplam_kontenjan, sira)
+        return durum
+
+    sira = gno_sirasi(gno) if gno is not None else np.arange(durum.ogrenci_sayisi)
+    durum.atama, _, durum.kontenjan = greedy_yerlestir(durum.tercihler, toplam_kontenjan, sira)
+
+    if baslangic == "bozulmus_greedy":
+        # Greedy çözümünden rastgele öğrencileri çıkarıp rastgele sırayla tekrar yerleştir
+        bozulan = rng.choice(durum.ogrenci_sayisi, size=int(durum.ogrenci_sayisi * bozma_orani), replace=False)
+        bozulan = bozulan[durum.atama[bozulan] != BOS]
+        np.add.at(durum.kontenjan, durum.atama[bozulan], 1)
+        durum.atama[bozulan] = BOS
+
+        yeni_atama, _, durum.kontenjan = greedy_yerlestir(
+            rng.permuted(durum.tercihler[bozulan], axis=1), durum.kontenjan, rng.permutation(bozulan.size))
+        durum.atama[bozulan] = yeni_atama
+    return durum
+
+
+def _zincir_calistir(durum, iterasyon, seed_seq, sicaklik, soguma_orani):
+    """Süreç havuzunda çalışan tek zincir (modül seviyesinde olmalı ki pickle edilebilsin)."""
+    baslangic_skoru = durum.skor()
+    best, best_score, _ = tavlama(durum, iterasyon, rng=np.random.default_rng(seed_seq),
+                                  sicaklik=sicaklik, soguma_orani=soguma_orani, yazdir=False)
+    return best.atama, best.kontenjan, best_score, baslangic_skoru
+
+
+def coklu_baslangic_atama(ogrenciler_df, firmalar_df, zincir_sayisi=None, iterasyon=10000, baslangic="greedy",
+                          seed=None, max_workers=None, bozma_orani=0.1, sicaklik=150, soguma_orani=0.99):
+    """
+    Çoklu başlangıçlı (multi-start) Simulated Annealing.
+
+    zincir_sayisi kadar bağımsız zincir süreç havuzunda paralel çalışır. Her zincir
+    SeedSequence'tan türetilmiş kendi üretecini kullanır; başlangıç 'greedy',
+    'rastgele', 'bozulmus_greedy' veya 'mevcut' (girdideki atama) olabilir.
+    (ogrenciler, firmalar, istatistik) döndürür; istatistik zincir skorlarını içerir.
+    """
+    ogrenciler = ogrenciler_df.copy().reset_index(drop=True)
+    firmalar = firmalar_df.copy().reset_index(drop=True)
+
+    durum = AtamaDurumu.dataframe_den(ogrenciler, firmalar)
+    zincir_sayisi = zincir_sayisi or os.cpu_count() or 1
+    gno = ogrenciler['GNO'].to_numpy() if 'GNO' in ogrenciler.columns else None
+
+    # Her zincire iki bağımsız akış: biri başlangıç, biri tavlama için
+    zincir_seedleri = [ss.spawn(2) for ss in np.random.SeedSequence(seed).spawn(zincir_sayisi)]
+    baslangiclar = [
+        _baslangic_atamasi(durum.kopya(), baslangic, np.random.default_rng(bas_ss), gno, bozma_orani)
+        for bas_ss, _ in zincir_seedleri
+    ]
+
+    isler = [(bas, iterasyon, tav_ss, sicaklik, soguma_orani)
+             for bas, (_, tav_ss) in zip(baslangiclar, zincir_seedleri)]
+    if zincir_sayisi == 1 or max_workers == 1:
+        sonuclar = [_zincir_calistir(*is_) for is_ in isler]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as havuz:
+            sonuclar = list(havuz.map(_zincir_calistir, *zip(*isler)))
+
+    skorlar = np.array([s[2] for s in sonuclar])
+    en_iyi = int(skorlar.argmax())
+    best = durum.kopya()
+    best.atama, best.kontenjan = sonuclar[en_iyi][0], sonuclar[en_iyi][1]
+
+    istatistik = {
+        "Zincir_Sayisi": zincir_sayisi,
+        "Baslangic": baslangic,
+        "Skorlar": skorlar.tolist(),
+        "Baslangic_Skorlari": [s[3] for s in sonuclar],
+        "En_Iyi_Zincir": en_iyi,
+        "En_Iyi": int(skorlar.max()),
+        "En_Kotu": int(skorlar.min()),
+        "Ortalama": float(skorlar.mean()),
+        "Std": float(skorlar.std()),
+    }
+
+    best_ogrenciler, best_firmalar = best.sonuclari_yaz(ogrenciler, firmalar)
+    return best_ogrenciler, best_firmalar, istatistik
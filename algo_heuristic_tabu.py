@@ -0,0 +1,108 @@
+import numpy as np
+
+from atama_durumu import AtamaDurumu, BOS
+
+
+def _aday_hamleler(durum, rng, aday_sayisi):
+    """
+    Annealing ile aynı komşuluktan rastgele hamleler üretir (rastgele sayılar tek seferde çekilir).
+    ("MOVE", öğrenci, hedef firma, delta) veya ("SWAP", öğrenci, takas öğrencisi, delta) döndürür.
+    """
+    ogrenciler = rng.integers(durum.ogrenci_sayisi, size=aday_sayisi)
+    hedefler = durum.tercihler[ogrenciler, rng.integers(durum.tercihler.shape[1], size=aday_sayisi)]
+    secimler = rng.random(aday_sayisi)
+
+    for secilen_idx, hedef_firma, u in zip(ogrenciler.tolist(), hedefler.tolist(), secimler.tolist()):
+        if hedef_firma == BOS or durum.atama[secilen_idx] == hedef_firma:
+            continue
+
+        # Kontenjan Var -> MOVE
+        if durum.kontenjan[hedef_firma] > 0:
+            yield "MOVE", secilen_idx, hedef_firma, durum.tasima_deltasi(secilen_idx, hedef_firma)
+            continue
+
+        # Kontenjan Yok -> SWAP
+        ordaki_ogrenciler = durum.sakinler(hedef_firma)
+        if ordaki_ogrenciler:
+            takas_idx = ordaki_ogrenciler[int(u * len(ordaki_ogrenciler))]
+            yield "SWAP", secilen_idx, takas_idx, durum.takas_deltasi(secilen_idx, takas_idx)
+
+
+def tabu_arama(current, iterasyon=1000, step_callback=None, aday_sayisi=200, tabu_suresi=None, seed=None,
+               telemetri=None):
+    """
+    Tabu Search - MOVE/SWAP komşuluğu üzerinde, dizi tabanlı durumla (AtamaDurumu).
+    current yerinde değişir; en iyi durum DataFrame'e yazılmadan döndürülür.
+
+    Her adımda 'aday_sayisi' kadar rastgele hamle delta skorla değerlendirilir ve
+    tabu olmayan en iyisi (skoru düşürse bile) uygulanır. Son 'tabu_suresi' iterasyonda
+    yer değiştirmiş öğrenciler tabudur; hamle yeni bir en iyi skor getiriyorsa tabu
+    yok sayılır (aspiration).
+    telemetri (Telemetri) verilirse mevcut / en iyi skor izi tutulur ve callback'leri çağrılır.
+    """
+    rng = np.random.default_rng(seed)
+    current_score = current.skor()
+    best = current.kopya()
+    best_score = current_score
+
+    if tabu_suresi is None:
+        # Kısa tabu listesi bu komşulukta daha iyi sonuç veriyor (150 öğrenci -> 4 iterasyon)
+        tabu_suresi = max(3, int(np.sqrt(current.ogrenci_sayisi)) // 3)
+    # Öğrencinin tekrar hareket edebileceği ilk iterasyon
+    tabu_bitis = np.zeros(current.ogrenci_sayisi, dtype=np.int64)
+
+    if telemetri is not None:
+        telemetri.baslat(current_score)
+    for i in range(iterasyon):
+        if step_callback and i % 50 == 0:
+            step_callback(i)
+        if telemetri is not None and i % telemetri.adim_araligi == 0:
+            telemetri.adim(i, current_score, best_score, 0.0)
+
+        # --- ADAY LİSTESİ ---
+        secilen = None
+        for hamle in _aday_hamleler(current, rng, aday_sayisi):
+            islem_tipi, ogrenci, hedef, delta = hamle
+
+            tabu = tabu_bitis[ogrenci] > i or (islem_tipi == "SWAP" and tabu_bitis[hedef] > i)
+            # Aspiration: yeni en iyi skoru getiren hamle tabu olsa da kabul edilir
+            if tabu and current_score + delta <= best_score:
+                continue
+            if secilen is None or delta > secilen[3]:
+                secilen = hamle
+
+        if secilen is None:
+            continue
+
+        # --- EN İYİ ADAYI UYGULA ---
+        islem_tipi, ogrenci, hedef, delta = secilen
+        if islem_tipi == "MOVE":
+            current.tasi(ogrenci, hedef)
+        else:
+            current.takas(ogrenci, hedef)
+            tabu_bitis[hedef] = i + tabu_suresi
+        tabu_bitis[ogrenci] = i + tabu_suresi
+        current_score += delta
+
+        if current_score > best_score:
+            best_score = current_score
+            best = current.kopya()
+
+    if telemetri is not None:
+        telemetri.bitir()
+        telemetri.son_iterasyon = iterasyon
+    return best
+
+
+def heuristic_atama(ogrenciler_df, firmalar_df, iterasyon=1000, step_callback=None, aday_sayisi=200,
+                    tabu_suresi=None, seed=None, telemetri=None):
+    """Tabu Search (tabu_arama) - Greedy ile aynı girdi/çıktı şeklini kullanır."""
+    best_ogrenciler = ogrenciler_df.copy().reset_index(drop=True)
+    best_firmalar = firmalar_df.copy().reset_index(drop=True)
+
+    best = tabu_arama(AtamaDurumu.dataframe_den(best_ogrenciler, best_firmalar), iterasyon, step_callback,
+                      aday_sayisi, tabu_suresi, seed, telemetri)
+
+    # --- FİNAL GÜNCELLEMELERİ ---
+    # Yerlesenler ve Tercih_Sırası en iyi atamadan yeniden hesaplanır
+    return best.sonuclari_yaz(best_ogrenciler, best_firmalar)
@@ -0,0 +1,211 @@
+import heapq
+
+import numpy as np
+
+from atama_durumu import AtamaDurumu, BOS
+from skorlama import PUANLAR
+
+SONSUZ = float('inf')
+
+
+class _AkisAgi:
+    """
+    Min-cost flow için artık (residual) ağ.
+    Kenarlar paralel listelerde tutulur; e kenarının tersi e ^ 1'dir.
+    """
+
+    def __init__(self, dugum_sayisi):
+        self.komsular = [[] for _ in range(dugum_sayisi)]
+        self.hedef = []
+        self.kapasite = []
+        self.maliyet = []
+
+    def kenar_ekle(self, u, v, kapasite, maliyet):
+        self.komsular[u].append(len(self.hedef))
+        self.hedef.append(v)
+        self.kapasite.append(kapasite)
+        self.maliyet.append(maliyet)
+
+        self.komsular[v].append(len(self.hedef))
+        self.hedef.append(u)
+        self.kapasite.append(0)
+        self.maliyet.append(-maliyet)
+
+    def _dijkstra(self, kaynak, hedef_dugum, potansiyel):
+        """
+        İndirgenmiş maliyetlerle (hepsi >= 0) en kısa yollar.
+        Hedef kuyruktan çıkınca durur: kalan düğümlerin mesafesi zaten hedefinkinden küçük olamaz.
+        """
+        komsular, hedef, kapasite, maliyet = self.komsular, self.hedef, self.kapasite, self.maliyet
+        mesafe = [SONSUZ] * len(komsular)
+        mesafe[kaynak] = 0
+        kuyruk = [(0, kaynak)]
+        while kuyruk:
+            d, u = heapq.heappop(kuyruk)
+            if d > mesafe[u]:
+                continue
+            if u == hedef_dugum:
+                break
+            du = d + potansiyel[u]
+            for e in komsular[u]:
+                if kapasite[e] > 0:
+                    v = hedef[e]
+                    nd = du + maliyet[e] - potansiyel[v]
+                    if nd < mesafe[v]:
+                        mesafe[v] = nd
+                        heapq.heappush(kuyruk, (nd, v))
+        return mesafe
+
+    def _seviyeler(self, kaynak, potansiyel):
+        """
+        Uygun kenarlar (kapasitesi olan ve indirgenmiş maliyeti 0, yani en kısa yol üzerindeki)
+        üzerinden BFS seviyeleri.
+        """
+        komsular, hedef, kapasite, maliyet = self.komsular, self.hedef, self.kapasite, self.maliyet
+        seviye = [-1] * len(komsular)
+        seviye[kaynak] = 0
+        sira = [kaynak]
+        for u in sira:
+            pu = potansiyel[u]
+            su = seviye[u] + 1
+            for e in komsular[u]:
+                v = hedef[e]
+                if seviye[v] < 0 and kapasite[e] > 0 and maliyet[e] + pu == potansiyel[v]:
+                    seviye[v] = su
+                    sira.append(v)
+        return seviye
+
+    def _engelleyici_akis(self, kaynak, hedef_dugum, potansiyel, seviye):
+        """Seviye grafında (Dinic) birim akışları iteratif DFS ile gönderir."""
+        komsular, hedef, kapasite, maliyet = self.komsular, self.hedef, self.kapasite, self.maliyet
+        siradaki = [0] * len(komsular)
+        gonderilen = 0
+        yigin = [kaynak]
+        yol = []
+        while yigin:
+            u = yigin[-1]
+            if u == hedef_dugum:
+                for e in yol:
+                    kapasite[e] -= 1
+                    kapasite[e ^ 1] += 1
+                gonderilen += 1
+                yigin = [kaynak]
+                yol = []
+                continue
+
+            ilerledi = False
+            kenarlar = komsular[u]
+            su = seviye[u] + 1
+            pu = potansiyel[u]
+            while siradaki[u] < len(kenarlar):
+                e = kenarlar[siradaki[u]]
+                v = hedef[e]
+                if seviye[v] == su and kapasite[e] > 0 and maliyet[e] + pu == potansiyel[v]:
+                    yigin.append(v)
+                    yol.append(e)
+                    ilerledi = True
+                    break
+                siradaki[u] += 1
+
+            if not ilerledi:
+                # Çıkmaz düğüm: bu fazda bir daha uğranmaz
+                seviye[u] = -1
+                yigin.pop()
+                if yol:
+                    yol.pop()
+                    siradaki[yigin[-1]] += 1
+        return gonderilen
+
+    def min_maliyetli_akis(self, kaynak, hedef_dugum, potansiyel):
+        """
+        Primal-dual min-cost flow: yol maliyeti negatif olduğu sürece
+        (skoru artırdığı sürece) en kısa yollar boyunca akış gönderir.
+        """
+        while True:
+            mesafe = self._dijkstra(kaynak, hedef_dugum, potansiyel)
+            if mesafe[hedef_dugum] == SONSUZ:
+                break
+            ust_sinir = mesafe[hedef_dugum]
+            for v, d in enumerate(mesafe):
+                potansiyel[v] += min(d, ust_sinir)
+
+            # Gerçek yol maliyeti >= 0 ise akış göndermek skoru artırmaz
+            if potansiyel[hedef_dugum] - potansiyel[kaynak] >= 0:
+                break
+
+            seviye = self._seviyeler(kaynak, potansiyel)
+            if self._engelleyici_akis(kaynak, hedef_dugum, potansiyel, seviye) == 0:
+                break
+
+
+def optimal_yerlestir(tercihler, kontenjan, puanlar=PUANLAR):
+    """
+    Toplam memnuniyet puanını en büyükleyen atamayı bulur (kesin çözüm).
+
+    Problem min-cost flow olarak kurulur:
+    kaynak -> öğrenci (kapasite 1) -> tercih ettiği firma (maliyet -puan) -> havuz (kapasite = kontenjan).
+    Polinom zamanlıdır; atama dizisini (int32, yerleşmeyen -1) döndürür.
+    """
+    tercihler = np.asarray(tercihler)
+    kontenjan = np.asarray(kontenjan)
+    ogrenci_sayisi, firma_sayisi = tercihler.shape[0], kontenjan.shape[0]
+
+    kaynak = 0
+    havuz = ogrenci_sayisi + firma_sayisi + 1
+    ag = _AkisAgi(ogrenci_sayisi + firma_sayisi + 2)
+    potansiyel = [0] * (ogrenci_sayisi + firma_sayisi + 2)
+
+    for ogrenci, satir in enumerate(tercihler.tolist()):
+        gorulen = set()
+        for sira, firma in enumerate(satir[:len(puanlar)]):
+            if firma == BOS or firma in gorulen or kontenjan[firma] <= 0:
+                continue
+            gorulen.add(firma)
+            if not ag.komsular[ogrenci + 1]:
+                ag.kenar_ekle(kaynak, ogrenci + 1, 1, 0)
+            firma_dugumu = ogrenci_sayisi + 1 + firma
+            ag.kenar_ekle(ogrenci + 1, firma_dugumu, 1, -int(puanlar[sira]))
+            # Başlangıç potansiyeli: DAG üzerinde en kısa mesafe (indirgenmiş maliyetler >= 0)
+            potansiyel[firma_dugumu] = min(potansiyel[firma_dugumu], -int(puanlar[sira]))
+
+    for firma in range(firma_sayisi):
+        if kontenjan[firma] > 0:
+            firma_dugumu = ogrenci_sayisi + 1 + firma
+            ag.kenar_ekle(firma_dugumu, havuz, int(kontenjan[firma]), 0)
+            potansiyel[havuz] = min(potansiyel[havuz], potansiyel[firma_dugumu])
+
+    ag.min_maliyetli_akis(kaynak, havuz, potansiyel)
+
+    # Akış geçen öğrenci -> firma kenarları atamayı verir
+    atama = np.full(ogrenci_sayisi, BOS, dtype=np.int32)
+    for ogrenci in range(ogrenci_sayisi):
+        for e in ag.komsular[ogrenci + 1]:
+            v = ag.hedef[e]
+            if e % 2 == 0 and v > ogrenci_sayisi and ag.kapasite[e] == 0:
+                atama[ogrenci] = v - ogrenci_sayisi - 1
+                break
+    return atama
+
+
+def optimal_atama(ogrenciler_df, firmalar_df):
+    """
+    Kesin (optimal) yerleştirme. Greedy ile aynı girdi/çıktı şeklini kullanır,
+    heuristic sonuçlarının optimumdan ne kadar uzak olduğunu görmek için referanstır.
+    Orta büyüklükteki veri setleri (on binlerce öğrenciye kadar) için uygundur.
+    """
+    ogrenciler = ogrenciler_df.copy().reset_index(drop=True)
+    firmalar = firmalar_df.copy().reset_index(drop=True)
+
+    # Girdi başka bir algoritmanın sonucu olabilir: mevcut yerleşenlerin
+    # tuttuğu kontenjanlar geri verilir, problem toplam kontenjan üzerinden çözülür
+    durum = AtamaDurumu.dataframe_den(ogrenciler, firmalar)
+    yerlesen = durum.atama != BOS
+    durum.kontenjan += np.bincount(durum.atama[yerlesen], minlength=durum.firma_sayisi)
+    durum.atama[:] = BOS
+
+    for ogrenci, firma in enumerate(optimal_yerlestir(durum.tercihler, durum.kontenjan)):
+        if firma != BOS:
+            durum.tasi(ogrenci, firma)
+
+    # Yerleştiği_Firma, Tercih_Sırası ve firmalara Yerlesenler (ortak son işlem)
+    return durum.sonuclari_yaz(ogrenciler, firmalar)
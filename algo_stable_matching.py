@@ -0,0 +1,173 @@
+import heapq
+
+import numpy as np
+
+from atama_durumu import AtamaDurumu, BOS
+from algo_greedy import gno_sirasi
+
+
+def gno_onceligi(ogrenciler_df, firmalar_df=None):
+    """
+    Varsayılan firma önceliği: tüm firmalar öğrencileri GNO'ya göre sıralar.
+    Greedy ile aynı sıra (eşit GNO'da DataFrame sırası, GNO'su boş olanlar en sonda) kullanılır.
+    """
+    gno = ogrenciler_df['GNO'].to_numpy()
+    puan = np.empty(len(gno), dtype=np.int64)
+    puan[gno_sirasi(gno)] = np.arange(len(gno), 0, -1)
+    return puan
+
+
+def oncelik_puanlari(oncelik, ogrenciler_df, firmalar_df, tercih_sayisi):
+    """
+    Öncelik tanımını tamsayı puanlara çevirir (büyük puan = firma için daha öncelikli).
+
+    oncelik:
+      None           -> GNO (gno_onceligi)
+      sütun adı      -> öğrenciler DataFrame'indeki sayısal sütun (büyük olan öncelikli)
+      dizi           -> (N,) tüm firmalar için ortak puan veya (N x k) öğrencinin k. tercihi
+                        olan firmadaki puanı (firmaya özel öncelik)
+      fonksiyon      -> fonksiyon(ogrenciler_df, firmalar_df) yukarıdaki dizilerden birini döndürür
+
+    Puanlar (N,) veya (N x k) int64 olarak döner ve aynı firmaya başvuranlar arasında
+    eşitlik kalmaz (eşit puanda DataFrame'de önce gelen öncelikli, boş değerler en sonda).
+    """
+    if oncelik is None:
+        return gno_onceligi(ogrenciler_df, firmalar_df)
+    if callable(oncelik):
+        oncelik = oncelik(ogrenciler_df, firmalar_df)
+    elif isinstance(oncelik, str):
+        if oncelik not in ogrenciler_df.columns:
+            raise ValueError(f"Öncelik sütunu bulunamadı: {oncelik}")
+        oncelik = ogrenciler_df[oncelik].to_numpy()
+
+    deger = np.asarray(oncelik, dtype=float)
+    ogrenci_sayisi = len(ogrenciler_df)
+    if deger.shape not in ((ogrenci_sayisi,), (ogrenci_sayisi, tercih_sayisi)):
+        raise ValueError(f"Öncelik (N,) veya (N x {tercih_sayisi}) boyutunda olmalı, {deger.shape} verildi")
+
+    # Büyükten küçüğe sıra; eşitlikte öğrenci sırası, NaN en sonda
+    ogrenci_no = np.broadcast_to(np.arange(ogrenci_sayisi).reshape((-1,) + (1,) * (deger.ndim - 1)), deger.shape)
+    sira = np.lexsort((ogrenci_no.ravel(), np.isnan(deger.ravel()), -np.nan_to_num(deger.ravel())))
+    puan = np.empty(deger.size, dtype=np.int64)
+    puan[sira] = np.arange(deger.size, 0, -1)
+    return puan.reshape(deger.shape)
+
+
+def ertelenmis_kabul(tercihler, kontenjan, oncelik):
+    """
+    Öğrenci öneren ertelenmiş kabul (Gale-Shapley) motoru.
+    tercihler: (N x k) firma id matrisi, kontenjan: firma id -> kontenjan,
+    oncelik: (N,) veya (N x k) tamsayı puanlar (büyük = öncelikli, firma içinde tekil).
+
+    Boştaki her öğrenci listesinde sıradaki firmaya başvurur. Her firma geçici olarak kabul
+    ettiklerini bir min-heap'te tutar: heap'in tepesi en zayıf öğrencidir. Firma doluysa ve
+    başvuran tepedekinden öncelikliyse tepedeki reddedilir ve yeniden boşa düşer.
+    Her öğrenci en fazla k başvuru yapar: toplam O(N·k·log kontenjan).
+    Sonuç öğrenciler için en iyi kararlı eşleşmedir (başvuru sırasından bağımsız).
+    (atama, kalan_kontenjan) döndürür.
+    """
+    tercihler = np.asarray(tercihler)
+    oncelik = np.asarray(oncelik, dtype=np.int64)
+    ogrenci_sayisi, tercih_sayisi = tercihler.shape
+    tek_puan = oncelik.ndim == 1
+
+    # Heap'te (puan, öğrenci) yerine tek tamsayı anahtar: puan * N + öğrenci (karşılaştırma daha hızlı)
+    anahtar = oncelik * ogrenci_sayisi + np.arange(ogrenci_sayisi).reshape((-1,) + (1,) * (oncelik.ndim - 1))
+
+    # Python listeleri döngü içinde NumPy skalerlerinden çok daha hızlı
+    tercih_listesi = tercihler.tolist()
+    anahtar_listesi = anahtar.tolist()
+    kapasite = np.asarray(kontenjan).tolist()
+
+    atama = [BOS] * ogrenci_sayisi
+    sonraki = [0] * ogrenci_sayisi  # öğrencinin sıradaki başvuracağı tercih
+    # firma -> geçici kabul edilenlerin anahtarları; firma dolana kadar düz liste,
+    # dolunca min-heap'e çevrilir (tepede en zayıf). Doluyken sadece heapreplace yapılır.
+    tutulan = [[] for _ in kapasite]
+    heapify, heapreplace = heapq.heapify, heapq.heapreplace
+
+    # Sonuç başvuru sırasından bağımsızdır; öncelikliler önce başvurursa daha az red olur
+    # (ortak öncelikte hiç red olmaz). pop() sondan aldığı için küçükten büyüğe dizilir.
+    bostakiler = np.argsort(oncelik if tek_puan else oncelik[:, 0], kind="stable").tolist()
+    while bostakiler:
+        ogrenci = bostakiler.pop()
+        tercihler_i = tercih_listesi[ogrenci]
+        anahtar_i = k = anahtar_listesi[ogrenci]
+        for j in range(sonraki[ogrenci], tercih_sayisi):
+            firma = tercihler_i[j]
+            if firma < 0:
+                continue
+            if not tek_puan:
+                k = anahtar_i[j]
+            heap = tutulan[firma]
+            if len(heap) < kapasite[firma]:
+                heap.append(k)
+                if len(heap) == kapasite[firma]:
+                    heapify(heap)
+            elif heap and heap[0] < k:
+                # En zayıf geçici kabul reddedilir, listesinde sıradaki tercihle devam eder
+                reddedilen = heapreplace(heap, k) % ogrenci_sayisi
+                atama[reddedilen] = BOS
+                bostakiler.append(reddedilen)
+            else:
+                continue
+            atama[ogrenci] = firma
+            sonraki[ogrenci] = j + 1
+            break
+
+    atama = np.array(atama, dtype=np.int32)
+    kalan = np.asarray(kontenjan, dtype=np.int64) - np.bincount(atama[atama != BOS], minlength=len(kapasite))
+    return atama, kalan
+
+
+def kararsiz_cift_sayisi(tercihler, kontenjan, atama, oncelik):
+    """
+    Eşleşmeyi bozan (blocking) öğrenci-firma çiftlerinin sayısı (0 ise eşleşme kararlıdır).
+    Öğrenci, yerleştiğinden daha çok istediği bir firmayla çift oluşturur: firmada boş
+    kontenjan varsa veya firma öğrenciyi oradaki en zayıf yerleşenden öncelikli görüyorsa.
+    kontenjan kalan kontenjandır (AtamaDurumu.kontenjan). Tamamen vektörel.
+    """
+    tercihler = np.asarray(tercihler)
+    atama = np.asarray(atama)
+    ogrenci_sayisi, tercih_sayisi = tercihler.shape
+    puan = np.broadcast_to(np.asarray(oncelik).reshape(ogrenci_sayisi, -1), tercihler.shape)
+
+    # Öğrencinin yerleştiği tercih (yoksa / tercih dışıysa k: tüm tercihleri daha iyi)
+    eslesme = (tercihler == atama[:, None]) & (atama != BOS)[:, None]
+    yerlesilen = np.where(eslesme.any(axis=1), eslesme.argmax(axis=1), tercih_sayisi)
+
+    # Firmadaki en zayıf yerleşenin puanı (tercih dışı yerleşenler en zayıf sayılır)
+    yerlesen_puani = np.full(ogrenci_sayisi, np.iinfo(np.int64).min, dtype=np.int64)
+    eslesen = yerlesilen < tercih_sayisi
+    yerlesen_puani[eslesen] = puan[np.flatnonzero(eslesen), yerlesilen[eslesen]]
+    en_zayif = np.full(len(kontenjan), np.iinfo(np.int64).max, dtype=np.int64)
+    yerlesen = atama != BOS
+    np.minimum.at(en_zayif, atama[yerlesen], yerlesen_puani[yerlesen])
+
+    daha_iyi = (np.arange(tercih_sayisi)[None, :] < yerlesilen[:, None]) & (tercihler != BOS)
+    firma = np.where(daha_iyi, tercihler, 0)
+    bozan = daha_iyi & ((np.asarray(kontenjan)[firma] > 0) | (puan > en_zayif[firma]))
+    return int(bozan.sum())
+
+
+def stabil_atama(ogrenciler_df, firmalar_df, oncelik=None):
+    """
+    Kararlı eşleşme (öğrenci öneren ertelenmiş kabul). Greedy ile aynı girdi/çıktı şeklini kullanır.
+
+    Greedy (GNO sırasıyla seri diktatörlük) tüm firmaların aynı GNO önceliğini kullandığı
+    özel durumdur; varsayılan öncelikle iki sonuç aynıdır. Firmaya özel öncelik (oncelik
+    parametresi, bkz. oncelik_puanlari) verildiğinde sonuç farklılaşır ama yine kararlıdır.
+    """
+    ogrenciler = ogrenciler_df.copy().reset_index(drop=True)
+    firmalar = firmalar_df.copy().reset_index(drop=True)
+
+    # Girdi başka bir algoritmanın sonucu olabilir: tutulan kontenjanlar geri verilir
+    durum = AtamaDurumu.dataframe_den(ogrenciler, firmalar)
+    yerlesen = durum.atama != BOS
+    durum.kontenjan += np.bincount(durum.atama[yerlesen], minlength=durum.firma_sayisi)
+
+    puanlar = oncelik_puanlari(oncelik, ogrenciler, firmalar, durum.tercihler.shape[1])
+    durum.atama, durum.kontenjan = ertelenmis_kabul(durum.tercihler, durum.kontenjan, puanlar)
+
+    # Yerleştiği_Firma, Tercih_Sırası ve firmalara Yerlesenler (ortak son işlem)
+    return durum.sonuclari_yaz(ogrenciler, firmalar)
@@ -1,8 +1,9 @@
 import streamlit as st
 import pandas as pd
-import time
-import numpy as np
-import matplotlib.pyplot as plt
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # --- SAYFA AYARLARI ---
 st.set_page_config(page_title="Stajyer Simülatörü", layout="wide", page_icon="🎓")
@@ -28,9 +29,11 @@ st.title("🎓 Stajyer Yerleştirme Simülasyonu")
 # --- MODÜLLERİ YÜKLE ---
 try:
     import veri_olustur
-    import algo_greedy
-    import algo_heuristic_hill_climbing
-    import algo_heuristic_annealing
+    import veri_formati
+    import skorlama
+    import arka_plan
+    # Çözücüler kayıttan listelenir; modülleri ilk çalıştırmada yüklenir
+    import cozucu_kayit
 except ImportError as e:
     st.error(f"⚠️ Kritik Hata: Modüller bulunamadı! ({e})")
     st.stop()
@@ -40,37 +43,161 @@ if 'ogrenciler' not in st.session_state: st.session_state['ogrenciler'] = pd.Dat
 if 'firmalar' not in st.session_state: st.session_state['firmalar'] = pd.DataFrame()
 if 'analiz_sonuclari' not in st.session_state: st.session_state['analiz_sonuclari'] = {}
 
-# --- YARDIMCI FONKSİYONLAR ---
-def puan_hesapla(df):
-    """Masaüstü uygulamasıyla aynı puanlama mantığı"""
-    if df.empty or 'Yerleştiği_Firma' not in df.columns: return 0
-    puan_tablosu = {1: 100, 2: 85, 3: 70, 4: 50, 5: 30}
-    toplam = 0
-    for _, row in df[df['Yerleştiği_Firma'].notna()].iterrows():
-        yf = row['Yerleştiği_Firma']
-        for i in range(1, 6):
-            if f'Tercih{i}' in row and row[f'Tercih{i}'] == yf:
-                toplam += puan_tablosu.get(i, 10)
-                break
-    return toplam
-
-def dinamik_fonksiyon_bul(modul, anahtar_kelimeler):
+# --- ÖNBELLEK ---
+# Paylaşılan sunucuda aynı ayarlarla tekrar tekrar basılan butonlar yeniden hesaplanmaz.
+# Her iki önbellek de en fazla bu kadar kayıt tutar (en eski / en az kullanılan atılır).
+ONBELLEK_BOYUTU = 32
+
+
+@st.cache_data(max_entries=ONBELLEK_BOYUTU, show_spinner="Veri oluşturuluyor...")
+def veri_uret(ogr_sayisi, firma_sayisi, seed):
+    """(öğrenci sayısı, firma sayısı, seed) -> (ogrenciler, firmalar); diske yazılmaz."""
+    firmalar_df, ogrenciler_df = veri_olustur.veri_seti_olustur(ogr_sayisi, firma_sayisi, seed=seed, kaydet=False)
+
+    # Sütun İsimlerini Düzelt
+    mapping = {'Ortalama': 'GNO', 'Not': 'GNO', 'Puan': 'GNO', 'Ogrenci_No': 'Öğrenci'}
+    ogrenciler_df.rename(columns=mapping, inplace=True)
+
+    if 'Yerleştiği_Firma' not in ogrenciler_df.columns:
+        ogrenciler_df['Yerleştiği_Firma'] = None
+    return ogrenciler_df, firmalar_df
+
+
+@st.cache_resource
+def _sonuc_onbellegi():
+    """Tüm oturumların paylaştığı çözücü sonuç önbelleği (LRU sırasıyla OrderedDict) ve kilidi."""
+    return OrderedDict(), threading.Lock()
+
+
+def girdi_ozeti(ogrenciler_df, firmalar_df):
+    """Çözücü girdisinin içerik özeti (aynı veri + aynı mevcut atama -> aynı özet)."""
+    h = hashlib.sha1()
+    for df in (ogrenciler_df, firmalar_df):
+        h.update("|".join(map(str, df.columns)).encode())
+        h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def onbellek_anahtari(algoritma, parametreler):
+    """(öğrenci sayısı, firma sayısı, algoritma, parametreler (iterasyon, seed...), mevcut girdinin özeti)"""
+    ogr, frm = st.session_state['ogrenciler'], st.session_state['firmalar']
+    return (len(ogr), len(frm), algoritma, tuple(sorted(parametreler.items())), girdi_ozeti(ogr, frm))
+
+
+def onbellekten_al(anahtar):
+    """Kayıt varsa ((ogrenciler, firmalar), ilk çalıştırmanın süresi), yoksa None."""
+    onbellek, kilit = _sonuc_onbellegi()
+    with kilit:
+        if anahtar not in onbellek:
+            return None
+        onbellek.move_to_end(anahtar)
+        s_ogr, s_frm, sure = onbellek[anahtar]
+    # Oturumlar aynı nesneyi değiştirmesin diye kopya verilir
+    return (s_ogr.copy(), s_frm.copy()), sure
+
+
+def onbellege_yaz(anahtar, res, sure):
+    onbellek, kilit = _sonuc_onbellegi()
+    with kilit:
+        onbellek[anahtar] = (res[0].copy(), res[1].copy(), sure)
+        while len(onbellek) > ONBELLEK_BOYUTU:
+            onbellek.popitem(last=False)
+
+
+# --- ARKA PLAN İŞLERİ ---
+# Çözücüler sayfa betiğinde değil bu havuzda çalışır: sayfa donmaz, rerun işi öldürmez.
+ARKA_PLAN_ISCI = 4
+YOKLAMA_ARALIGI = 1.0  # saniye
+
+
+@st.cache_resource
+def _is_havuzu():
+    """Tüm oturumların paylaştığı iş parçacığı havuzu."""
+    return ThreadPoolExecutor(max_workers=ARKA_PLAN_ISCI, thread_name_prefix="cozucu")
+
+
+def aktif_isi_iptal_et():
+    is_ = st.session_state.get('aktif_is')
+    if is_ is not None:
+        is_.iptal_et()
+        st.session_state['aktif_is'] = None
+
+
+def sonucu_uygula(algoritma, res, sure, onbellekten=False):
+    """Çözücü sonucunu oturuma yazar ve kıyaslama tablosuna ekler."""
+    st.session_state['ogrenciler'], st.session_state['firmalar'] = res
+    df = res[0]
+    yerlesen = df['Yerleştiği_Firma'].count()
+    puan = puan_hesapla(df)
+
+    st.session_state['analiz_sonuclari'][algoritma] = {"Puan": puan, "Yerleşen": yerlesen, "Süre": sure}
+    st.session_state['son_sonuc'] = {"Algoritma": algoritma, "Puan": puan, "Yerleşen": yerlesen,
+                                     "Toplam": len(df), "Süre": sure, "Önbellek": onbellekten}
+
+
+def cozumu_baslat(ad, seed=None):
     """
-    Modül içindeki fonksiyon adını bilmesek bile bulup getirir.
-    Örn: 'hill_climbing' arar, bulamazsa 'heuristic_atama'yı getirir.
+    Kayıtlı çözücüyü şemadaki (veri profili için ayarlanmışsa ayarlı) varsayılan parametrelerle
+    (seed alıyorsa verilen seed ile) arka plana gönderir; ilerleme destekleyenlere step_callback
+    verilir. Önbellekte varsa hemen uygulanır. Oturum başına aynı anda tek iş çalışır.
     """
-    for name in dir(modul):
-        # Python'un kendi gömülü metodlarını atla
-        if name.startswith("__") or name in ['deepcopy', 'copy', 'math', 'pd', 'np', 'random']:
-            continue
-            
-        # Anahtar kelimelerden biri geçiyor mu?
-        for anahtar in anahtar_kelimeler:
-            if anahtar in name:
-                attr = getattr(modul, name)
-                if callable(attr):
-                    return attr
-    return None
+    aktif = st.session_state.get('aktif_is')
+    if aktif is not None:
+        st.warning(f"⏳ {aktif.algoritma} hâlâ çalışıyor. Bitmesini bekleyin veya iptal edin.")
+        return
+
+    secilen = cozucu_kayit.cozucu(ad)
+    parametreler = secilen.parametreleri_hazirla(st.session_state['ogrenciler'], st.session_state['firmalar'])
+    if seed is not None and secilen.parametre("seed") is not None:
+        parametreler["seed"] = seed
+
+    anahtar = onbellek_anahtari(ad, parametreler)
+    kayit = onbellekten_al(anahtar)
+    if kayit is not None:
+        sonucu_uygula(secilen.etiket, *kayit, onbellekten=True)
+        return
+
+    iterasyon = parametreler.get("iterasyon") if secilen.ilerleme else None
+    is_ = arka_plan.ArkaPlanIsi(secilen.etiket, iterasyon, anahtar)
+    st.session_state['aktif_is'] = is_.gonder(_is_havuzu(), secilen.calistir, st.session_state['ogrenciler'].copy(),
+                                              st.session_state['firmalar'].copy(), **parametreler)
+
+
+@st.fragment(run_every=YOKLAMA_ARALIGI)
+def is_paneli():
+    """Aktif işin ilerlemesini sayfanın geri kalanını yeniden çalıştırmadan yoklar."""
+    is_ = st.session_state.get('aktif_is')
+    if is_ is None:
+        return
+
+    if not is_.bitti_mi:
+        st.progress(is_.ilerleme, text=f"⏳ {is_.algoritma} çalışıyor... %{is_.ilerleme * 100:.0f} "
+                                       f"({is_.gecen_sure:.1f}s)")
+        if st.button("⛔ İptal", key="is_iptal"):
+            is_.iptal_et()
+        return
+
+    st.session_state['aktif_is'] = None
+    if is_.durum == "bitti":
+        res = is_.sonuc()
+        onbellege_yaz(is_.anahtar, res, is_.sure)
+        sonucu_uygula(is_.algoritma, res, is_.sure)
+    elif is_.durum == "iptal":
+        st.session_state['is_mesaji'] = ("warning", f"⛔ {is_.algoritma} iptal edildi.")
+    else:
+        st.session_state['is_mesaji'] = ("error", f"{is_.algoritma} Hatası: {is_.hata()}")
+    # Metrikler ve tablolar fragment dışında: tüm sayfa yenilenir
+    st.rerun()
+
+
+# --- YARDIMCI FONKSİYONLAR ---
+def puan_hesapla(df):
+    """Masaüstü uygulamasıyla aynı puanlama mantığı (ortak vektörel çekirdek)"""
+    return skorlama.memnuniyet_skoru_hesapla(df, skorlama.ARAYUZ_PUANLARI)
+
+
+# Buton simgeleri (kayıtta olup burada olmayan çözücüler varsayılan simgeyle gösterilir)
+ALGORITMA_SIMGELERI = {"greedy": "🚀", "stabil": "🤝", "hill_climbing": "⛰️", "annealing": "🔥", "tabu": "🧭", "optimal": "🎯"}
 
 # --- SOL MENÜ ---
 with st.sidebar:
@@ -78,43 +205,59 @@ with st.sidebar:
     
     ogr_sayisi = st.number_input("Öğrenci Sayısı", value=150)
     firma_sayisi = st.number_input("Firma Sayısı", value=40)
+    # Sonuçların tutarlı olması için seed sabit (veri üretimi ve çözücüler aynı seed'i kullanır)
+    seed = int(st.number_input("Seed", value=46, step=1))
     
     if st.button("🎲 Veri Oluştur", type="primary"):
-        # Sonuçların tutarlı olması için seed sabitliyoruz
-        np.random.seed(42)
-        
-        d1, d2 = veri_olustur.veri_seti_olustur(ogr_sayisi, firma_sayisi)
-        
-        # Hangi dataframe hangisi kontrol et
-        if 'Firma' in d1.columns:
-            firmalar_df, ogrenciler_df = d1, d2
-        else:
-            ogrenciler_df, firmalar_df = d1, d2
-
-        # Sütun İsimlerini Düzelt
-        mapping = {'Ortalama': 'GNO', 'Not': 'GNO', 'Puan': 'GNO', 'Ogrenci_No': 'Öğrenci'}
-        ogrenciler_df.rename(columns=mapping, inplace=True)
-        
-        if 'Yerleştiği_Firma' not in ogrenciler_df.columns:
-            ogrenciler_df['Yerleştiği_Firma'] = None
+        # Aynı (öğrenci, firma, seed) için önbellekten gelir, CSV'ler yeniden yazılmaz
+        ogrenciler_df, firmalar_df = veri_uret(int(ogr_sayisi), int(firma_sayisi), seed)
+        aktif_isi_iptal_et()
 
         st.session_state['ogrenciler'] = ogrenciler_df
         st.session_state['firmalar'] = firmalar_df
         st.session_state['analiz_sonuclari'] = {}
+        st.session_state.pop('son_sonuc', None)
         
         st.success(f"Veri Hazır: {len(ogrenciler_df)} Öğrenci")
 
+    # İkili veri seti (.npz + .json manifest)
+    veri_yolu = st.text_input("Veri Dosyası (.npz)", value=veri_formati.VARSAYILAN_VERI + ".npz")
+    c_yukle, c_kaydet = st.columns(2)
+    if c_yukle.button("📂 Yükle"):
+        try:
+            ogrenciler_df, firmalar_df = veri_formati.veri_yukle(veri_yolu)
+            aktif_isi_iptal_et()
+            if 'Yerleştiği_Firma' not in ogrenciler_df.columns:
+                ogrenciler_df['Yerleştiği_Firma'] = None
+
+            st.session_state['ogrenciler'] = ogrenciler_df
+            st.session_state['firmalar'] = firmalar_df
+            st.session_state['analiz_sonuclari'] = {}
+            st.session_state.pop('son_sonuc', None)
+            st.success(f"Yüklendi: {len(ogrenciler_df)} Öğrenci")
+        except Exception as e:
+            st.error(f"Yükleme Hatası: {e}")
+
+    if c_kaydet.button("💾 Kaydet"):
+        if st.session_state['ogrenciler'].empty:
+            st.warning("Kaydedilecek veri yok.")
+        else:
+            veri_formati.veri_kaydet(veri_yolu, st.session_state['ogrenciler'], st.session_state['firmalar'])
+            st.success(f"Kaydedildi: {veri_yolu}")
+
     st.markdown("---")
     st.subheader("Algoritmalar")
     
-    btn_greedy = st.button("🚀 Greedy")
-    btn_hill = st.button("⛰️ Hill Climbing")
-    btn_anneal = st.button("🔥 Annealing")
+    secilen_cozucu = None
+    for c in cozucu_kayit.cozuculer():
+        if st.button(f"{ALGORITMA_SIMGELERI.get(c.ad, '▶️')} {c.etiket}", key=f"cozucu_{c.ad}", help=c.aciklama):
+            secilen_cozucu = c.ad
     
     st.markdown("---")
     btn_kiyasla = st.button("📊 Analiz & Kıyasla")
     
     if st.button("🗑️ Sıfırla"):
+        aktif_isi_iptal_et()
         st.session_state.clear()
         st.rerun()
 
@@ -123,109 +266,30 @@ if st.session_state['ogrenciler'].empty:
     st.info("👈 Lütfen sol menüden **'Veri Oluştur'** butonuna basın.")
     st.stop()
 
-islem_bitti = False
-secilen_algo = ""
-sure = 0
+# Algoritmalar arka planda çalışır; sayfa bu sırada kullanılabilir (önceki sonuçlar, kıyaslama)
+if secilen_cozucu is not None:
+    cozumu_baslat(secilen_cozucu, seed=seed)
 
-# 1. GREEDY
-if btn_greedy:
-    secilen_algo = "Greedy"
-    t1 = time.time()
-    
-    # Greedy genelde standart isimlendirilir ama yine de kontrol edelim
-    try:
-        if hasattr(algo_greedy, 'greedy_atama'):
-            res = algo_greedy.greedy_atama(st.session_state['ogrenciler'].copy(), st.session_state['firmalar'].copy())
-        else:
-            # Bulamazsa dinamik ara
-            func = dinamik_fonksiyon_bul(algo_greedy, ['greedy', 'atama'])
-            res = func(st.session_state['ogrenciler'].copy(), st.session_state['firmalar'].copy())
+# Çalışan işin ilerleme çubuğu ve iptal butonu (kendi kendini yoklar)
+is_paneli()
 
-        st.session_state['ogrenciler'] = res[0] if isinstance(res, tuple) else res
-        if isinstance(res, tuple): st.session_state['firmalar'] = res[1]
-        
-    except Exception as e:
-        st.error(f"Greedy Hatası: {e}")
-        st.stop()
-        
-    sure = time.time() - t1
-    islem_bitti = True
-
-# 2. HILL CLIMBING
-elif btn_hill:
-    secilen_algo = "Hill Climbing"
-    t1 = time.time()
-    bar = st.progress(0)
-    
-    def step(i): 
-        if i % 500 == 0: bar.progress(min(i/3000, 1.0))
-    
-    try:
-        # Fonksiyon adını dinamik bul (Hata Riskini Sıfırla)
-        func = dinamik_fonksiyon_bul(algo_heuristic_hill_climbing, ['hill', 'heuristic', 'atama', 'main'])
-        
-        if func:
-            res = func(st.session_state['ogrenciler'].copy(), st.session_state['firmalar'].copy(), iterasyon=3000, step_callback=step)
-            st.session_state['ogrenciler'] = res[0] if isinstance(res, tuple) else res
-            if isinstance(res, tuple): st.session_state['firmalar'] = res[1]
-        else:
-            st.error("Hill Climbing fonksiyonu modül içinde bulunamadı!")
-            st.stop()
-            
-    except Exception as e:
-        st.error(f"Hill Climbing Hatası: {e}")
-        st.stop()
-    
-    bar.empty()
-    sure = time.time() - t1
-    islem_bitti = True
-
-# 3. ANNEALING
-elif btn_anneal:
-    secilen_algo = "Simulated Annealing"
-    t1 = time.time()
-    bar = st.progress(0)
-    
-    def step(i):
-        if i % 1000 == 0: bar.progress(min(i/10000, 1.0))
-        
-    try:
-        # Fonksiyon adını dinamik bul
-        func = dinamik_fonksiyon_bul(algo_heuristic_annealing, ['simulated', 'anneal', 'heuristic', 'atama'])
-        
-        if func:
-            res = func(st.session_state['ogrenciler'].copy(), st.session_state['firmalar'].copy(), iterasyon=10000, step_callback=step)
-            st.session_state['ogrenciler'] = res[0] if isinstance(res, tuple) else res
-            if isinstance(res, tuple): st.session_state['firmalar'] = res[1]
-        else:
-            st.error("Annealing fonksiyonu modül içinde bulunamadı!")
-            st.stop()
-            
-    except Exception as e:
-        st.error(f"Annealing Hatası: {e}")
-        st.stop()
-    
-    bar.empty()
-    sure = time.time() - t1
-    islem_bitti = True
+mesaj = st.session_state.pop('is_mesaji', None)
+if mesaj:
+    getattr(st, mesaj[0])(mesaj[1])
 
-# --- SONUÇLARI GÖSTER ---
-if islem_bitti:
-    df = st.session_state['ogrenciler']
-    yerlesen = df['Yerleştiği_Firma'].count()
-    basari = (yerlesen / len(df)) * 100
-    puan = puan_hesapla(df)
-    
-    # Sonucu Kaydet
-    st.session_state['analiz_sonuclari'][secilen_algo] = {"Puan": puan, "Yerleşen": yerlesen, "Süre": sure}
-    
-    st.success(f"✅ {secilen_algo} Tamamlandı!")
+# --- SONUÇLARI GÖSTER (SON ÇALIŞTIRMA) ---
+son = st.session_state.get('son_sonuc')
+if son:
+    basari = (son['Yerleşen'] / son['Toplam']) * 100
+
+    # Süre önbellekten gelse de ilk çalıştırmanın süresidir (kıyaslama bozulmasın)
+    st.success(f"✅ {son['Algoritma']} Tamamlandı!" + (" (önbellekten)" if son['Önbellek'] else ""))
     
     c1, c2, c3, c4 = st.columns(4)
-    c1.metric("Yerleşen", f"{yerlesen}/{len(df)}")
+    c1.metric("Yerleşen", f"{son['Yerleşen']}/{son['Toplam']}")
     c2.metric("Başarı", f"%{basari:.1f}")
-    c3.metric("Puan", f"{puan:,}".replace(",", "."))
-    c4.metric("Süre", f"{sure:.3f}s")
+    c3.metric("Puan", f"{son['Puan']:,}".replace(",", "."))
+    c4.metric("Süre", f"{son['Süre']:.3f}s")
 
 # --- KIYASLAMA GRAFİĞİ ---
 if btn_kiyasla:
@@ -253,8 +317,10 @@ if btn_kiyasla:
             st.info(f"🏆 En İyi Performans: **{best['Algoritma']}** ({int(best['Puan'])} Puan)")
 
         with c2:
+            # matplotlib açılışta değil, ilk grafik çiziminde yüklenir
+            import matplotlib.pyplot as plt
             fig, ax = plt.subplots(figsize=(5, 3))
-            colors = ['#FF4B4B', '#1C83E1', '#FFA500']
+            colors = ['#FF4B4B', '#1C83E1', '#FFA500', '#8E44AD', '#2E8B57']
             bars = ax.bar(df_res['Algoritma'], df_res['Puan'], color=colors[:len(df_res)])
             ax.set_title("Memnuniyet Puanı Karşılaştırması")
             
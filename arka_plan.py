@@ -0,0 +1,85 @@
+import threading
+import time
+
+# İşin durumu (arayüzde gösterilir)
+IS_DURUMLARI = ("bekliyor", "calisiyor", "bitti", "iptal", "hata")
+
+
+class IsIptalEdildi(Exception):
+    """İptal edilen işin step_callback'inden fırlatılır; çözücü döngüsünü keser."""
+
+
+class ArkaPlanIsi:
+    """
+    Bir çözücü çalıştırmasının arka plandaki (iş parçacığı havuzunda) tutamacı.
+
+    İptal işbirlikçidir: çözücülere step_callback olarak self.step_callback verilir,
+    iptal istenmişse bir sonraki çağrıda IsIptalEdildi fırlatılır (heuristikler her 50
+    iterasyonda bir çağırır). İlerleme aynı callback'ten 0..1 arası tutulur. iterasyon
+    verilmeyen işlere (Greedy, Optimal) step_callback verilmez; bunlar başladıktan
+    sonra iptal edilemez.
+    Arayüz iş parçacığı sadece alanları okur, çözücü iş parçacığı sadece yazar.
+    """
+
+    def __init__(self, algoritma, iterasyon=None, anahtar=None):
+        self.algoritma = algoritma
+        self.iterasyon = iterasyon
+        self.anahtar = anahtar  # arayüzün önbellek anahtarı (varsa)
+        self.ilerleme = 0.0
+        self.baslangic = None
+        self.sure = None
+        self._iptal = threading.Event()
+        self._gelecek = None
+
+    def step_callback(self, i):
+        if self._iptal.is_set():
+            raise IsIptalEdildi(self.algoritma)
+        if self.iterasyon:
+            self.ilerleme = min(i / self.iterasyon, 1.0)
+
+    def _calistir(self, fonksiyon, args, kwargs):
+        self.baslangic = time.time()
+        if self.iterasyon is not None:
+            kwargs = dict(kwargs, step_callback=self.step_callback)
+        try:
+            return fonksiyon(*args, **kwargs)
+        finally:
+            self.sure = time.time() - self.baslangic
+
+    def gonder(self, havuz, fonksiyon, *args, **kwargs):
+        """fonksiyon(*args, **kwargs) çağrısını (iterasyonlu işlerde step_callback ile) havuza gönderir."""
+        self._gelecek = havuz.submit(self._calistir, fonksiyon, args, kwargs)
+        return self
+
+    def iptal_et(self):
+        self._iptal.set()
+        # Henüz başlamadıysa hiç çalışmaz
+        if self._gelecek is not None:
+            self._gelecek.cancel()
+
+    @property
+    def gecen_sure(self):
+        if self.baslangic is None:
+            return 0.0
+        return self.sure if self.sure is not None else time.time() - self.baslangic
+
+    @property
+    def durum(self):
+        if self._gelecek is None or not self._gelecek.done():
+            return "calisiyor" if self.baslangic is not None else "bekliyor"
+        if self._gelecek.cancelled() or isinstance(self._gelecek.exception(), IsIptalEdildi):
+            return "iptal"
+        if self._gelecek.exception() is not None:
+            return "hata"
+        return "bitti"
+
+    @property
+    def bitti_mi(self):
+        return self._gelecek is not None and self._gelecek.done()
+
+    def hata(self):
+        return None if self.durum != "hata" else self._gelecek.exception()
+
+    def sonuc(self):
+        """Biten işin sonucu (iş bitmeden çağrılırsa bekler)."""
+        return self._gelecek.result()
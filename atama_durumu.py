@@ -0,0 +1,251 @@
+import pandas as pd
+import numpy as np
+
+from skorlama import PUANLAR, skor_hesapla, tercih_sirasi
+
+# Atanmamış öğrenci / listede olmayan tercih için kullanılan firma id'si
+BOS = -1
+TERCIH_SAYISI = 5
+
+
+class AtamaDurumu:
+    """
+    Yerleştirme probleminin dizi (NumPy) tabanlı temsili.
+
+    - atama:      öğrenci -> firma id (int32, atanmamışsa -1)
+    - kontenjan:  firma id -> kalan kontenjan (int)
+    - tercihler:  (N x 5) firma id matrisi (listede olmayan tercih -1)
+
+    Algoritmalar döngü içinde DataFrame yerine bu diziler üzerinde çalışır,
+    DataFrame'e dönüşüm sadece en sonda yapılır.
+
+    Firma -> öğrenciler ters indeksi (SWAP komşuluğu için) ilk ihtiyaçta kurulur ve
+    hamlelerle birlikte güncellenir. atama dizisine doğrudan yazılırsa
+    sakin_indeksini_sifirla() çağrılmalıdır.
+    """
+
+    def __init__(self, firma_isimleri, kontenjan, tercihler, atama=None):
+        self.firma_isimleri = np.asarray(firma_isimleri, dtype=object)
+        self.firma_index = {}
+        for i, isim in enumerate(self.firma_isimleri):
+            # Aynı isim birden fazla varsa ilki geçerli (eski boolean mask davranışı)
+            self.firma_index.setdefault(isim, i)
+
+        self.kontenjan = np.asarray(kontenjan, dtype=np.int64).copy()
+        self.tercihler = np.asarray(tercihler, dtype=np.int32)
+        self._tercih_listesi = None
+
+        if atama is None:
+            atama = np.full(self.tercihler.shape[0], BOS, dtype=np.int32)
+        self.atama = np.asarray(atama, dtype=np.int32).copy()
+
+    @property
+    def atama(self):
+        return self._atama
+
+    @atama.setter
+    def atama(self, deger):
+        self._atama = deger
+        self.sakin_indeksini_sifirla()
+
+    @property
+    def ogrenci_sayisi(self):
+        return self.atama.shape[0]
+
+    @property
+    def firma_sayisi(self):
+        return self.kontenjan.shape[0]
+
+    @classmethod
+    def dataframe_den(cls, ogrenciler_df, firmalar_df):
+        """DataFrame'lerden durumu oluşturur (isimler bir kere id'ye çevrilir)."""
+        firma_isimleri = firmalar_df['Firma'].to_numpy(dtype=object)
+        kontenjan = firmalar_df['Kontenjan'].to_numpy()
+
+        durum = cls(firma_isimleri, kontenjan, np.empty((len(ogrenciler_df), 0)))
+        durum.tercihler = np.column_stack([
+            durum.isimden_id(ogrenciler_df[f'Tercih{i}']) if f'Tercih{i}' in ogrenciler_df.columns
+            else np.full(len(ogrenciler_df), BOS, dtype=np.int32)
+            for i in range(1, TERCIH_SAYISI + 1)
+        ]).astype(np.int32)
+
+        if 'Yerleştiği_Firma' in ogrenciler_df.columns:
+            durum.atama = durum.isimden_id(ogrenciler_df['Yerleştiği_Firma'])
+        else:
+            durum.atama = np.full(len(ogrenciler_df), BOS, dtype=np.int32)
+        return durum
+
+    def isimden_id(self, isimler):
+        """Firma isimlerini id'ye çevirir; bilinmeyen / boş değerler -1 olur."""
+        if isinstance(getattr(isimler, 'dtype', None), pd.CategoricalDtype):
+            # Kategorik sütun (veri_formati): sadece kategoriler eşlenir, kodlar dizi indeksiyle çevrilir
+            kategori_idler = np.append(self.isimden_id(isimler.cat.categories), BOS).astype(np.int32)
+            return kategori_idler[isimler.cat.codes.to_numpy()]
+        idler = pd.Series(np.asarray(isimler, dtype=object)).map(self.firma_index)
+        return idler.fillna(BOS).to_numpy(dtype=np.int32)
+
+    def kopya(self):
+        yeni = AtamaDurumu.__new__(AtamaDurumu)
+        yeni.firma_isimleri = self.firma_isimleri
+        yeni.firma_index = self.firma_index
+        yeni.tercihler = self.tercihler
+        yeni._tercih_listesi = self._tercih_listesi
+        yeni.kontenjan = self.kontenjan.copy()
+        # Ters indeks kopyalanmaz, gerekirse kopyada yeniden kurulur
+        yeni.atama = self.atama.copy()
+        return yeni
+
+    def skor(self, puanlar=PUANLAR):
+        """Toplam memnuniyet puanı (yerleşmeyen veya tercih dışı yerleşen 0 puan)."""
+        return skor_hesapla(self.tercihler, self.atama, puanlar)
+
+    # --- ARTIMLI (DELTA) SKOR ---
+    def puan(self, ogrenci, firma, puanlar=PUANLAR):
+        """Öğrencinin verilen firmadan aldığı puan (en fazla 5 karşılaştırma, O(1))."""
+        if firma == BOS:
+            return 0
+        if self._tercih_listesi is None:
+            self._tercih_listesi = self.tercihler.tolist()
+        satir = self._tercih_listesi[ogrenci]
+        if firma in satir:
+            return puanlar[satir.index(firma)]
+        return 0
+
+    def tasima_deltasi(self, ogrenci, hedef, puanlar=PUANLAR):
+        """MOVE hamlesinin skora etkisi (hamle uygulanmadan hesaplanır)."""
+        return self.puan(ogrenci, hedef, puanlar) - self.puan(ogrenci, self.atama[ogrenci], puanlar)
+
+    def takas_deltasi(self, ogrenci_a, ogrenci_b, puanlar=PUANLAR):
+        """SWAP hamlesinin skora etkisi (sadece iki öğrencinin eski/yeni sırası)."""
+        firma_a = self.atama[ogrenci_a]
+        firma_b = self.atama[ogrenci_b]
+        return (self.puan(ogrenci_a, firma_b, puanlar) + self.puan(ogrenci_b, firma_a, puanlar)
+                - self.puan(ogrenci_a, firma_a, puanlar) - self.puan(ogrenci_b, firma_b, puanlar))
+
+    # --- FİRMA -> ÖĞRENCİLER TERS İNDEKSİ ---
+    def sakin_indeksini_sifirla(self):
+        self._sakinler = None
+        self._konum = None
+
+    def sakin_indeksini_kur(self):
+        """
+        Her firma için o firmaya yerleşmiş öğrencilerin listesi ve her öğrencinin
+        kendi firmasının listesindeki konumu. Ekleme/çıkarma O(1) (sondakiyle yer değiştirme).
+        """
+        self._sakinler = [[] for _ in range(self.firma_sayisi)]
+        self._konum = [0] * self.ogrenci_sayisi
+        for ogrenci, firma in enumerate(self._atama.tolist()):
+            if firma != BOS:
+                self._konum[ogrenci] = len(self._sakinler[firma])
+                self._sakinler[firma].append(ogrenci)
+
+    def sakinler(self, firma):
+        """Firmaya yerleşmiş öğrenciler (rastgele seçim için O(1) erişimli liste, değiştirmeyin)."""
+        if self._sakinler is None:
+            self.sakin_indeksini_kur()
+        return self._sakinler[firma]
+
+    def _indekse_ekle(self, ogrenci, firma):
+        if self._sakinler is None or firma == BOS:
+            return
+        liste = self._sakinler[firma]
+        self._konum[ogrenci] = len(liste)
+        liste.append(ogrenci)
+
+    def _indeksten_cikar(self, ogrenci, firma):
+        if self._sakinler is None or firma == BOS:
+            return
+        liste = self._sakinler[firma]
+        son = liste.pop()
+        if son != ogrenci:
+            konum = self._konum[ogrenci]
+            liste[konum] = son
+            self._konum[son] = konum
+
+    # --- HAMLELER ---
+    def tasi(self, ogrenci, hedef):
+        """MOVE: öğrenciyi kontenjanı olan hedef firmaya taşır, eski firmayı döndürür."""
+        eski = self._atama[ogrenci]
+        self._atama[ogrenci] = hedef
+        self.kontenjan[hedef] -= 1
+        if eski != BOS:
+            self.kontenjan[eski] += 1
+        self._indeksten_cikar(ogrenci, eski)
+        self._indekse_ekle(ogrenci, hedef)
+        return eski
+
+    def tasimayi_geri_al(self, ogrenci, eski):
+        hedef = self._atama[ogrenci]
+        self._atama[ogrenci] = eski
+        self.kontenjan[hedef] += 1
+        if eski != BOS:
+            self.kontenjan[eski] -= 1
+        self._indeksten_cikar(ogrenci, hedef)
+        self._indekse_ekle(ogrenci, eski)
+
+    def takas(self, ogrenci_a, ogrenci_b):
+        """SWAP: iki öğrencinin firmalarını değiştirir (kontenjanlar değişmez)."""
+        firma_a, firma_b = self._atama[ogrenci_a], self._atama[ogrenci_b]
+        self._atama[ogrenci_a], self._atama[ogrenci_b] = firma_b, firma_a
+        if self._sakinler is not None:
+            # Listelerde sadece öğrenci numaraları yer değiştirir, konumlar da takas edilir
+            if firma_a != BOS:
+                self._sakinler[firma_a][self._konum[ogrenci_a]] = ogrenci_b
+            if firma_b != BOS:
+                self._sakinler[firma_b][self._konum[ogrenci_b]] = ogrenci_a
+            self._konum[ogrenci_a], self._konum[ogrenci_b] = self._konum[ogrenci_b], self._konum[ogrenci_a]
+
+    # --- DATAFRAME'E DÖNÜŞ ---
+    def firma_isimleri_dizisi(self):
+        """Atamayı firma isimlerine çevirir (atanmamış -> None)."""
+        isimler = np.empty(self.ogrenci_sayisi, dtype=object)
+        yerlesen = self.atama != BOS
+        isimler[yerlesen] = self.firma_isimleri[self.atama[yerlesen]]
+        return isimler
+
+    def dataframe_e_yaz(self, ogrenciler_df, firmalar_df):
+        """Yerleştiği_Firma ve Kontenjan sütunlarını verilen DataFrame'lere yazar."""
+        ogrenciler_df['Yerleştiği_Firma'] = pd.Series(self.firma_isimleri_dizisi(), index=ogrenciler_df.index,
+                                                      dtype=object)
+        firmalar_df['Kontenjan'] = self.kontenjan.astype(firmalar_df['Kontenjan'].dtype)
+        return ogrenciler_df, firmalar_df
+
+    def tercih_siralari(self):
+        """
+        Her öğrencinin yerleştiği firmanın tercih numarası (1..5), skorlama.tercih_sirasi'ndan
+        (0 tabanlı, yerleşmeyen k) çevrilir. Yerleşmemiş / tercih dışı yerleşmiş 0.
+        """
+        sira = tercih_sirasi(self.tercihler, self.atama)
+        return np.where(sira < self.tercihler.shape[1], sira + 1, 0).astype(np.int8)
+
+    def firma_sakinleri(self):
+        """
+        (sıra, sınırlar): öğrenciler firma id'sine göre stabil sıralanmış (her firmada DataFrame
+        sırası korunur, yerleşmeyenler hariç); firma f'nin sakinleri sıra[sınırlar[f]:sınırlar[f + 1]].
+        """
+        sira = np.argsort(self.atama, kind="stable")
+        sira = sira[self.atama[sira] != BOS]
+        sinirlar = np.zeros(self.firma_sayisi + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.atama[sira], minlength=self.firma_sayisi), out=sinirlar[1:])
+        return sira, sinirlar
+
+    def sonuclari_yaz(self, ogrenciler_df, firmalar_df):
+        """
+        Tüm çözücülerin ortak son işlemi: dataframe_e_yaz'a ek olarak öğrencilere
+        Tercih_Sırası (1..5, yerleşmeyen "-"), firmalara Yerlesenler ("Ad1, Ad2", boşsa "-") yazılır.
+        """
+        self.dataframe_e_yaz(ogrenciler_df, firmalar_df)
+
+        sira_no = self.tercih_siralari()
+        tercih_sirasi = sira_no.astype(object)
+        tercih_sirasi[sira_no == 0] = "-"
+        ogrenciler_df['Tercih_Sırası'] = pd.Series(tercih_sirasi, index=ogrenciler_df.index, dtype=object)
+
+        # Birleştirme firma başına bir kez, düz Python listesi dilimleri üzerinde yapılır
+        sira, sinirlar = self.firma_sakinleri()
+        isimler = list(map(str, ogrenciler_df['Öğrenci'].to_numpy(dtype=object)[sira].tolist()))
+        sinirlar = sinirlar.tolist()
+        yerlesenler = [", ".join(isimler[bas:son]) if son > bas else "-"
+                       for bas, son in zip(sinirlar[:-1], sinirlar[1:])]
+        firmalar_df['Yerlesenler'] = pd.Series(yerlesenler, index=firmalar_df.index, dtype=object)
+        return ogrenciler_df, firmalar_df
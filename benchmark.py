@@ -0,0 +1,338 @@
+"""
+Yerleştirme algoritmaları için ölçeklenme benchmark'ı.
+
+Kullanım:
+    python benchmark.py calistir --boyutlar 150,1000,10000 --cikti sonuc.json
+    python benchmark.py karsilastir eski.json yeni.json --esik 0.10
+    python benchmark.py baslangic --moduller main_gui,app --tekrar 5
+
+'calistir' veri setlerini veri_olustur ile (sabit seed) üretir, her algoritmayı çalıştırıp
+süre, tepe bellek, saniyedeki iterasyon ve final skoru JSON'a yazar.
+'karsilastir' iki sonuç dosyasını eşleştirir, gerilemeleri işaretler (varsa çıkış kodu 1).
+'baslangic' arayüz modüllerinin soğuk açılış (import) süresini yeni süreçlerde -X importtime ile ölçer.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import pandas as pd
+import numpy as np
+
+import veri_formati
+import veri_olustur
+from cozucu_kayit import cozucu, cozucu_adlari, cozuculer
+from skorlama import memnuniyet_skoru_hesapla
+
+VARSAYILAN_BOYUTLAR = (150, 1_000, 10_000, 100_000, 1_000_000)
+# Firma / öğrenci oranları (150 öğrenci / 40 firma ~ 0.27)
+VARSAYILAN_ORANLAR = (0.05, 0.27)
+VARSAYILAN_ALGORITMALAR = ("greedy", "hill_climbing", "annealing", "simulasyon")
+# Kayıtlı tüm çözücüler + red simülasyonu (çözücü değil, benchmark'a özel)
+TUM_ALGORITMALAR = cozucu_adlari() + ("simulasyon",)
+# Kayıttaki varsayılandan farklı ölçülen iterasyonlar (eski sonuçlarla karşılaştırılabilsin diye)
+VARSAYILAN_ITERASYON = {"annealing": 5000}
+# Açılış ölçümünde varsayılan modüller (iki arayüz) ve açılışta yüklenmemesi gereken ağır modüller
+VARSAYILAN_BASLANGIC_MODULLERI = ("main_gui", "app")
+AGIR_MODULLER = ("matplotlib",) + tuple(sorted({c.modul for c in cozuculer()}))
+# Karşılaştırmada bu süreden kısa farklar gürültü sayılır (sn)
+MIN_SURE_FARKI = 0.05
+
+
+def firma_sayisi_hesapla(ogrenci_sayisi, oran, tercih_sayisi=5):
+    return min(ogrenci_sayisi, max(tercih_sayisi, int(round(ogrenci_sayisi * oran))))
+
+
+def veri_seti_hazirla(ogrenci_sayisi, firma_sayisi, seed, klasor):
+    """Veri setini bir kere üretip klasöre (.npz) kaydeder, sonraki çalıştırmalarda diskten yükler."""
+    yol = os.path.join(klasor, f"bench_{ogrenci_sayisi}_{firma_sayisi}_{seed}")
+    if not os.path.exists(yol + ".npz"):
+        os.makedirs(klasor, exist_ok=True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            veri_olustur.buyuk_veri_seti_olustur(ogrenci_sayisi, firma_sayisi, seed=seed, bicim="npz",
+                                                 veri_dosyasi=yol)
+    return veri_formati.veri_yukle(yol)
+
+
+def _greedy_sonucu(ogrenciler, firmalar):
+    return cozucu("greedy")(ogrenciler, firmalar)
+
+
+def calistirici_hazirla(algoritma, ogrenciler, firmalar, seed, iterasyon=None, ayarli=False):
+    """
+    Zamanlanacak fonksiyonu hazırlar; fonksiyon (sonuç öğrenci DataFrame'i, iterasyon sayısı) döndürür.
+    Çözücüler kayıttan alınır. Yerel aramalar (arayüzde olduğu gibi) greedy sonucundan başlar,
+    greedy süresi ve modül import'u ölçüme dahil edilmez.
+    Tek geçişli çözücüler için iterasyon öğrenci sayısı, simülasyon için tur sayısıdır.
+    Ölçümler karşılaştırılabilir kalsın diye yerel ayar önbelleği (tavlama_ayari) varsayılan olarak
+    kullanılmaz; ayarli=True ise ayarlı parametreler aynı iterasyon bütçesiyle kullanılır.
+    """
+    if algoritma == "simulasyon":
+        from algo_greedy import simulasyon_dongusu
+
+        def calistir():
+            ogr, _, log = simulasyon_dongusu(ogrenciler, firmalar, rng=np.random.default_rng(seed))
+            return ogr, len(log)
+        return calistir
+
+    if algoritma not in TUM_ALGORITMALAR:
+        raise ValueError(f"Bilinmeyen algoritma: {algoritma}. Seçenekler: {', '.join(TUM_ALGORITMALAR)}")
+    secilen = cozucu(algoritma)
+
+    parametreler = {}
+    if secilen.parametre("iterasyon") is not None:
+        parametreler["iterasyon"] = (iterasyon or VARSAYILAN_ITERASYON.get(algoritma)
+                                     or secilen.parametre("iterasyon").varsayilan)
+    if secilen.parametre("seed") is not None:
+        parametreler["seed"] = seed
+    adim = parametreler.get("iterasyon", len(ogrenciler))
+
+    if secilen.yerel_arama:
+        ogrenciler, firmalar = _greedy_sonucu(ogrenciler, firmalar)
+    secilen.yukle()
+    return lambda: (secilen(ogrenciler, firmalar, ayarli=ayarli, **parametreler)[0], adim)
+
+
+def olc(algoritma, ogrenciler, firmalar, seed, iterasyon=None, bellek=True, ayarli=False):
+    """Tek bir (algoritma, veri seti) ölçümü. Bellek ayrı bir çalıştırmada ölçülür (tracemalloc süreyi bozar)."""
+    calistir = calistirici_hazirla(algoritma, ogrenciler, firmalar, seed, iterasyon, ayarli)
+
+    # Algoritmaların ekrana yazdıkları ölçüme karışmasın
+    with contextlib.redirect_stdout(io.StringIO()):
+        bas = time.perf_counter()
+        sonuc, iterasyon_sayisi = calistir()
+        sure = time.perf_counter() - bas
+
+        tepe_bellek = None
+        if bellek:
+            tracemalloc.start()
+            calistir()
+            tepe_bellek = tracemalloc.get_traced_memory()[1] / 2 ** 20
+            tracemalloc.stop()
+
+    return {
+        "Sure_sn": sure,
+        "Tepe_Bellek_MB": tepe_bellek,
+        "Iterasyon": iterasyon_sayisi,
+        "Iterasyon_Hizi": iterasyon_sayisi / sure if sure > 0 else None,
+        "Skor": int(memnuniyet_skoru_hesapla(sonuc)),
+        "Yerlesen": int(sonuc['Yerleştiği_Firma'].notna().sum()),
+    }
+
+
+def benchmark_calistir(boyutlar=VARSAYILAN_BOYUTLAR, oranlar=VARSAYILAN_ORANLAR,
+                       algoritmalar=VARSAYILAN_ALGORITMALAR, seed=46, iterasyon=None, bellek=True,
+                       veri_klasoru="benchmark_veri", ilerleme=print, ayarli=False):
+    """Tüm (boyut, oran, algoritma) kombinasyonlarını ölçer; JSON'a yazılabilir sözlük döndürür."""
+    sonuclar = []
+    for ogrenci_sayisi in boyutlar:
+        for oran in oranlar:
+            firma_sayisi = firma_sayisi_hesapla(ogrenci_sayisi, oran)
+            ogrenciler, firmalar = veri_seti_hazirla(ogrenci_sayisi, firma_sayisi, seed, veri_klasoru)
+
+            for algoritma in algoritmalar:
+                olcum = olc(algoritma, ogrenciler, firmalar, seed, iterasyon, bellek, ayarli)
+                olcum = {"Algoritma": algoritma, "Ogrenci_Sayisi": ogrenci_sayisi,
+                         "Firma_Sayisi": firma_sayisi, **olcum}
+                sonuclar.append(olcum)
+                if ilerleme:
+                    ilerleme(f"{algoritma:>14} | N={ogrenci_sayisi:>8} F={firma_sayisi:>6} | "
+                             f"{olcum['Sure_sn']:9.3f} sn | skor {olcum['Skor']}")
+
+    return {
+        "Ortam": {
+            "Tarih": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "Python": platform.python_version(),
+            "NumPy": np.__version__,
+            "Pandas": pd.__version__,
+            "Platform": platform.platform(),
+            "Seed": seed,
+            "Ayarli": ayarli,
+        },
+        "Sonuclar": sonuclar,
+    }
+
+
+def karsilastir(eski, yeni, esik=0.10, min_sure_farki=MIN_SURE_FARKI):
+    """
+    İki benchmark sonucunu (algoritma, öğrenci, firma) üzerinden eşleştirir.
+    Süre veya bellek 'esik' oranından fazla arttıysa ya da skor düştüyse gerileme sayılır.
+    Eşleşen her ölçüm için bir satır içeren DataFrame döndürür ('Gerileme' sütunu).
+    """
+    def anahtar(s):
+        return s["Algoritma"], s["Ogrenci_Sayisi"], s["Firma_Sayisi"]
+
+    eski_sonuclar = {anahtar(s): s for s in eski["Sonuclar"]}
+    satirlar = []
+    for y in yeni["Sonuclar"]:
+        e = eski_sonuclar.get(anahtar(y))
+        if e is None:
+            continue
+
+        nedenler = []
+        sure_orani = y["Sure_sn"] / e["Sure_sn"] if e["Sure_sn"] > 0 else None
+        if sure_orani and sure_orani > 1 + esik and y["Sure_sn"] - e["Sure_sn"] > min_sure_farki:
+            nedenler.append("süre")
+        bellek_orani = None
+        if e.get("Tepe_Bellek_MB") and y.get("Tepe_Bellek_MB") is not None:
+            bellek_orani = y["Tepe_Bellek_MB"] / e["Tepe_Bellek_MB"]
+            if bellek_orani > 1 + esik:
+                nedenler.append("bellek")
+        if y["Skor"] < e["Skor"]:
+            nedenler.append("skor")
+
+        satirlar.append({
+            "Algoritma": y["Algoritma"], "Ogrenci_Sayisi": y["Ogrenci_Sayisi"], "Firma_Sayisi": y["Firma_Sayisi"],
+            "Eski_Sure": e["Sure_sn"], "Yeni_Sure": y["Sure_sn"], "Sure_Orani": sure_orani,
+            "Bellek_Orani": bellek_orani, "Eski_Skor": e["Skor"], "Yeni_Skor": y["Skor"],
+            "Gerileme": ", ".join(nedenler),
+        })
+    return pd.DataFrame(satirlar)
+
+
+def _importtime_ayristir(metin):
+    """-X importtime çıktısı -> {modül: (kendi süresi µs, kümülatif µs)} (sadece import satırları)."""
+    sureler = {}
+    for satir in metin.splitlines():
+        if not satir.startswith("import time:"):
+            continue
+        parcalar = satir[len("import time:"):].split("|")
+        if len(parcalar) != 3 or not parcalar[0].strip().isdigit():
+            continue  # başlık satırı
+        sureler[parcalar[2].strip()] = (int(parcalar[0]), int(parcalar[1]))
+    return sureler
+
+
+def _soguk_import(kod):
+    """Yeni bir yorumlayıcıda kodu -X importtime ile çalıştırır: (duvar süresi, importtime, hata)."""
+    klasor = os.path.dirname(os.path.abspath(__file__))
+    bas = time.perf_counter()
+    sonuc = subprocess.run([sys.executable, "-X", "importtime", "-c", kod], cwd=klasor,
+                           capture_output=True, text=True)
+    sure = time.perf_counter() - bas
+    hata = None
+    if sonuc.returncode != 0:
+        satirlar = [s for s in sonuc.stderr.splitlines() if s and not s.startswith("import time:")]
+        hata = satirlar[-1] if satirlar else f"çıkış kodu {sonuc.returncode}"
+    return sure, _importtime_ayristir(sonuc.stderr), hata
+
+
+def baslangic_olc(moduller=VARSAYILAN_BASLANGIC_MODULLERI, tekrar=5, en_agir=10):
+    """
+    Her modülün soğuk import süresini 'tekrar' kez yeni bir süreçte ölçer (en kısa olan alınır).
+    Yorumlayıcının kendi açılışı (boş süreç) ayrıca ölçülür ve Import_sn'den düşülür.
+    Sonuçta en çok süren 'en_agir' modül ve açılışta yüklenen ağır modüller (AGIR_MODULLER) yer alır.
+    Modül hata verse de (ör. streamlit dışında app) o ana kadarki importlar raporlanır.
+    """
+    bos = min(_soguk_import("pass")[0] for _ in range(tekrar))
+    sonuclar = []
+    for modul in moduller:
+        olcumler = [_soguk_import(f"import {modul}") for _ in range(tekrar)]
+        sure, importlar, hata = min(olcumler, key=lambda o: o[0])
+        en_agirlar = sorted(importlar.items(), key=lambda kv: kv[1][1], reverse=True)[:en_agir]
+        sonuclar.append({
+            "Modul": modul,
+            "Acilis_sn": sure,
+            "Import_sn": max(sure - bos, 0.0),
+            "Kumulatif_Import_sn": importlar.get(modul, (0, 0))[1] / 1e6 or None,
+            "Modul_Sayisi": len(importlar),
+            "En_Agir": [{"Modul": m, "Kendi_ms": k / 1e3, "Kumulatif_ms": c / 1e3} for m, (k, c) in en_agirlar],
+            "Yuklenen_Agir_Moduller": [m for m in AGIR_MODULLER if m in importlar],
+            "Hata": hata,
+        })
+
+    return {
+        "Ortam": {
+            "Tarih": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "Python": platform.python_version(),
+            "Platform": platform.platform(),
+            "Bos_Yorumlayici_sn": bos,
+            "Tekrar": tekrar,
+        },
+        "Sonuclar": sonuclar,
+    }
+
+
+def _liste(metin, tip):
+    return tuple(tip(x) for x in metin.split(",") if x)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Yerleştirme algoritmaları benchmark'ı")
+    alt = parser.add_subparsers(dest="komut", required=True)
+
+    p_calistir = alt.add_parser("calistir", help="Benchmark'ı çalıştırıp sonuçları JSON'a yazar")
+    p_calistir.add_argument("--boyutlar", default=",".join(map(str, VARSAYILAN_BOYUTLAR)))
+    p_calistir.add_argument("--oranlar", default=",".join(map(str, VARSAYILAN_ORANLAR)),
+                            help="firma / öğrenci oranları")
+    p_calistir.add_argument("--algoritmalar", default=",".join(VARSAYILAN_ALGORITMALAR),
+                            help=f"seçenekler: {', '.join(TUM_ALGORITMALAR)}")
+    p_calistir.add_argument("--seed", type=int, default=46)
+    p_calistir.add_argument("--iterasyon", type=int, default=None, help="heuristikler için iterasyon sayısı")
+    p_calistir.add_argument("--bellek-yok", action="store_true", help="tepe bellek ölçümünü atla (daha hızlı)")
+    p_calistir.add_argument("--ayarli", action="store_true",
+                            help="tavlama_ayari önbelleğindeki ayarlı parametreleri kullan")
+    p_calistir.add_argument("--veri-klasoru", default="benchmark_veri")
+    p_calistir.add_argument("--cikti", default="benchmark_sonuc.json")
+
+    p_karsilastir = alt.add_parser("karsilastir", help="İki sonuç dosyasını karşılaştırır")
+    p_karsilastir.add_argument("eski")
+    p_karsilastir.add_argument("yeni")
+    p_karsilastir.add_argument("--esik", type=float, default=0.10, help="izin verilen göreli artış (0.10 = %%10)")
+
+    p_baslangic = alt.add_parser("baslangic", help="Arayüzlerin soğuk açılış (import) süresini ölçer")
+    p_baslangic.add_argument("--moduller", default=",".join(VARSAYILAN_BASLANGIC_MODULLERI))
+    p_baslangic.add_argument("--tekrar", type=int, default=5, help="modül başına ölçüm (en kısası alınır)")
+    p_baslangic.add_argument("--en-agir", type=int, default=10, help="raporlanacak en yavaş import sayısı")
+    p_baslangic.add_argument("--cikti", default=None, help="sonuçları ayrıca JSON'a yaz")
+
+    args = parser.parse_args(argv)
+
+    if args.komut == "baslangic":
+        sonuc = baslangic_olc(_liste(args.moduller, str), args.tekrar, args.en_agir)
+        print(f"Boş yorumlayıcı: {sonuc['Ortam']['Bos_Yorumlayici_sn']:.3f} sn")
+        for s in sonuc["Sonuclar"]:
+            print(f"\n{s['Modul']}: açılış {s['Acilis_sn']:.3f} sn (import {s['Import_sn']:.3f} sn, "
+                  f"{s['Modul_Sayisi']} modül)" + (f"  [hata: {s['Hata']}]" if s["Hata"] else ""))
+            print("  Açılışta yüklenen ağır modüller: " + (", ".join(s["Yuklenen_Agir_Moduller"]) or "yok"))
+            for m in s["En_Agir"]:
+                print(f"  {m['Kumulatif_ms']:9.1f} ms  (kendi {m['Kendi_ms']:7.1f} ms)  {m['Modul']}")
+        if args.cikti:
+            with open(args.cikti, "w", encoding="utf-8") as f:
+                json.dump(sonuc, f, ensure_ascii=False, indent=2)
+            print(f"\nSonuçlar yazıldı: {args.cikti}")
+        return 0
+
+    if args.komut == "calistir":
+        sonuc = benchmark_calistir(_liste(args.boyutlar, int), _liste(args.oranlar, float),
+                                   _liste(args.algoritmalar, str), args.seed, args.iterasyon,
+                                   not args.bellek_yok, args.veri_klasoru, ayarli=args.ayarli)
+        with open(args.cikti, "w", encoding="utf-8") as f:
+            json.dump(sonuc, f, ensure_ascii=False, indent=2)
+        print(f"Sonuçlar yazıldı: {args.cikti}")
+        return 0
+
+    with open(args.eski, encoding="utf-8") as f:
+        eski = json.load(f)
+    with open(args.yeni, encoding="utf-8") as f:
+        yeni = json.load(f)
+    tablo = karsilastir(eski, yeni, args.esik)
+    with pd.option_context("display.width", 200, "display.max_columns", None):
+        print(tablo.to_string(index=False) if not tablo.empty else "Eşleşen ölçüm yok.")
+
+    gerilemeler = tablo[tablo["Gerileme"] != ""] if not tablo.empty else tablo
+    if len(gerilemeler):
+        print(f"\n!!! {len(gerilemeler)} gerileme bulundu.")
+        return 1
+    print("\nGerileme yok.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,321 @@
+"""
+Çözücü kaydı: her algoritma bir ad, parametre şeması ve tembel (lazy) yüklenen bir giriş
+noktası ("modul:fonksiyon") ile kaydedilir. Arayüzler, benchmark ve komut satırı çözücüleri
+buradan listeler; modül ancak çözücü ilk çalıştırıldığında import edilir.
+
+Yeni bir çözücü eklemek için arayüzlere dokunmak gerekmez:
+
+    kaydet("yeni", "Yeni Algoritma", "algo_yeni:yeni_atama",
+           (Parametre("iterasyon", int, 1000, min_deger=1),), yerel_arama=True, ilerleme=True)
+
+Giriş noktası fonksiyon(ogrenciler_df, firmalar_df, **parametreler) -> (ogrenciler, firmalar, ...)
+imzasına uymalıdır. ilerleme=True olanlar step_callback ve telemetri de alır.
+durum_giris_noktasi ("modul:fonksiyon", fonksiyon(durum, **parametreler) -> AtamaDurumu) aynı
+çözücünün DataFrame'e yazmadan dizi tabanlı durum üzerinde çalışan halidir (bkz. durum_calistir).
+ayar_kaynagi ("modul:fonksiyon", fonksiyon(ogrenciler_df, firmalar_df) -> {parametre: değer})
+verilirse o verinin profili için ayarlanmış değerler şemadaki varsayılanların yerine geçer.
+
+Komut satırı:
+    python cozucu_kayit.py listele
+    python cozucu_kayit.py coz annealing proje_veri.npz --param iterasyon=20000 --param seed=7
+"""
+import argparse
+import importlib
+import sys
+import time
+
+# Mantıksal parametrelerin komut satırındaki yazılışları
+_DOGRU = ("1", "true", "evet", "e", "yes")
+_YANLIS = ("0", "false", "hayir", "hayır", "h", "no")
+
+
+class Parametre:
+    """
+    Çözücü parametresinin şeması: tip, varsayılan (None -> çözücünün kendi varsayılanı) ve sınırlar.
+    min_dahil=False ise alt sınır açıktır (değer min_deger'den büyük olmalı); max_deger dahildir.
+    """
+
+    def __init__(self, ad, tip=int, varsayilan=None, min_deger=None, aciklama="", max_deger=None, min_dahil=True):
+        self.ad = ad
+        self.tip = tip
+        self.varsayilan = varsayilan
+        self.min_deger = min_deger
+        self.max_deger = max_deger
+        self.min_dahil = min_dahil
+        self.aciklama = aciklama
+
+    def donustur(self, deger):
+        """Değeri (komut satırından gelen metin de olabilir) tipe çevirip sınırı kontrol eder."""
+        if deger is None:
+            return None
+        if self.tip is bool and isinstance(deger, str):
+            if deger.strip().lower() not in _DOGRU + _YANLIS:
+                raise ValueError(f"{self.ad}: mantıksal değer bekleniyordu, '{deger}' verildi")
+            return deger.strip().lower() in _DOGRU
+        deger = self.tip(deger)
+        if self.min_deger is not None:
+            if self.min_dahil and deger < self.min_deger:
+                raise ValueError(f"{self.ad} en az {self.min_deger} olmalı ({deger} verildi)")
+            if not self.min_dahil and deger <= self.min_deger:
+                raise ValueError(f"{self.ad} {self.min_deger}'dan büyük olmalı ({deger} verildi)")
+        if self.max_deger is not None and deger > self.max_deger:
+            raise ValueError(f"{self.ad} en fazla {self.max_deger} olmalı ({deger} verildi)")
+        return deger
+
+    def __repr__(self):
+        return f"Parametre({self.ad!r}, {self.tip.__name__}, varsayilan={self.varsayilan!r})"
+
+
+def _giris_noktasi(metin):
+    modul, _, fonksiyon = metin.partition(":")
+    if not modul or not fonksiyon:
+        raise ValueError(f"Giriş noktası 'modul:fonksiyon' biçiminde olmalı: {metin}")
+    return modul, fonksiyon
+
+
+class Cozucu:
+    """
+    Kayıtlı bir çözücü. Fonksiyon ilk çağrıda import edilir ve saklanır.
+
+    yerel_arama: mevcut bir atamayı iyileştirir (arayüzlerde Greedy'den sonra açılır,
+                 benchmark'ta Greedy sonucundan başlatılır).
+    ilerleme:    step_callback / telemetri destekler (iptal edilebilir, ayrı süreçte çalışabilir).
+    ayar_kaynagi: veri profiline göre ayarlanmış varsayılanları veren "modul:fonksiyon" (tembel yüklenir).
+    durum_giris_noktasi: AtamaDurumu üzerinde çalışıp sonucu DataFrame'e yazmayan "modul:fonksiyon".
+    """
+
+    def __init__(self, ad, etiket, giris_noktasi, parametreler=(), yerel_arama=False, ilerleme=False,
+                 aciklama="", ayar_kaynagi=None, durum_giris_noktasi=None):
+        modul, fonksiyon = _giris_noktasi(giris_noktasi)
+        for ek in (ayar_kaynagi, durum_giris_noktasi):
+            if ek is not None:
+                _giris_noktasi(ek)
+        self.ad = ad
+        self.etiket = etiket
+        self.modul = modul
+        self.fonksiyon = fonksiyon
+        self.parametreler = tuple(parametreler)
+        self.yerel_arama = yerel_arama
+        self.ilerleme = ilerleme
+        self.aciklama = aciklama
+        self.ayar_kaynagi = ayar_kaynagi
+        self.durum_giris_noktasi = durum_giris_noktasi
+        self._fonksiyon = None
+        self._ayar_fonksiyonu = None
+        self._durum_fonksiyonu = None
+
+    @property
+    def yuklu(self):
+        return self._fonksiyon is not None
+
+    def yukle(self):
+        if self._fonksiyon is None:
+            self._fonksiyon = getattr(importlib.import_module(self.modul), self.fonksiyon)
+        return self._fonksiyon
+
+    def parametre(self, ad):
+        for p in self.parametreler:
+            if p.ad == ad:
+                return p
+        return None
+
+    def varsayilanlar(self, ogrenciler_df=None, firmalar_df=None):
+        """
+        Şemadaki varsayılanlar. Veri verilirse ve ayar kaynağı o verinin profili için ayarlanmış
+        değerler döndürüyorsa (bkz. tavlama_ayari) şemada olan parametreler onlarla değiştirilir.
+        """
+        varsayilan = {p.ad: p.varsayilan for p in self.parametreler}
+        if ogrenciler_df is not None and self.ayar_kaynagi is not None:
+            if self._ayar_fonksiyonu is None:
+                modul, fonksiyon = _giris_noktasi(self.ayar_kaynagi)
+                self._ayar_fonksiyonu = getattr(importlib.import_module(modul), fonksiyon)
+            ayarli = self._ayar_fonksiyonu(ogrenciler_df, firmalar_df)
+            varsayilan.update({ad: deger for ad, deger in ayarli.items() if ad in varsayilan})
+        return varsayilan
+
+    def parametreleri_hazirla(self, ogrenciler_df=None, firmalar_df=None, **degerler):
+        """
+        Şemaya göre dönüştürülmüş parametreler; verilmeyenler varsayılanla (veri verilirse ayarlı
+        varsayılanla), None olanlar hiç verilmez.
+        """
+        bilinmeyen = set(degerler) - {p.ad for p in self.parametreler}
+        if bilinmeyen:
+            raise ValueError(f"{self.ad} şu parametreleri almaz: {', '.join(sorted(bilinmeyen))}")
+        varsayilan = self.varsayilanlar(ogrenciler_df, firmalar_df)
+        hazir = {}
+        for p in self.parametreler:
+            deger = p.donustur(degerler.get(p.ad, varsayilan[p.ad]))
+            if deger is not None:
+                hazir[p.ad] = deger
+        return hazir
+
+    def calistir(self, ogrenciler_df, firmalar_df, step_callback=None, telemetri=None, ayarli=True, **parametreler):
+        """
+        (ogrenciler, firmalar) döndürür. step_callback / telemetri sadece ilerleme destekleyenlere verilir.
+        ayarli=False ise ayar kaynağı kullanılmaz, verilmeyen parametreler şemadaki varsayılanlarla çalışır.
+        """
+        kwargs = self._calistirma_parametreleri(ogrenciler_df, firmalar_df, step_callback, telemetri, ayarli,
+                                                parametreler)
+        sonuc = self.yukle()(ogrenciler_df, firmalar_df, **kwargs)
+        return sonuc[0], sonuc[1]
+
+    def durum_calistir(self, ogrenciler_df, firmalar_df, step_callback=None, telemetri=None, ayarli=True,
+                       **parametreler):
+        """
+        calistir() gibi, ama sonucu DataFrame'lere yazmadan AtamaDurumu olarak döndürür (ayrı süreçte
+        çalışırken sadece atama / kontenjan dizileri geri gönderilir). durum_giris_noktasi olmayan
+        çözücülerde calistir() sonucu duruma çevrilir.
+        """
+        from atama_durumu import AtamaDurumu
+
+        if self.durum_giris_noktasi is None:
+            return AtamaDurumu.dataframe_den(*self.calistir(ogrenciler_df, firmalar_df, step_callback, telemetri,
+                                                            ayarli, **parametreler))
+        kwargs = self._calistirma_parametreleri(ogrenciler_df, firmalar_df, step_callback, telemetri, ayarli,
+                                                parametreler)
+        if self._durum_fonksiyonu is None:
+            modul, fonksiyon = _giris_noktasi(self.durum_giris_noktasi)
+            self._durum_fonksiyonu = getattr(importlib.import_module(modul), fonksiyon)
+        durum = AtamaDurumu.dataframe_den(ogrenciler_df.reset_index(drop=True), firmalar_df.reset_index(drop=True))
+        return self._durum_fonksiyonu(durum, **kwargs)
+
+    def _calistirma_parametreleri(self, ogrenciler_df, firmalar_df, step_callback, telemetri, ayarli, parametreler):
+        kwargs = self.parametreleri_hazirla(ogrenciler_df if ayarli else None, firmalar_df, **parametreler)
+        if self.ilerleme:
+            if step_callback is not None:
+                kwargs["step_callback"] = step_callback
+            if telemetri is not None:
+                kwargs["telemetri"] = telemetri
+        return kwargs
+
+    __call__ = calistir
+
+    def __repr__(self):
+        return f"Cozucu({self.ad!r}, {self.modul}:{self.fonksiyon})"
+
+
+# Kayıt sırası arayüzlerdeki buton / sütun sırasıdır
+_KAYIT = {}
+
+
+def kaydet(ad, etiket, giris_noktasi, parametreler=(), **secenekler):
+    if ad in _KAYIT:
+        raise ValueError(f"Çözücü zaten kayıtlı: {ad}")
+    _KAYIT[ad] = Cozucu(ad, etiket, giris_noktasi, parametreler, **secenekler)
+    return _KAYIT[ad]
+
+
+def cozucu(ad):
+    if ad not in _KAYIT:
+        raise ValueError(f"Bilinmeyen algoritma: {ad}. Seçenekler: {', '.join(_KAYIT)}")
+    return _KAYIT[ad]
+
+
+def cozuculer(yerel_arama=None, ilerleme=None):
+    """Kayıtlı çözücüler (kayıt sırasıyla); yerel_arama / ilerleme verilirse onlara göre süzülür."""
+    return [c for c in _KAYIT.values()
+            if (yerel_arama is None or c.yerel_arama == yerel_arama)
+            and (ilerleme is None or c.ilerleme == ilerleme)]
+
+
+def cozucu_adlari(**suzgec):
+    return tuple(c.ad for c in cozuculer(**suzgec))
+
+
+# --- YERLEŞİK ÇÖZÜCÜLER ---
+def _iterasyon(varsayilan):
+    return Parametre("iterasyon", int, varsayilan, min_deger=1, aciklama="iterasyon sayısı")
+
+
+_SEED = Parametre("seed", int, None, aciklama="rastgelelik seed'i (boşsa rastgele)")
+
+kaydet("greedy", "Greedy", "algo_greedy:greedy_atama",
+       aciklama="GNO sırasıyla ilk boş tercihe yerleştirme")
+kaydet("stabil", "Stable Matching", "algo_stable_matching:stabil_atama",
+       (Parametre("oncelik", str, None, aciklama="firma önceliği sütunu, büyük öncelikli (boşsa GNO)"),),
+       aciklama="Öğrenci öneren ertelenmiş kabul (kararlı eşleşme)")
+kaydet("hill_climbing", "Hill Climbing", "algo_heuristic_hill_climbing:heuristic_atama",
+       (_iterasyon(3000), _SEED), yerel_arama=True, ilerleme=True,
+       aciklama="Sadece iyileştiren MOVE/SWAP hamleleri",
+       durum_giris_noktasi="algo_heuristic_hill_climbing:tepe_tirmanma")
+kaydet("annealing", "Simulated Annealing", "algo_heuristic_annealing:heuristic_atama",
+       (_iterasyon(10000), _SEED,
+        Parametre("uyarlamali", bool, False, aciklama="kabul oranına göre soğutma"),
+        Parametre("durgunluk_limiti", int, None, min_deger=1, aciklama="gelişmesiz iterasyonda erken dur"),
+        Parametre("yeniden_isitma", int, None, min_deger=1, aciklama="gelişmesiz iterasyonda yeniden ısıt"),
+        Parametre("sicaklik", float, None, min_deger=0, aciklama="başlangıç sıcaklığı (boşsa 150)"),
+        Parametre("soguma_orani", float, None, min_deger=0, max_deger=1, min_dahil=False,
+                  aciklama="iterasyon başına sıcaklık çarpanı, (0, 1] (boşsa 0.99)"),
+        Parametre("tercih_egilimi", float, None, min_deger=0, min_dahil=False,
+                  aciklama="k. tercihe hamle ağırlığı egilim**(k-1), pozitif (boşsa 1)")),
+       yerel_arama=True, ilerleme=True, aciklama="Sıcaklıkla kötüleştiren hamleleri de kabul eder",
+       ayar_kaynagi="tavlama_ayari:ayarli_parametreler",
+       durum_giris_noktasi="algo_heuristic_annealing:tavlama_durumu")
+kaydet("tabu", "Tabu Search", "algo_heuristic_tabu:heuristic_atama",
+       (_iterasyon(1000), _SEED,
+        Parametre("aday_sayisi", int, 200, min_deger=1, aciklama="adım başına değerlendirilen hamle"),
+        Parametre("tabu_suresi", int, None, min_deger=1, aciklama="yer değiştiren öğrencinin tabu süresi")),
+       yerel_arama=True, ilerleme=True, aciklama="Tabu listeli en iyi aday hamle",
+       durum_giris_noktasi="algo_heuristic_tabu:tabu_arama")
+kaydet("optimal", "Optimal (Kesin Çözüm)", "algo_optimal:optimal_atama",
+       aciklama="Min-cost flow ile en yüksek memnuniyet")
+
+
+# --- KOMUT SATIRI ---
+def _parametre_ayristir(ifadeler):
+    degerler = {}
+    for ifade in ifadeler:
+        ad, esit, deger = ifade.partition("=")
+        if not esit:
+            raise ValueError(f"Parametre 'ad=deger' biçiminde olmalı: {ifade}")
+        degerler[ad.strip()] = deger.strip()
+    return degerler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kayıtlı yerleştirme çözücüleri")
+    alt = parser.add_subparsers(dest="komut", required=True)
+    alt.add_parser("listele", help="Çözücüleri ve parametrelerini listeler")
+
+    p_coz = alt.add_parser("coz", help="Bir veri setini (.npz) seçilen çözücüyle çözer")
+    p_coz.add_argument("algoritma", help=f"seçenekler: {', '.join(_KAYIT)}")
+    p_coz.add_argument("veri", help="veri_formati ile kaydedilmiş veri seti (.npz)")
+    p_coz.add_argument("--param", action="append", default=[], metavar="AD=DEGER")
+    p_coz.add_argument("--cikti", default=None, help="sonucu (atamayla) bu .npz dosyasına kaydet")
+    args = parser.parse_args(argv)
+
+    if args.komut == "listele":
+        for c in cozuculer():
+            print(f"{c.ad:<15}{c.etiket} - {c.aciklama}")
+            for p in c.parametreler:
+                print(f"{'':<17}{p.ad} ({p.tip.__name__}, varsayılan {p.varsayilan}): {p.aciklama}")
+        return 0
+
+    import veri_formati
+    from skorlama import memnuniyet_skoru_hesapla
+
+    secilen = cozucu(args.algoritma)
+    parametreler = _parametre_ayristir(args.param)
+    ogrenciler, firmalar = veri_formati.veri_yukle(args.veri)
+
+    # Yerel aramalar mevcut atamayı iyileştirir; dosyada atama yoksa önce Greedy çalışır
+    if secilen.yerel_arama and ("Yerleştiği_Firma" not in ogrenciler.columns
+                                or ogrenciler["Yerleştiği_Firma"].isna().all()):
+        print("Girdide atama yok, Greedy başlangıcı kullanılıyor.")
+        ogrenciler, firmalar = cozucu("greedy")(ogrenciler, firmalar)
+
+    bas = time.perf_counter()
+    ogrenciler, firmalar = secilen(ogrenciler, firmalar, **parametreler)
+    sure = time.perf_counter() - bas
+
+    yerlesen = int(ogrenciler["Yerleştiği_Firma"].notna().sum())
+    print(f"{secilen.etiket}: skor {memnuniyet_skoru_hesapla(ogrenciler)}, "
+          f"yerleşen {yerlesen}/{len(ogrenciler)}, süre {sure:.3f} sn")
+    if args.cikti:
+        veri_formati.veri_kaydet(args.cikti, ogrenciler, firmalar)
+        print(f"Sonuç yazıldı: {args.cikti}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,21 +5,27 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QPushButton, QLabel, QTableWidget,
                              QTableWidgetItem, QHeaderView, QMessageBox, QTabWidget,
                              QFrame, QProgressBar, QStatusBar, QGraphicsDropShadowEffect,
-                             QTextEdit, QLineEdit, QHeaderView)
-from PyQt5.QtCore import Qt, pyqtSignal, QThread
+                             QTextEdit, QLineEdit, QHeaderView, QFileDialog, QTableView,
+                             QAbstractItemView)
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QTimer
 from PyQt5.QtGui import QFont, QColor, QIntValidator
 
+from tablo_modeli import DataFrameModeli, SiralaFiltreModeli
+
 # --- MODÜL İMPORTLARI ---
 # İsim çakışmalarını önlemek için fonksiyonları yeniden adlandırarak (alias) alıyoruz.
 try:
     from veri_olustur import veri_seti_olustur
-    from algo_greedy import greedy_atama, simulasyon_dongusu
+    from veri_formati import veri_yukle, veri_kaydet
+    from atama_durumu import AtamaDurumu
 
-    # Annealing algoritması
-    from algo_heuristic_annealing import heuristic_atama as run_annealing, memnuniyet_skoru_hesapla
+    # Ortak (vektörel) puanlama
+    from skorlama import memnuniyet_skoru_hesapla
 
-    # Hill Climbing algoritması
-    from algo_heuristic_hill_climbing import heuristic_atama as run_hill_climbing
+    # Çözücüler kayıttan listelenir, modülleri ilk çalıştırmada yüklenir.
+    # İlerleme destekleyenler (Hill Climbing, Annealing, Tabu) ayrı süreçte çalışır.
+    from cozucu_kayit import cozucu, cozuculer
+    from surec_calistirici import SurecIsi, sonuclari_kur
 
 except ImportError as e:
     print(f"KRİTİK HATA: Modüller eksik! ({e})")
@@ -30,59 +36,90 @@ except ImportError as e:
         return pd.DataFrame(), pd.DataFrame()
 
 
-    def greedy_atama(*args, **kwargs):
+    def veri_yukle(*args, **kwargs):
         return pd.DataFrame(), pd.DataFrame()
 
 
-    def simulasyon_dongusu(*args, **kwargs):
-        return pd.DataFrame(), pd.DataFrame(), []
-
-
-    def run_annealing(*args, **kwargs):
-        return pd.DataFrame(), pd.DataFrame()
+    def veri_kaydet(*args, **kwargs):
+        return None
 
 
-    def run_hill_climbing(*args, **kwargs):
-        return pd.DataFrame(), pd.DataFrame()
+    def cozuculer(*args, **kwargs):
+        return []
 
 
     def memnuniyet_skoru_hesapla(*args):
         return 0
 
 
-# --- WORKER THREAD (GUI DONMAMASI İÇİN) ---
-class HeuristicWorker(QThread):
+# Çözücü butonlarının simgeleri (kayıtta olup burada olmayanlar varsayılan simgeyle gösterilir)
+ALGORITMA_SIMGELERI = {"greedy": "🚀", "stabil": "🤝", "hill_climbing": "⛰️", "annealing": "🔥", "tabu": "🧭", "optimal": "🎯"}
+
+
+# --- WORKER SÜRECİ (GUI DONMAMASI İÇİN) ---
+class HeuristicWorker(QObject):
+    """
+    Çözücüyü ayrı bir süreçte (surec_calistirici.SurecIsi) çalıştırır: saf Python döngüsü
+    arayüzle GIL paylaşmaz. GUI iş parçacığı sadece mesaj kuyruğunu zamanlayıcıyla yoklar.
+    İlerleme mesajları zaman bazlı seyreltilir (10 Hz) ve mevcut / en iyi skoru taşır;
+    sonuç DataFrame yerine atama / kontenjan dizileri olarak gelir.
+    """
     progress_signal = pyqtSignal(int)
+    score_signal = pyqtSignal(object, object)  # mevcut skor, en iyi skor
     finished_signal = pyqtSignal(object, object, float, str)
     error_signal = pyqtSignal(str)
+    cancelled_signal = pyqtSignal(str)
 
-    def __init__(self, target_function, ogrenciler, firmalar, iterasyon, algo_name):
-        super().__init__()
-        self.target_function = target_function
+    def __init__(self, ogrenciler, firmalar, iterasyon, algo_name, parent=None):
+        super().__init__(parent)
         self.ogrenciler = ogrenciler
         self.firmalar = firmalar
         self.iterasyon = iterasyon
         self.algo_name = algo_name
+        self.is_ = None
+        self.timer = QTimer(self)
+        self.timer.setInterval(50)
+        self.timer.timeout.connect(self.yokla)
 
-    def run(self):
-        t_start = time.time()
+    def start(self):
         try:
-            def callback(step):
-                # Yüzdelik ilerleme hesabı
-                if self.iterasyon > 0:
-                    yuzde = int((step / self.iterasyon) * 100)
-                    self.progress_signal.emit(yuzde)
-
-            h_ogr, h_frm = self.target_function(
-                self.ogrenciler,
-                self.firmalar,
-                iterasyon=self.iterasyon,
-                step_callback=callback
-            )
-            sure = time.time() - t_start
-            self.finished_signal.emit(h_ogr, h_frm, sure, self.algo_name)
+            self.is_ = SurecIsi(self.algo_name, self.ogrenciler, self.firmalar, self.iterasyon).baslat()
         except Exception as e:
             self.error_signal.emit(str(e))
+            return
+        self.timer.start()
+
+    def cancel(self):
+        if self.is_ is not None:
+            self.is_.iptal_et()
+
+    def durdur(self):
+        """Süreci beklemeden sonlandırır (kapat() süreç bitene kadar döner); sonra sinyal yayınlanmaz."""
+        self.timer.stop()
+        if self.is_ is not None:
+            self.is_.kapat()
+
+    def yokla(self):
+        for mesaj in self.is_.mesajlar():
+            if mesaj[0] == "ilerleme":
+                _, adim, skor, en_iyi = mesaj
+                # Yüzdelik ilerleme hesabı
+                if self.iterasyon > 0:
+                    self.progress_signal.emit(int((adim / self.iterasyon) * 100))
+                self.score_signal.emit(skor, en_iyi)
+                continue
+
+            self.timer.stop()
+            self.is_.kapat()
+            if mesaj[0] == "bitti":
+                _, atama, kontenjan, sure = mesaj
+                h_ogr, h_frm = sonuclari_kur(self.ogrenciler, self.firmalar, atama, kontenjan)
+                self.finished_signal.emit(h_ogr, h_frm, sure, self.algo_name)
+            elif mesaj[0] == "iptal":
+                self.cancelled_signal.emit(self.algo_name)
+            else:
+                self.error_signal.emit(mesaj[1])
+            return
 
 
 # --- GİRİŞ EKRANI ---
@@ -145,10 +182,15 @@ class ModernProjeArayuz(QMainWindow):
         self.sonuc_ogrenciler = None
         self.sonuc_firmalar = None
 
-        # İstatistik Tutucular (Analiz İçin)
-        self.scores = {"Greedy": 0, "HillClimb": 0, "Annealing": 0}
-        self.times = {"Greedy": 0, "HillClimb": 0, "Annealing": 0}
-        self.iters = {"Greedy": 1, "HillClimb": 3000, "Annealing": 5000}  # Varsayılan iterasyonlar
+        # Kayıtlı çözücüler (butonlar ve karşılaştırma sütunları bu sırayla)
+        self.cozuculer = cozuculer()
+
+        # İstatistik Tutucular (Analiz İçin) - çözücü adına göre
+        self.scores = {c.ad: 0 for c in self.cozuculer}
+        self.times = {c.ad: 0 for c in self.cozuculer}
+        self.yerlesenler = {c.ad: None for c in self.cozuculer}
+        # Varsayılan iterasyonlar (kayıttaki şemadan; tek geçişli çözücüler için 1)
+        self.iters = {c.ad: c.varsayilanlar().get("iterasyon") or 1 for c in self.cozuculer}
 
         self.init_ui()
         self.apply_styles()
@@ -208,17 +250,24 @@ class ModernProjeArayuz(QMainWindow):
 
         # Menü Butonları
         self.btn_veri = self.create_button("🎲  Veri Seti Oluştur", self.veri_uret_tikla)
-        self.btn_greedy = self.create_button("🚀  Greedy Algoritması", self.greedy_calistir, False)
-        self.btn_hill = self.create_button("⛰️  Hill Climbing", lambda: self.heuristic_baslat("HillClimb"), False)
-        self.btn_annealing = self.create_button("🔥  Simulated Annealing", lambda: self.heuristic_baslat("Annealing"),
-                                                False)
+        self.btn_yukle = self.create_button("📂  Veri Yükle (.npz)", self.veri_yukle_tikla)
+        self.btn_kaydet = self.create_button("💾  Kaydet (.npz)", self.veri_kaydet_tikla, False)
+        # Her kayıtlı çözücü için bir buton: ilerleme destekleyenler süreçte, diğerleri doğrudan çalışır
+        self.algo_butonlari = {}
+        for c in self.cozuculer:
+            calistir = self.heuristic_baslat if c.ilerleme else self.cozucu_calistir
+            self.algo_butonlari[c.ad] = self.create_button(
+                f"{ALGORITMA_SIMGELERI.get(c.ad, '▶️')}  {c.etiket}", lambda checked=False, ad=c.ad, f=calistir: f(ad), False)
+        self.btn_iptal = self.create_button("⛔  Çalışanı İptal Et", self.heuristic_iptal, False)
         self.btn_analiz = self.create_button("📊  Simülasyon & Analiz", self.analiz_sayfasini_ac, False)
         self.btn_reset = self.create_button("🔄  Sistemi Sıfırla", self.sistemi_sifirla)
 
         left_layout.addWidget(self.btn_veri)
-        left_layout.addWidget(self.btn_greedy)
-        left_layout.addWidget(self.btn_hill)
-        left_layout.addWidget(self.btn_annealing)
+        left_layout.addWidget(self.btn_yukle)
+        left_layout.addWidget(self.btn_kaydet)
+        for btn in self.algo_butonlari.values():
+            left_layout.addWidget(btn)
+        left_layout.addWidget(self.btn_iptal)
         left_layout.addWidget(self.btn_analiz)
         left_layout.addStretch()
         left_layout.addWidget(self.btn_reset)
@@ -297,10 +346,21 @@ class ModernProjeArayuz(QMainWindow):
         self.tabs_data = QTabWidget()
         self.tabs_data.setStyleSheet(self.get_tab_style())
 
-        self.tab_ogrenci = QTableWidget()
-        self.tab_firma = QTableWidget()
-        self.setup_table(self.tab_ogrenci)
-        self.setup_table(self.tab_firma)
+        # Büyük listeler için sanal model: sadece görünen satırlar çizilir
+        self.tab_ogrenci = self.veri_tablosu_olustur()
+        self.tab_firma = self.veri_tablosu_olustur()
+
+        # Arama kutusu (her iki listeyi de filtreler, yazarken 250 ms bekler)
+        self.txt_filtre = QLineEdit()
+        self.txt_filtre.setPlaceholderText("🔎 Listede ara (tüm sütunlar)...")
+        self.txt_filtre.setStyleSheet(
+            "background: white; border: 1px solid #dcdde1; border-radius: 5px; padding: 6px; color: #2c3e50;")
+        self.filtre_zamanlayici = QTimer(self)
+        self.filtre_zamanlayici.setSingleShot(True)
+        self.filtre_zamanlayici.setInterval(250)
+        self.filtre_zamanlayici.timeout.connect(self.filtre_uygula)
+        self.txt_filtre.textChanged.connect(self.filtre_zamanlayici.start)
+        layout.addWidget(self.txt_filtre)
 
         self.tabs_data.addTab(self.tab_ogrenci, "📄 Öğrenci Listesi")
         self.tabs_data.addTab(self.tab_firma, "🏢 Firmalar ve Kontenjanlar")
@@ -360,11 +420,11 @@ class ModernProjeArayuz(QMainWindow):
 
         # Karşılaştırma Tablosu
         self.table_comp = QTableWidget()
-        self.table_comp.setColumnCount(4)
+        self.table_comp.setColumnCount(1 + len(self.cozuculer))
         self.table_comp.setRowCount(4)  # 4 Kriter
 
         # Proje İsteri: Greedy vs Heuristik Kıyaslama Tablosu [cite: 55, 56, 57, 58]
-        self.table_comp.setHorizontalHeaderLabels(["Kriter", "Greedy", "Hill Climbing", "Simulated Annealing"])
+        self.table_comp.setHorizontalHeaderLabels(["Kriter"] + [c.etiket for c in self.cozuculer])
         self.table_comp.setVerticalHeaderLabels(["1", "2", "3", "4"])
 
         # Satır Başlıkları
@@ -430,23 +490,34 @@ class ModernProjeArayuz(QMainWindow):
 
     def setup_table(self, table):
         table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         table.setAlternatingRowColors(True)
         table.setStyleSheet(
-            "QTableWidget { background-color: white; border: none; gridline-color: #ecf0f1; } QHeaderView::section { background-color: #34495e; color: white; padding: 5px; }")
+            "QTableView { background-color: white; border: none; gridline-color: #ecf0f1; } QHeaderView::section { background-color: #34495e; color: white; padding: 5px; }")
 
     def update_card(self, card, val):
         for lbl in card.findChildren(QLabel):
             if lbl.objectName() == "CardValue": lbl.setText(str(val))
 
+    def veri_tablosu_olustur(self):
+        """DataFrame'i sanal model + filtre proxy'si üzerinden gösteren tablo."""
+        table = QTableView()
+        table.setModel(SiralaFiltreModeli(DataFrameModeli(parent=table), parent=table))
+        # Başlığa tıklayınca sıralama (model NumPy argsort ile sıralar)
+        table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        table.setSortingEnabled(True)
+        self.setup_table(table)
+        return table
+
     def tabloyu_doldur(self, df, table):
         if df is None: return
-        table.setRowCount(df.shape[0])
-        table.setColumnCount(df.shape[1])
-        table.setHorizontalHeaderLabels(df.columns)
-        for i in range(df.shape[0]):
-            for j in range(df.shape[1]):
-                table.setItem(i, j, QTableWidgetItem(str(df.iloc[i, j])))
+        # Hücre nesnesi oluşturulmaz: model sütun dizilerini tutar, görünüm sadece görünen satırları ister
+        table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        table.model().sourceModel().veri_ata(df)
+
+    def filtre_uygula(self):
+        for table in (self.tab_ogrenci, self.tab_firma):
+            table.model().filtrele(self.txt_filtre.text())
 
     def apply_styles(self):
         self.setStyleSheet("""
@@ -460,114 +531,175 @@ class ModernProjeArayuz(QMainWindow):
         """)
 
     # --- EYLEMLER ---
+    def calisan_isi_durdur(self):
+        """
+        Çalışan yerel arama sürecini durdurur. Veri değişmeden önce çağrılır; yoksa eski verinin
+        sonucu yeni verinin üstüne yazılır ve butonlar açılınca ikinci bir koşu bunu ezebilir.
+        """
+        if getattr(self, 'worker', None) is not None:
+            self.worker.durdur()
+            self.worker = None
+        self.btn_iptal.setEnabled(False)
+        self.pbar.setValue(0)
+
     def veri_uret_tikla(self):
         try:
             o_sayi = int(self.txt_ogrenci_sayisi.text())
             f_sayi = int(self.txt_firma_sayisi.text())
-            self.df_firmalar, self.df_ogrenciler = veri_seti_olustur(o_sayi, f_sayi)
+            firmalar, ogrenciler = veri_seti_olustur(o_sayi, f_sayi)
+            self.calisan_isi_durdur()
+            self.df_firmalar, self.df_ogrenciler = firmalar, ogrenciler
+            self.yeni_veri_goster(f"Hazır: {o_sayi} Öğrenci, {f_sayi} Firma")
 
-            self.update_card(self.card_total, len(self.df_ogrenciler))
-            self.tabloyu_doldur(self.df_ogrenciler, self.tab_ogrenci)
-            self.tabloyu_doldur(self.df_firmalar, self.tab_firma)
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", str(e))
 
-            self.btn_greedy.setEnabled(True)
-            self.btn_analiz.setEnabled(True)
-            self.lbl_status.setText(f"Hazır: {o_sayi} Öğrenci, {f_sayi} Firma")
-            self.tabs_main.setCurrentIndex(0)
+    def veri_yukle_tikla(self):
+        yol, _ = QFileDialog.getOpenFileName(self, "Veri Seti Yükle", "", "Veri Seti (*.npz)")
+        if not yol:
+            return
+        try:
+            ogrenciler, firmalar = veri_yukle(yol)
+            self.calisan_isi_durdur()
+            self.df_ogrenciler, self.df_firmalar = ogrenciler, firmalar
+            self.sonuc_ogrenciler = None
+            self.sonuc_firmalar = None
+            self.yeni_veri_goster(f"Yüklendi: {len(self.df_ogrenciler)} Öğrenci, {len(self.df_firmalar)} Firma")
 
-            # Veri yeni üretildi, eski skorları sıfırla
-            self.scores = {k: 0 for k in self.scores}
-            self.times = {k: 0 for k in self.times}
-            self.update_karsilastirma_tablosu()
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", str(e))
+
+    def veri_kaydet_tikla(self):
+        yol, _ = QFileDialog.getSaveFileName(self, "Kaydet", "proje_veri.npz", "Veri Seti (*.npz)")
+        if not yol:
+            return
+        try:
+            # Sonuç varsa atamayla birlikte, yoksa ham veri kaydedilir
+            if self.sonuc_ogrenciler is not None:
+                veri_kaydet(yol, self.sonuc_ogrenciler, self.sonuc_firmalar)
+            else:
+                veri_kaydet(yol, self.df_ogrenciler, self.df_firmalar)
+            self.lbl_status.setText(f"Kaydedildi: {yol}")
 
         except Exception as e:
             QMessageBox.critical(self, "Hata", str(e))
 
-    def greedy_calistir(self):
-        self.lbl_status.setText("İşleniyor: Greedy Algoritması...")
+    def yeni_veri_goster(self, durum_mesaji):
+        self.update_card(self.card_total, len(self.df_ogrenciler))
+        self.tabloyu_doldur(self.df_ogrenciler, self.tab_ogrenci)
+        self.tabloyu_doldur(self.df_firmalar, self.tab_firma)
+
+        # Yerel aramalar bir başlangıç çözümü bekler
+        for c in self.cozuculer:
+            self.algo_butonlari[c.ad].setEnabled(not c.yerel_arama)
+        self.btn_analiz.setEnabled(True)
+        self.btn_kaydet.setEnabled(True)
+        self.lbl_status.setText(durum_mesaji)
+        self.tabs_main.setCurrentIndex(0)
+
+        # Veri değişti, eski skorları sıfırla
+        self.scores = {k: 0 for k in self.scores}
+        self.times = {k: 0 for k in self.times}
+        self.yerlesenler = {k: None for k in self.yerlesenler}
+        self.update_karsilastirma_tablosu()
+
+    def cozucu_calistir(self, ad):
+        """İlerleme bildirmeyen (tek geçişli) çözücüyü arayüz iş parçacığında çalıştırır."""
+        secilen = cozucu(ad)
+        self.lbl_status.setText(f"İşleniyor: {secilen.etiket}...")
         QApplication.processEvents()
 
+        # Yerel arama ise mevcut çözümden, değilse ham veriden başlar
+        input_ogr, input_frm = self.df_ogrenciler, self.df_firmalar
+        if secilen.yerel_arama and self.sonuc_ogrenciler is not None:
+            input_ogr, input_frm = self.sonuc_ogrenciler, self.sonuc_firmalar
+
         t1 = time.time()
         try:
-            self.sonuc_ogrenciler, self.sonuc_firmalar = greedy_atama(self.df_ogrenciler, self.df_firmalar)
-            t2 = time.time()
+            sonuc_ogr, sonuc_frm = secilen(input_ogr, input_frm)
+            sure = time.time() - t1
+            self.sonucu_uygula(ad, sonuc_ogr, sonuc_frm, sure)
 
-            sure = t2 - t1
-            skor = memnuniyet_skoru_hesapla(self.sonuc_ogrenciler)
+            # Artık bir başlangıç çözümü var, yerel aramalar açılabilir
+            self.heuristic_butonlarini_ac()
 
-            # İstatistik Kaydı
-            self.scores["Greedy"] = skor
-            self.times["Greedy"] = sure
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", str(e))
 
-            yerlesen = self.sonuc_ogrenciler['Yerleştiği_Firma'].notna().sum()
-            self.update_card(self.card_placed, yerlesen)
-            self.update_card(self.card_score, skor)
-            self.update_card(self.card_time, f"{sure:.4f} sn")
+    def sonucu_uygula(self, ad, sonuc_ogr, sonuc_frm, sure):
+        self.sonuc_ogrenciler = sonuc_ogr
+        self.sonuc_firmalar = sonuc_frm
+        skor = memnuniyet_skoru_hesapla(sonuc_ogr)
+        yerlesen = sonuc_ogr['Yerleştiği_Firma'].notna().sum()
 
-            self.tabloyu_doldur(self.sonuc_ogrenciler, self.tab_ogrenci)
-            self.tabloyu_doldur(self.sonuc_firmalar, self.tab_firma)
+        # İstatistik Kaydı
+        self.scores[ad] = skor
+        self.times[ad] = sure
+        self.yerlesenler[ad] = yerlesen
 
-            self.btn_hill.setEnabled(True)
-            self.btn_annealing.setEnabled(True)
-            self.lbl_status.setText("Tamamlandı: Greedy")
+        self.update_card(self.card_placed, yerlesen)
+        self.update_card(self.card_score, skor)
+        self.update_card(self.card_time, f"{sure:.4f} sn" if sure < 1 else f"{sure:.2f} sn")
 
-            # Karşılaştırma tablosunu anlık güncelle
-            self.update_karsilastirma_tablosu()
+        self.tabloyu_doldur(sonuc_ogr, self.tab_ogrenci)
+        self.tabloyu_doldur(sonuc_frm, self.tab_firma)
 
-        except Exception as e:
-            QMessageBox.critical(self, "Hata", str(e))
+        self.lbl_status.setText(f"Tamamlandı: {cozucu(ad).etiket}")
+        # Karşılaştırma tablosunu anlık güncelle
+        self.update_karsilastirma_tablosu()
 
     def heuristic_baslat(self, algo_tipi):
-        self.lbl_status.setText(f"İşleniyor: {algo_tipi}...")
-        self.btn_greedy.setEnabled(False)
-        self.btn_hill.setEnabled(False)
-        self.btn_annealing.setEnabled(False)
+        etiket = cozucu(algo_tipi).etiket
+        self.lbl_status.setText(f"İşleniyor: {etiket}...")
+        for btn in self.algo_butonlari.values():
+            btn.setEnabled(False)
         self.pbar.setValue(0)
 
         # Hangi veri? (Greedy sonucu varsa ondan devam et, yoksa sıfırdan)
         input_ogr = self.sonuc_ogrenciler if self.sonuc_ogrenciler is not None else self.df_ogrenciler
         input_frm = self.sonuc_firmalar if self.sonuc_firmalar is not None else self.df_firmalar
 
-        if algo_tipi == "HillClimb":
-            target_func = run_hill_climbing
-            iterasyon = self.iters["HillClimb"]
-        else:
-            target_func = run_annealing
-            iterasyon = self.iters["Annealing"]
+        # Çözücü süreçte kayıttaki adıyla bulunur (hill_climbing / annealing / tabu).
+        # Bu veri profili için ayarlanmış bir bütçe varsa (tavlama_ayari) o kullanılır.
+        if cozucu(algo_tipi).ayar_kaynagi is not None:
+            self.iters[algo_tipi] = cozucu(algo_tipi).varsayilanlar(input_ogr, input_frm)["iterasyon"]
+        iterasyon = self.iters[algo_tipi]
 
-        self.worker = HeuristicWorker(target_func, input_ogr, input_frm, iterasyon, algo_tipi)
+        self.worker = HeuristicWorker(input_ogr, input_frm, iterasyon, algo_tipi, self)
         self.worker.progress_signal.connect(lambda v: self.pbar.setValue(v))
+        self.worker.score_signal.connect(
+            lambda skor, en_iyi: self.lbl_status.setText(f"İşleniyor: {etiket}... Skor {skor} (En iyi {en_iyi})"))
         self.worker.finished_signal.connect(self.on_heuristic_finished)
         self.worker.error_signal.connect(self.on_heuristic_error)
+        self.worker.cancelled_signal.connect(self.on_heuristic_cancelled)
+        self.btn_iptal.setEnabled(True)
         self.worker.start()
 
-    def on_heuristic_finished(self, h_ogr, h_frm, sure, algo_name):
-        self.sonuc_ogrenciler = h_ogr
-        self.sonuc_firmalar = h_frm
-        skor = memnuniyet_skoru_hesapla(h_ogr)
-
-        self.scores[algo_name] = skor
-        self.times[algo_name] = sure
-
-        yerlesen = h_ogr['Yerleştiği_Firma'].notna().sum()
-        self.update_card(self.card_placed, yerlesen)
-        self.update_card(self.card_score, skor)
-        self.update_card(self.card_time, f"{sure:.2f} sn")
+    def heuristic_iptal(self):
+        if getattr(self, 'worker', None) is not None:
+            self.lbl_status.setText("İptal ediliyor...")
+            self.btn_iptal.setEnabled(False)
+            self.worker.cancel()
 
-        self.tabloyu_doldur(h_ogr, self.tab_ogrenci)
-        self.tabloyu_doldur(h_frm, self.tab_firma)
+    def heuristic_butonlarini_ac(self):
+        self.btn_iptal.setEnabled(False)
+        for btn in self.algo_butonlari.values():
+            btn.setEnabled(True)
 
+    def on_heuristic_finished(self, h_ogr, h_frm, sure, algo_name):
+        self.sonucu_uygula(algo_name, h_ogr, h_frm, sure)
         self.pbar.setValue(100)
-        self.lbl_status.setText(f"Tamamlandı: {algo_name}")
-        self.update_karsilastirma_tablosu()
-
-        self.btn_greedy.setEnabled(True)
-        self.btn_hill.setEnabled(True)
-        self.btn_annealing.setEnabled(True)
+        self.heuristic_butonlarini_ac()
 
     def on_heuristic_error(self, err):
         QMessageBox.critical(self, "Hata", err)
-        self.btn_greedy.setEnabled(True)
+        self.heuristic_butonlarini_ac()
+
+    def on_heuristic_cancelled(self, algo_name):
+        # Sonuç uygulanmaz, tablolar son tamamlanan çözümü göstermeye devam eder
+        self.pbar.setValue(0)
+        self.lbl_status.setText(f"İptal edildi: {cozucu(algo_name).etiket}")
+        self.heuristic_butonlarini_ac()
 
     def simulasyon_baslat(self):
         if self.df_ogrenciler is None:
@@ -579,12 +711,16 @@ class ModernProjeArayuz(QMainWindow):
         QApplication.processEvents()
 
         try:
-            # Greedy'nin simülasyon fonksiyonunu çağır
-            _, _, logs = simulasyon_dongusu(self.df_ogrenciler, self.df_firmalar)
-
-            self.table_sim.setRowCount(len(logs))
-            for i, log in enumerate(logs):
+            # Greedy'nin simülasyonu tur tur çalışır, her tur hesaplanır hesaplanmaz tabloya eklenir
+            # (çözücü modülleri açılışta değil ilk kullanımda yüklenir)
+            from algo_greedy import simulasyon_turlari
+            ogr = self.df_ogrenciler.reset_index(drop=True)
+            durum = AtamaDurumu.dataframe_den(ogr, self.df_firmalar)
+            turlar = simulasyon_turlari(durum, ogr['GNO'].to_numpy(), ogr['Öğrenci'].to_numpy())
+
+            for i, log in enumerate(turlar):
                 # Tablo: Tur | Yerleşen | Reddedilen | Kalan | Detay
+                self.table_sim.insertRow(i)
                 self.table_sim.setItem(i, 0, QTableWidgetItem(str(log['Tur'])))
                 self.table_sim.setItem(i, 1, QTableWidgetItem(str(log['Yerleşen'])))
                 self.table_sim.setItem(i, 2, QTableWidgetItem(str(log['Reddedilen'])))
@@ -595,38 +731,32 @@ class ModernProjeArayuz(QMainWindow):
                 item_detay.setToolTip(str(log['Red_Detay']))
                 self.table_sim.setItem(i, 4, item_detay)
 
+                self.lbl_status.setText(f"Simülasyon: Tur {log['Tur']} tamamlandı...")
+                QApplication.processEvents()
+
             self.lbl_status.setText("Simülasyon Tamamlandı.")
 
         except Exception as e:
             QMessageBox.critical(self, "Simülasyon Hatası", str(e))
 
     def update_karsilastirma_tablosu(self):
-        # 1. Greedy Verileri
-        self.table_comp.setItem(0, 1, QTableWidgetItem(str(self.scores["Greedy"])))
-        self.table_comp.setItem(1, 1, QTableWidgetItem(f"{self.times['Greedy']:.4f}"))
-        self.table_comp.setItem(2, 1, QTableWidgetItem("1 (Tek Geçiş)"))
-        if self.sonuc_ogrenciler is not None:
-            g_yer = self.sonuc_ogrenciler['Yerleştiği_Firma'].notna().sum() if self.scores["Greedy"] > 0 else "-"
-            self.table_comp.setItem(3, 1, QTableWidgetItem(str(g_yer)))
-
-        # 2. Hill Climbing Verileri
-        hc_score = self.scores["HillClimb"]
-        self.table_comp.setItem(0, 2, QTableWidgetItem(str(hc_score)))
-        self.table_comp.setItem(1, 2, QTableWidgetItem(f"{self.times['HillClimb']:.2f}"))
-        self.table_comp.setItem(2, 2, QTableWidgetItem(str(self.iters['HillClimb']) if hc_score > 0 else "-"))
-        # (Heuristik sonucunda yerleşen sayısı genelde aynı kalır ama değişebilir, burada göstermelik tire)
-        self.table_comp.setItem(3, 2, QTableWidgetItem("-" if hc_score == 0 else "Sabit/Artan"))
-
-        # 3. Annealing Verileri
-        sa_score = self.scores["Annealing"]
-        self.table_comp.setItem(0, 3, QTableWidgetItem(str(sa_score)))
-        self.table_comp.setItem(1, 3, QTableWidgetItem(f"{self.times['Annealing']:.2f}"))
-        self.table_comp.setItem(2, 3, QTableWidgetItem(str(self.iters['Annealing']) if sa_score > 0 else "-"))
-        self.table_comp.setItem(3, 3, QTableWidgetItem("-" if sa_score == 0 else "Sabit/Artan"))
+        # Her kayıtlı çözücü bir sütun (kayıt sırasıyla)
+        for j, c in enumerate(self.cozuculer, start=1):
+            skor = self.scores[c.ad]
+            self.table_comp.setItem(0, j, QTableWidgetItem(str(skor)))
+            self.table_comp.setItem(1, j, QTableWidgetItem(f"{self.times[c.ad]:.2f}" if c.ilerleme
+                                                           else f"{self.times[c.ad]:.4f}"))
+            if skor == 0:
+                iterasyon = "-"
+            else:
+                iterasyon = str(self.iters[c.ad]) if c.ilerleme else "1 (Tek Geçiş)"
+            self.table_comp.setItem(2, j, QTableWidgetItem(iterasyon))
+            yerlesen = self.yerlesenler[c.ad]
+            self.table_comp.setItem(3, j, QTableWidgetItem("-" if yerlesen is None else str(yerlesen)))
 
         # Sonuç Analizi Yazısı
-        greedy = self.scores["Greedy"]
-        best_heuristic = max(self.scores["HillClimb"], self.scores["Annealing"])
+        greedy = self.scores.get("greedy", 0)
+        best_heuristic = max((self.scores[c.ad] for c in self.cozuculer if c.yerel_arama), default=0)
 
         if best_heuristic > 0 and greedy > 0:
             fark = best_heuristic - greedy
@@ -644,6 +774,13 @@ class ModernProjeArayuz(QMainWindow):
             else:
                 msg = "⚠️ HATA: Heuristik skor daha düşük. (Normalde olmaması gerekir, kod mantığını kontrol edin.)"
 
+            # Kesin çözüm biliniyorsa optimuma uzaklığı da göster
+            optimum = self.scores.get("optimal", 0)
+            if optimum > 0:
+                en_iyi = max(greedy, best_heuristic)
+                msg += (f"\nOptimum: {optimum} puan. En iyi sezgisel sonuç optimumun "
+                        f"%{(en_iyi / optimum) * 100:.2f}'i (fark: {optimum - en_iyi} puan).")
+
             self.txt_sonuc.setText(msg)
 
     def analiz_sayfasini_ac(self):
@@ -652,13 +789,15 @@ class ModernProjeArayuz(QMainWindow):
         self.update_karsilastirma_tablosu()
 
     def sistemi_sifirla(self):
+        self.calisan_isi_durdur()
         self.df_ogrenciler = None
         self.sonuc_ogrenciler = None
         self.scores = {k: 0 for k in self.scores}
         self.times = {k: 0 for k in self.times}
+        self.yerlesenler = {k: None for k in self.yerlesenler}
 
-        self.tab_ogrenci.setRowCount(0)
-        self.tab_firma.setRowCount(0)
+        self.tab_ogrenci.model().sourceModel().temizle()
+        self.tab_firma.model().sourceModel().temizle()
         self.table_sim.setRowCount(0)
 
         self.update_card(self.card_total, "0")
@@ -666,10 +805,10 @@ class ModernProjeArayuz(QMainWindow):
         self.update_card(self.card_score, "0")
         self.update_card(self.card_time, "0")
 
-        self.btn_greedy.setEnabled(False)
-        self.btn_hill.setEnabled(False)
-        self.btn_annealing.setEnabled(False)
+        for btn in self.algo_butonlari.values():
+            btn.setEnabled(False)
         self.btn_analiz.setEnabled(False)
+        self.btn_kaydet.setEnabled(False)
 
         self.pbar.setValue(0)
         self.tabs_main.setCurrentIndex(0)
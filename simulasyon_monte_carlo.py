@@ -0,0 +1,230 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from algo_greedy import BASE_RED_OLASILIGI, MAX_TUR, gno_sirasi, greedy_yerlestir, red_orani
+from atama_durumu import AtamaDurumu, BOS
+
+# Raporlanan yerleşen sayısı yüzdelikleri
+YUZDELIKLER = (5, 25, 50, 75, 95)
+# Bir bloktaki (öğrenci x tekrar) matrisin eleman sınırı (bellek ~ 4M * 4 bayt)
+BLOK_ELEMAN_SINIRI = 4_000_000
+
+
+def _bostakileri_yerlestir(tercihler, atama, kalan, oncelik, aktif):
+    """
+    Aktif tekrarlarda boştaki öğrencileri GNO sırasıyla greedy yerleştirir (atama / kalan yerinde),
+    tekrar başına yerleşen sayısını döndürür.
+
+    Tüm (öğrenci, tekrar) çiftleri birlikte, öğrenci öneren ertelenmiş kabul turlarıyla çözülür:
+    boştakiler sıradaki tercihine başvurur, kontenjanı aşan (firma, tekrar) gruplarında
+    (tekrar, firma, GNO sırası) sıralamasıyla en öncelikli 'kalan' kadarı tutulur, gerisi
+    reddedilip bir sonraki tercihe geçer. Öncelik tüm firmalarda aynı (GNO) olduğu için sonuç
+    GNO sırasıyla tek tek yerleştirmeyle aynıdır (bkz. algo_stable_matching).
+    oncelik: öğrencinin GNO sırasındaki yeri (küçük = önce seçer).
+    """
+    tekrar = atama.shape[1]
+    tercih_sayisi = tercihler.shape[1]
+    kalan_duz = kalan.reshape(-1)  # (firma, tekrar) grubu -> firma * tekrar + tekrar no
+    yok = kalan_duz.size           # "hiçbir grupta tutulmuyor" işareti
+
+    ogr, r = np.nonzero((atama == BOS) & aktif)
+    tercih_duz = tercihler.reshape(-1)
+    satir_basi = ogr * tercih_sayisi
+    sonraki = np.zeros(ogr.size, dtype=np.int64)       # sıradaki başvurulacak tercih
+    grup = np.full(ogr.size, yok, dtype=np.int64)      # geçici kabul edildiği grup
+    sayim = np.zeros(yok + 1, dtype=np.int64)          # grup başına geçici kabul sayısı
+    tasan = np.zeros(yok + 1, dtype=bool)
+
+    serbest = np.arange(ogr.size)
+    while serbest.size:
+        # Boştakiler sıradaki tercihine başvurur; listede olmayan / dolu firmalar hemen reddeder
+        hedef = tercih_duz[satir_basi[serbest] + sonraki[serbest]].astype(np.int64)
+        sonraki[serbest] += 1
+        uygun = hedef != BOS
+        hedef_grup = hedef[uygun] * tekrar + r[serbest[uygun]]
+        uygun[uygun] = kalan_duz[hedef_grup] > 0
+        basvuran = serbest[uygun]
+        hedef_grup = hedef[uygun] * tekrar + r[basvuran]
+        grup[basvuran] = hedef_grup
+        np.add.at(sayim, hedef_grup, 1)
+        reddedilen = serbest[~uygun]
+
+        # Kontenjanı aşan gruplarda (tekrar, firma, GNO sırası) sıralamasıyla en öncelikliler kalır
+        tasan_gruplar = hedef_grup[sayim[hedef_grup] > kalan_duz[hedef_grup]]
+        if tasan_gruplar.size:
+            tasan[tasan_gruplar] = True
+            uyeler = np.flatnonzero(tasan[grup])
+            tasan[tasan_gruplar] = False
+            # Tek tamsayı anahtar (grup, GNO sırası); öncelikler tekil olduğu için sıralama kesin
+            uyeler = uyeler[np.argsort(grup[uyeler] * len(oncelik) + oncelik[ogr[uyeler]])]
+            uye_grup = grup[uyeler]
+            grup_basi = np.r_[True, uye_grup[1:] != uye_grup[:-1]]
+            konum = np.arange(uyeler.size) - np.maximum.accumulate(np.where(grup_basi, np.arange(uyeler.size), 0))
+            disari = uyeler[konum >= kalan_duz[uye_grup]]
+            np.subtract.at(sayim, grup[disari], 1)
+            grup[disari] = yok
+            reddedilen = np.concatenate([reddedilen, disari])
+
+        serbest = reddedilen[sonraki[reddedilen] < tercih_sayisi]
+
+    tutulan = grup != yok
+    ogr, r, grup = ogr[tutulan], r[tutulan], grup[tutulan]
+    atama[ogr, r] = grup // tekrar
+    kalan_duz -= sayim[:yok]
+    return np.bincount(r, minlength=tekrar)
+
+
+def _blok_simulasyonu(tercihler, kontenjan, gno, baslangic, oranlar, tekrar, rng):
+    """
+    'tekrar' adet bağımsız red simülasyonunu aynı anda çalıştırır.
+
+    Durum (öğrenci x tekrar) ve (firma x tekrar) matrisleridir. İlk tur tüm tekrarlarda aynı
+    (henüz red yok): greedy bir kere çalışıp tüm tekrarlara kopyalanır. Sonraki turlarda
+    boştakiler tüm tekrarlarda birlikte, vektörel olarak yerleştirilir (_bostakileri_yerlestir).
+    Bloğun özet sayaçlarını döndürür, tur tur durumlar saklanmaz.
+    """
+    ogrenci_sayisi = tercihler.shape[0]
+    max_tur = len(oranlar)
+
+    # Öğrencinin GNO sırasındaki yeri; eşit GNO'lar tüm turlarda ve tekrarlarda aynı sırayla çözülür
+    oncelik = np.empty(ogrenci_sayisi, dtype=np.int64)
+    oncelik[gno_sirasi(gno)] = np.arange(ogrenci_sayisi)
+
+    atama = np.repeat(baslangic[:, None], tekrar, axis=1).astype(np.int32)
+    kalan = np.repeat(kontenjan[:, None], tekrar, axis=1).astype(np.int64)
+    aktif = np.ones(tekrar, dtype=bool)
+    bitis_turu = np.full(tekrar, max_tur, dtype=np.int64)
+
+    tur_yerlesen = np.zeros(max_tur, dtype=np.int64)
+    tur_red = np.zeros(max_tur, dtype=np.int64)
+
+    for tur, oran in enumerate(oranlar, start=1):
+        # --- ADIM 1: BOŞTAKİLERİ YERLEŞTİR (GNO sırasıyla greedy) ---
+        if tur == 1:
+            # Tüm tekrarlar aynı durumdan başlar: tek greedy geçişi yayınlanır
+            bostakiler = np.flatnonzero(baslangic == BOS)
+            sira = bostakiler[gno_sirasi(gno[bostakiler])]
+            yeni_atama, _, ilk_kalan = greedy_yerlestir(tercihler[sira], kontenjan, np.arange(sira.size))
+            atama[sira] = yeni_atama[:, None]
+            kalan[:] = ilk_kalan[:, None]
+            yerlesen = np.full(tekrar, np.count_nonzero(yeni_atama != BOS), dtype=np.int64)
+        else:
+            yerlesen = _bostakileri_yerlestir(tercihler, atama, kalan, oncelik, aktif)
+
+        # --- ADIM 2: RED SİMÜLASYONU (tek seferde Bernoulli matrisi) ---
+        red_sayisi = np.zeros(tekrar, dtype=np.int64)
+        if oran > 0:
+            red = (atama != BOS) & aktif & (rng.random((ogrenci_sayisi, tekrar)) < oran)
+            ogr_idx, tekrar_idx = np.nonzero(red)
+            # Firmaların kontenjanını geri ver
+            np.add.at(kalan, (atama[ogr_idx, tekrar_idx], tekrar_idx), 1)
+            atama[ogr_idx, tekrar_idx] = BOS
+            red_sayisi = np.bincount(tekrar_idx, minlength=tekrar)
+
+        tur_yerlesen[tur - 1] = yerlesen.sum()
+        tur_red[tur - 1] = red_sayisi.sum()
+
+        # --- ÇIKIŞ KOŞULU (simulasyon_dongusu ile aynı, tekrar başına) ---
+        biten = aktif & (red_sayisi == 0) & ((yerlesen == 0) | (kalan.sum(axis=0) == 0))
+        bitis_turu[biten] = tur
+        aktif &= ~biten
+        if not aktif.any():
+            break
+
+    yerlesti = atama != BOS
+    return {
+        "Yerlesen_Histogrami": np.bincount(yerlesti.sum(axis=0), minlength=ogrenci_sayisi + 1),
+        "Ogrenci_Yerlesme": yerlesti.sum(axis=1),
+        "Firma_Bos_Kalma": (kalan > 0).sum(axis=1),
+        "Firma_Bos_Kontenjan": kalan.sum(axis=1),
+        "Tur_Dagilimi": np.bincount(bitis_turu, minlength=max_tur + 1),
+        "Tur_Yerlesen": tur_yerlesen,
+        "Tur_Red": tur_red,
+    }
+
+
+def _parca_calistir(tercihler, kontenjan, gno, baslangic, oranlar, tekrar, seed_seq):
+    """Süreç havuzunda çalışan tek blok (modül seviyesinde olmalı ki pickle edilebilsin)."""
+    return _blok_simulasyonu(tercihler, kontenjan, gno, baslangic, oranlar, tekrar,
+                             np.random.default_rng(seed_seq))
+
+
+def _sonuclari_topla(sonuclar):
+    """Blok sayaçlarını geldikçe toplar (bloklar bellekte birikmez)."""
+    toplam = None
+    for sonuc in sonuclar:
+        if toplam is None:
+            toplam = sonuc
+        else:
+            for anahtar, deger in sonuc.items():
+                toplam[anahtar] += deger
+    return toplam
+
+
+def _histogram_yuzdelik(histogram, yuzdelik):
+    """Değer histogramından yüzdelik (tekrarlar saklanmadan, kesin 'inverted_cdf' yöntemi)."""
+    kumulatif = np.cumsum(histogram)
+    return int(np.searchsorted(kumulatif, kumulatif[-1] * yuzdelik / 100.0))
+
+
+def monte_carlo_simulasyonu(ogrenciler_df, firmalar_df, tekrar=1000, max_tur=None, base_red_olasiligi=None,
+                            seed=None, max_workers=None, blok=None):
+    """
+    Red simülasyonunun (simulasyon_dongusu) Monte Carlo sürümü.
+
+    'tekrar' adet bağımsız simülasyon, 'blok' tekrarlık gruplar halinde (öğrenci x tekrar)
+    dizileriyle birlikte çalıştırılır; bloklar süreç havuzuna dağıtılır. Her blok
+    SeedSequence'tan türetilmiş kendi üretecini kullanır, sonuç max_workers'tan bağımsızdır.
+    Yörüngeler saklanmaz, sadece sayaçlar toplanır.
+
+    (ogrenciler, firmalar, ozet) döndürür:
+    - ogrenciler['Yerleşme_Olasılığı']: simülasyon sonunda yerleşmiş olma oranı
+    - firmalar['Boş_Kalma_Riski'], firmalar['Ortalama_Boş_Kontenjan']
+    - ozet: yerleşen sayısı ortalama/std/yüzdelikleri, bitiş turu dağılımı,
+      tur başına ortalama yerleşen ve reddedilen sayıları
+    """
+    max_tur = MAX_TUR if max_tur is None else max_tur
+    base_red_olasiligi = BASE_RED_OLASILIGI if base_red_olasiligi is None else base_red_olasiligi
+
+    ogrenciler = ogrenciler_df.copy().reset_index(drop=True)
+    firmalar = firmalar_df.copy().reset_index(drop=True)
+
+    durum = AtamaDurumu.dataframe_den(ogrenciler, firmalar)
+    gno = ogrenciler['GNO'].to_numpy(dtype=float)
+    oranlar = [red_orani(tur, base_red_olasiligi) for tur in range(1, max_tur + 1)]
+
+    if blok is None:
+        blok = max(1, min(tekrar, 256, BLOK_ELEMAN_SINIRI // max(1, durum.ogrenci_sayisi)))
+    blok_boyutlari = [min(blok, tekrar - bas) for bas in range(0, tekrar, blok)]
+    seedler = np.random.SeedSequence(seed).spawn(len(blok_boyutlari))
+
+    isler = [(durum.tercihler, durum.kontenjan, gno, durum.atama, oranlar, boyut, ss)
+             for boyut, ss in zip(blok_boyutlari, seedler)]
+    if len(isler) == 1 or max_workers == 1:
+        toplam = _sonuclari_topla(_parca_calistir(*is_) for is_ in isler)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as havuz:
+            toplam = _sonuclari_topla(havuz.map(_parca_calistir, *zip(*isler)))
+
+    histogram = toplam["Yerlesen_Histogrami"]
+    degerler = np.arange(histogram.size)
+    ortalama = float((histogram * degerler).sum() / tekrar)
+    std = float(np.sqrt((histogram * (degerler - ortalama) ** 2).sum() / tekrar))
+
+    ozet = {
+        "Tekrar": tekrar,
+        "Yerlesen_Ortalama": ortalama,
+        "Yerlesen_Std": std,
+        "Yerlesen_Yuzdelikleri": {y: _histogram_yuzdelik(histogram, y) for y in YUZDELIKLER},
+        # Tur_Dagilimi[t]: t. turda oturan simülasyon sayısı (max_tur: limite kadar sürenler dahil)
+        "Tur_Dagilimi": toplam["Tur_Dagilimi"][1:].tolist(),
+        "Tur_Yerlesen_Ortalamasi": (toplam["Tur_Yerlesen"] / tekrar).tolist(),
+        "Tur_Red_Ortalamasi": (toplam["Tur_Red"] / tekrar).tolist(),
+    }
+
+    ogrenciler['Yerleşme_Olasılığı'] = toplam["Ogrenci_Yerlesme"] / tekrar
+    firmalar['Boş_Kalma_Riski'] = toplam["Firma_Bos_Kalma"] / tekrar
+    firmalar['Ortalama_Boş_Kontenjan'] = toplam["Firma_Bos_Kontenjan"] / tekrar
+
+    return ogrenciler, firmalar, ozet
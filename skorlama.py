@@ -0,0 +1,82 @@
+import pandas as pd
+import numpy as np
+
+# Algoritmaların kullandığı puan tablosu (1. tercih -> 100 ... 5. tercih -> 20)
+PUANLAR = (100, 80, 60, 40, 20)
+# Streamlit arayüzünün gösterdiği puan tablosu
+ARAYUZ_PUANLARI = (100, 85, 70, 50, 30)
+
+
+def puan_tablosu(puanlar=PUANLAR):
+    """Sıra -> puan tablosu; sondaki 0 'tercih dışı / yerleşmedi' içindir."""
+    return np.append(np.asarray(puanlar, dtype=np.int64), 0)
+
+
+def tercih_sirasi(tercihler, atama):
+    """
+    Her öğrencinin yerleştiği firmanın tercih listesindeki sırası (0 tabanlı).
+    Yerleşmeyen (atama < 0) veya tercihi dışında yerleşen öğrenci için k döner.
+
+    atama (N,) ise sonuç (N,), atama (M x N) ise sonuç (M x N) olur.
+    """
+    tercihler = np.asarray(tercihler)
+    atama = np.asarray(atama)
+    k = tercihler.shape[1]
+
+    # (… x N x k) eşitlik matrisi: tek bir karşılaştırmada tüm öğrenciler
+    eslesme = (tercihler == atama[..., None]) & (atama[..., None] >= 0)
+    sira = eslesme.argmax(axis=-1)
+    return np.where(eslesme.any(axis=-1), sira, k)
+
+
+def ogrenci_puanlari(tercihler, atama, puanlar=PUANLAR):
+    """Öğrenci başına memnuniyet puanı."""
+    return puan_tablosu(puanlar)[tercih_sirasi(tercihler, atama)]
+
+
+def skor_hesapla(tercihler, atama, puanlar=PUANLAR):
+    """Tek bir atamanın toplam memnuniyet puanı."""
+    return int(ogrenci_puanlari(tercihler, atama, puanlar).sum())
+
+
+def toplu_skor_hesapla(tercihler, atamalar, puanlar=PUANLAR, parca=64):
+    """
+    M aday atamayı (M x N) tek çağrıda puanlar, (M,) skor dizisi döndürür.
+    Bellek M x N x k'yı geçmesin diye adaylar 'parca' satırlık gruplarla işlenir.
+    """
+    atamalar = np.atleast_2d(atamalar)
+    skorlar = np.empty(atamalar.shape[0], dtype=np.int64)
+    for bas in range(0, atamalar.shape[0], parca):
+        skorlar[bas:bas + parca] = ogrenci_puanlari(tercihler, atamalar[bas:bas + parca], puanlar).sum(axis=1)
+    return skorlar
+
+
+def dataframe_dizileri(ogrenciler_df, tercih_sayisi=5):
+    """
+    DataFrame'deki firma isimlerini ortak tamsayı kodlarına çevirir.
+    (tercihler (N x k), atama (N,)) döner; boş değerler -1 olur.
+    """
+    tercih_kolonlari = [f'Tercih{i}' for i in range(1, tercih_sayisi + 1)]
+    n = len(ogrenciler_df)
+
+    sutunlar = [ogrenciler_df[c] if c in ogrenciler_df.columns else pd.Series([None] * n)
+                for c in tercih_kolonlari]
+    if 'Yerleştiği_Firma' in ogrenciler_df.columns:
+        sutunlar.append(ogrenciler_df['Yerleştiği_Firma'])
+    else:
+        sutunlar.append(pd.Series([None] * n))
+
+    # Tüm sütunlar tek seferde kodlanır, aynı isim her yerde aynı kodu alır
+    kodlar, _ = pd.factorize(np.concatenate([s.to_numpy(dtype=object) for s in sutunlar]))
+    kodlar = kodlar.reshape(len(sutunlar), n).T
+    return kodlar[:, :-1], kodlar[:, -1]
+
+
+def memnuniyet_skoru_hesapla(ogrenciler_df, puanlar=PUANLAR):
+    """
+    Öğrencilerin yerleştiği firmaya göre puanını hesaplar.
+    """
+    if ogrenciler_df.empty or 'Yerleştiği_Firma' not in ogrenciler_df.columns:
+        return 0
+    tercihler, atama = dataframe_dizileri(ogrenciler_df, tercih_sayisi=len(puanlar))
+    return skor_hesapla(tercihler, atama, puanlar)
@@ -0,0 +1,113 @@
+import multiprocessing
+import queue
+import time
+
+from atama_durumu import AtamaDurumu
+from arka_plan import IsIptalEdildi
+from cozucu_kayit import cozucu
+from telemetri import Telemetri
+
+# İlerleme mesajları en fazla bu sıklıkla gönderilir (saniye, 10 Hz)
+MESAJ_ARALIGI = 0.1
+# İptal istendikten sonra süreç bu kadar saniyede kendiliğinden bitmezse sonlandırılır
+IPTAL_BEKLEME = 2.0
+
+
+def _surec_ana(algoritma, ogrenciler, firmalar, iterasyon, kuyruk, iptal):
+    """
+    Çocuk süreçte çalışır (modül seviyesinde olmalı ki 'spawn' ile başlatılabilsin).
+
+    Kuyruğa gönderilen mesajlar:
+      ("ilerleme", iterasyon, mevcut skor, en iyi skor)   -- en fazla MESAJ_ARALIGI'nda bir
+      ("bitti", atama, kontenjan, süre)                   -- DataFrame yerine sadece diziler
+      ("iptal",) / ("hata", mesaj)
+    """
+    # Çözücü modülü sadece çocuk süreçte import edilir
+    secilen = cozucu(algoritma)
+
+    # Skorlar telemetriden okunur; iz tutulmasına gerek yok
+    telemetri = Telemetri(iz_boyutu=1, ornekleme=50, zamanlama=False)
+    son_mesaj = 0.0
+
+    def step_callback(i):
+        nonlocal son_mesaj
+        if iptal.is_set():
+            raise IsIptalEdildi(algoritma)
+        simdi = time.monotonic()
+        if simdi - son_mesaj >= MESAJ_ARALIGI:
+            son_mesaj = simdi
+            kuyruk.put(("ilerleme", i, telemetri.son_skor, telemetri.en_iyi_skor))
+
+    t_start = time.time()
+    try:
+        # DataFrame'e yazma (Yerlesenler, Tercih_Sırası) sadece ana süreçte, sonuclari_kur'da yapılır
+        durum = secilen.durum_calistir(ogrenciler, firmalar, iterasyon=iterasyon, step_callback=step_callback,
+                                       telemetri=telemetri)
+        kuyruk.put(("bitti", durum.atama, durum.kontenjan, time.time() - t_start))
+    except IsIptalEdildi:
+        kuyruk.put(("iptal",))
+    except Exception as e:
+        kuyruk.put(("hata", str(e)))
+
+
+def sonuclari_kur(ogrenciler_df, firmalar_df, atama, kontenjan):
+    """Süreçten dönen atama / kontenjan dizilerini girdinin DataFrame'lerine yazar (çözücü çıktısıyla aynı)."""
+    ogrenciler = ogrenciler_df.copy().reset_index(drop=True)
+    firmalar = firmalar_df.copy().reset_index(drop=True)
+    durum = AtamaDurumu.dataframe_den(ogrenciler, firmalar)
+    durum.atama = atama
+    durum.kontenjan = kontenjan
+    return durum.sonuclari_yaz(ogrenciler, firmalar)
+
+
+class SurecIsi:
+    """
+    Bir çözücüyü ayrı süreçte çalıştıran tutamaç (GUI ile GIL paylaşılmaz).
+
+    mesajlar() bekleme yapmadan gelen mesajları döndürür; arayüz bunu bir zamanlayıcıyla yoklar.
+    iptal_et() önce işbirlikçi iptal ister (step_callback IsIptalEdildi fırlatır), süreç
+    IPTAL_BEKLEME saniyede bitmezse sonlandırılır.
+    """
+
+    def __init__(self, algoritma, ogrenciler, firmalar, iterasyon):
+        # Sadece ilerleme (step_callback) destekleyen kayıtlı çözücüler iptal edilebilir
+        if not cozucu(algoritma).ilerleme:
+            raise ValueError(f"Süreçte çalıştırılamayan algoritma: {algoritma}")
+        # Qt iş parçacıkları varken fork güvenli değil
+        baglam = multiprocessing.get_context("spawn")
+        self.algoritma = algoritma
+        self.kuyruk = baglam.Queue()
+        self.iptal = baglam.Event()
+        self.iptal_zamani = None
+        self.surec = baglam.Process(target=_surec_ana, daemon=True,
+                                    args=(algoritma, ogrenciler, firmalar, iterasyon, self.kuyruk, self.iptal))
+
+    def baslat(self):
+        self.surec.start()
+        return self
+
+    def iptal_et(self):
+        self.iptal.set()
+        if self.iptal_zamani is None:
+            self.iptal_zamani = time.monotonic()
+
+    def mesajlar(self):
+        """Kuyruktaki tüm mesajlar; iptal süresi dolduysa süreç sonlandırılır ve ("iptal",) döner."""
+        gelen = []
+        while True:
+            try:
+                gelen.append(self.kuyruk.get_nowait())
+            except queue.Empty:
+                break
+        if (not gelen or gelen[-1][0] == "ilerleme") and self.iptal_zamani is not None \
+                and time.monotonic() - self.iptal_zamani > IPTAL_BEKLEME:
+            self.surec.terminate()
+            gelen.append(("iptal",))
+        elif not gelen and not self.surec.is_alive() and self.surec.exitcode not in (None, 0):
+            gelen.append(("hata", f"Çözücü süreci beklenmedik şekilde bitti (kod {self.surec.exitcode})"))
+        return gelen
+
+    def kapat(self):
+        if self.surec.is_alive():
+            self.surec.terminate()
+        self.surec.join(timeout=1)
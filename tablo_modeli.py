@@ -0,0 +1,173 @@
+import pandas as pd
+import numpy as np
+from PyQt5.QtCore import Qt, QAbstractTableModel, QAbstractProxyModel, QModelIndex
+
+
+class DataFrameModeli(QAbstractTableModel):
+    """
+    DataFrame'i sütun dizileri (NumPy) olarak tutan salt okunur tablo modeli.
+
+    Hücre başına nesne oluşturulmaz: görünüm sadece ekranda görünen hücreler için data()
+    çağırır, metin o anda üretilir. Boş değerler "-" gösterilir.
+    Sıralama ve filtre için sütun başına vektörel yardımcılar (SiralaFiltreModeli kullanır).
+    """
+
+    def __init__(self, df=None, parent=None):
+        super().__init__(parent)
+        self._sutunlar = []
+        self._diziler = []
+        self._metinler = {}  # filtre için sütunların metin hali (ilk aramada üretilir)
+        self._satir_sayisi = 0
+        if df is not None:
+            self.veri_ata(df)
+
+    def veri_ata(self, df):
+        self.beginResetModel()
+        df = pd.DataFrame() if df is None else df
+        self._sutunlar = [str(c) for c in df.columns]
+        self._diziler = [df.iloc[:, j].to_numpy() for j in range(df.shape[1])]
+        self._metinler = {}
+        self._satir_sayisi = df.shape[0]
+        self.endResetModel()
+
+    def temizle(self):
+        self.veri_ata(None)
+
+    # --- QAbstractTableModel ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._satir_sayisi
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._sutunlar)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            deger = self._diziler[index.column()][index.row()]
+            return "-" if pd.isna(deger) else str(deger)
+        if role == Qt.TextAlignmentRole and self._diziler[index.column()].dtype != object:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._sutunlar[section] if section < len(self._sutunlar) else None
+        return str(section + 1)
+
+    # --- VEKTÖREL YARDIMCILAR ---
+    def siralama_anahtari(self, sutun):
+        """
+        Sütunun argsort anahtarı. Sayısal sütunlar olduğu gibi; karışık sütunlar
+        (ör. Tercih_Sırası: 1..5 ve "-") sayıya çevrilebiliyorsa sayısal (sayı olmayanlar
+        sona), diğerleri metin olarak sıralanır.
+        """
+        dizi = self._diziler[sutun]
+        if dizi.dtype != object:
+            return dizi
+        seri = pd.Series(dizi)
+        sayisal = pd.to_numeric(seri, errors="coerce")
+        if sayisal.notna().any():
+            return sayisal.fillna(np.inf).to_numpy()
+        return seri.fillna("").astype(str).to_numpy()
+
+    def eslesme_maskesi(self, metin):
+        """Herhangi bir sütununda metni (büyük/küçük harf duyarsız) içeren satırlar."""
+        maske = np.zeros(self._satir_sayisi, dtype=bool)
+        for j, dizi in enumerate(self._diziler):
+            if j not in self._metinler:
+                seri = pd.Series(dizi, dtype=object)
+                self._metinler[j] = seri.where(seri.notna(), "-").astype(str).str.lower()
+            maske |= self._metinler[j].str.contains(metin.lower(), regex=False).to_numpy()
+        return maske
+
+
+class SiralaFiltreModeli(QAbstractProxyModel):
+    """
+    DataFrameModeli için sıralama + filtre proxy'si.
+
+    Görünen satırlar tek bir NumPy permütasyonudur (argsort + maske). QSortFilterProxyModel
+    her satır için Python'a (filterAcceptsRow / lessThan) döndüğünden büyük tablolarda
+    yavaştır; burada satır eşlemesi sadece görünen hücreler için yapılır.
+    """
+
+    def __init__(self, kaynak, parent=None):
+        super().__init__(parent)
+        self._satirlar = np.arange(0)
+        self._ters = None  # kaynak satır -> görünen satır (ilk ihtiyaçta kurulur)
+        self._sutun = -1
+        self._yon = Qt.AscendingOrder
+        self.filtre_metni = ""
+        self.setSourceModel(kaynak)
+        kaynak.modelAboutToBeReset.connect(self.beginResetModel)
+        kaynak.modelReset.connect(self._kaynak_sifirlandi)
+        self._satirlari_hesapla()
+
+    def _kaynak_sifirlandi(self):
+        # Yeni veri: sıralama kaldırılır, filtre yeni veriye uygulanır
+        self._sutun = -1
+        self._satirlari_hesapla()
+        self.endResetModel()
+
+    def _satirlari_hesapla(self):
+        kaynak = self.sourceModel()
+        if 0 <= self._sutun < kaynak.columnCount():
+            satirlar = np.argsort(kaynak.siralama_anahtari(self._sutun), kind="stable")
+            if self._yon == Qt.DescendingOrder:
+                satirlar = satirlar[::-1]
+        else:
+            satirlar = np.arange(kaynak.rowCount())
+        if self.filtre_metni:
+            satirlar = satirlar[kaynak.eslesme_maskesi(self.filtre_metni)[satirlar]]
+        self._satirlar = satirlar
+        self._ters = None
+
+    def _yenile(self):
+        self.beginResetModel()
+        self._satirlari_hesapla()
+        self.endResetModel()
+
+    def filtrele(self, metin):
+        self.filtre_metni = metin.strip()
+        self._yenile()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self._sutun, self._yon = column, order
+        self._yenile()
+
+    # --- QAbstractProxyModel ---
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (0 <= row < len(self._satirlar) and 0 <= column < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._satirlar)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.sourceModel().columnCount()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid():
+            return QModelIndex()
+        return self.sourceModel().index(int(self._satirlar[proxy_index.row()]), proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        if self._ters is None:
+            self._ters = np.full(self.sourceModel().rowCount(), -1, dtype=np.int64)
+            self._ters[self._satirlar] = np.arange(len(self._satirlar))
+        satir = int(self._ters[source_index.row()])
+        return QModelIndex() if satir < 0 else self.index(satir, source_index.column())
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        # Satır başlığı sıralama/filtreden sonra da DataFrame'deki sırayı gösterir
+        if orientation == Qt.Vertical and 0 <= section < len(self._satirlar):
+            section = int(self._satirlar[section])
+        return self.sourceModel().headerData(section, orientation, role)
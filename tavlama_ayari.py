@@ -0,0 +1,327 @@
+"""
+Simulated Annealing için otomatik parametre ayarı (successive halving) ve profil önbelleği.
+
+Veri seti bir profile indirgenir (öğrenci sayısı, firma sayısı, toplam kontenjan oranı ve
+kontenjan dağılımının çarpıklığı). Ayar rastgele örneklenmiş parametre kümelerini (sicaklik,
+soguma_orani, tercih_egilimi) artan iterasyon bütçeleriyle paralel dener; her basamakta
+skoru en iyi olan 1/eta kısmı bir sonraki basamağa geçer, gerisi erken elenir. Kazananın
+iterasyon bütçesi basamaklar arasındaki puan / CPU saniyesi getirisine göre seçilir. Sonuç profil anahtarıyla yerel bir JSON önbelleğe yazılır; cozucu_kayit aynı profildeki
+sonraki koşularda bu değerleri varsayılan olarak kullanır.
+
+Komut satırı:
+    python tavlama_ayari.py ayarla proje_veri.npz --deneme 27 --eta 3
+    python tavlama_ayari.py listele
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+
+ONBELLEK_DOSYASI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tavlama_ayarlari.json")
+ONBELLEK_SURUMU = 1
+
+# El ile seçilmiş eski varsayılanlar (150 öğrencilik veri için); her ayarda ilk deneme olarak yer alır
+VARSAYILAN_AYAR = {"sicaklik": 150.0, "soguma_orani": 0.99, "tercih_egilimi": 1.0}
+VARSAYILAN_ITERASYON = 10000
+
+# Arama uzayı: sıcaklık ve (1 - soguma_orani) log-uniform, tercih eğilimi uniform. Aralıklar
+# cozucu_kayit'taki annealing şemasının içinde kalır (soguma_orani (0, 1], tercih_egilimi > 0).
+SICAKLIK_ARALIGI = (1.0, 500.0)
+SOGUMA_ARALIGI = (1e-7, 1e-2)
+EGILIM_ARALIGI = (0.3, 1.0)
+
+# Bütçe, son büyütmenin getirdiği puan / CPU saniyesi ilk basamaktakinin bu oranının altına
+# düşünce daha fazla büyütülmez (azalan getiri)
+VERIM_ESIGI = 0.25
+
+
+# --- PROFİL ---
+def veri_profili(ogrenciler_df, firmalar_df):
+    """
+    (N, F, kontenjan oranı, kontenjan çarpıklığı). Girdi bir çözücünün sonucu olabilir:
+    Kontenjan sütunu kalan kontenjandır, yerleşenler geri eklenerek toplam kontenjan bulunur.
+    Çarpıklık firma kontenjanlarının değişim katsayısıdır (std / ortalama).
+    """
+    kontenjan = firmalar_df['Kontenjan'].to_numpy(dtype=np.float64)
+    if 'Yerleştiği_Firma' in ogrenciler_df.columns:
+        yerlesen = ogrenciler_df['Yerleştiği_Firma'].value_counts()
+        kontenjan = kontenjan + firmalar_df['Firma'].map(yerlesen).fillna(0).to_numpy(dtype=np.float64)
+
+    ogrenci_sayisi = len(ogrenciler_df)
+    ortalama = kontenjan.mean() if kontenjan.size else 0.0
+    return {
+        "ogrenci_sayisi": ogrenci_sayisi,
+        "firma_sayisi": len(firmalar_df),
+        "kontenjan_orani": float(kontenjan.sum() / ogrenci_sayisi) if ogrenci_sayisi else 0.0,
+        "kontenjan_carpikligi": float(kontenjan.std() / ortalama) if ortalama > 0 else 0.0,
+    }
+
+
+def _iki_kuvveti(sayi):
+    return 2 ** round(math.log2(sayi)) if sayi > 0 else 0
+
+
+def profil_anahtari(profil):
+    """Yakın profiller aynı anahtarı paylaşır: boyutlar 2'nin kuvvetine, oranlar 0.25'e yuvarlanır."""
+    return (f"N{_iki_kuvveti(profil['ogrenci_sayisi'])}-F{_iki_kuvveti(profil['firma_sayisi'])}"
+            f"-oran{round(profil['kontenjan_orani'] * 4) / 4:.2f}"
+            f"-cv{round(profil['kontenjan_carpikligi'] * 4) / 4:.2f}")
+
+
+# --- ÖNBELLEK ---
+_okunan = {}  # yol -> (değişiklik zamanı, içerik)
+
+
+def onbellek_oku(yol=None):
+    """Önbellek içeriği ({anahtar: kayıt}); dosya yoksa / okunamıyorsa boş sözlük."""
+    yol = yol or ONBELLEK_DOSYASI
+    try:
+        zaman = os.path.getmtime(yol)
+    except OSError:
+        return {}
+    if yol in _okunan and _okunan[yol][0] == zaman:
+        return _okunan[yol][1]
+    try:
+        with open(yol, encoding="utf-8") as f:
+            icerik = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    profiller = icerik.get("profiller", {}) if icerik.get("surum") == ONBELLEK_SURUMU else {}
+    _okunan[yol] = (zaman, profiller)
+    return profiller
+
+
+def onbellege_yaz(anahtar, kayit, yol=None):
+    """Kaydı profil anahtarıyla yazar (dosya geçici dosya üzerinden tek adımda değiştirilir)."""
+    yol = yol or ONBELLEK_DOSYASI
+    profiller = dict(onbellek_oku(yol))
+    profiller[anahtar] = kayit
+    gecici = yol + ".tmp"
+    with open(gecici, "w", encoding="utf-8") as f:
+        json.dump({"surum": ONBELLEK_SURUMU, "profiller": profiller}, f, ensure_ascii=False, indent=2)
+    os.replace(gecici, yol)
+
+
+def ayarli_parametreler(ogrenciler_df, firmalar_df, yol=None):
+    """
+    Verinin profili için önbellekteki ayarlı parametreler (yoksa boş sözlük).
+    İterasyon bütçesi profildeki öğrenci sayısıyla orantılı olarak bu veriye ölçeklenir.
+    cozucu_kayit'taki annealing kaydının ayar kaynağıdır.
+    """
+    profil = veri_profili(ogrenciler_df, firmalar_df)
+    kayit = onbellek_oku(yol).get(profil_anahtari(profil))
+    if kayit is None:
+        return {}
+    parametreler = dict(kayit["parametreler"])
+    ayarlanan_n = kayit["profil"]["ogrenci_sayisi"]
+    if ayarlanan_n:
+        parametreler["iterasyon"] = max(1, round(parametreler["iterasyon"] * profil["ogrenci_sayisi"] / ayarlanan_n))
+    return parametreler
+
+
+# --- DENEMELER ---
+def ayar_orneklemi(rng, sayi):
+    """
+    Arama uzayından sayi kadar parametre kümesi; ilki her zaman eski varsayılanlardır.
+    Her küme annealing şemasından geçirilir, şema dışı bir değer ValueError verir.
+    """
+    from cozucu_kayit import cozucu
+
+    sema = cozucu("annealing")
+    ayarlar = [dict(VARSAYILAN_AYAR)]
+    for _ in range(sayi - 1):
+        ayarlar.append({
+            "sicaklik": float(np.exp(rng.uniform(*np.log(SICAKLIK_ARALIGI)))),
+            "soguma_orani": float(1 - np.exp(rng.uniform(*np.log(SOGUMA_ARALIGI)))),
+            "tercih_egilimi": float(rng.uniform(*EGILIM_ARALIGI)),
+        })
+    for ayar in ayarlar:
+        sema.parametreleri_hazirla(**ayar)
+    return ayarlar
+
+
+def basamaklar(en_az_iterasyon, deneme_sayisi, eta):
+    """Her basamağın (iterasyon, deneme sayısı) çifti; bütçe eta katına çıkarken denemeler 1/eta'ya iner."""
+    sonuc = []
+    iterasyon, kalan = en_az_iterasyon, deneme_sayisi
+    while True:
+        sonuc.append((iterasyon, kalan))
+        if kalan == 1:
+            return sonuc
+        iterasyon, kalan = iterasyon * eta, max(1, math.ceil(kalan / eta))
+
+
+_baslangic_durumu = None  # süreç havuzundaki her işçide bir kere kurulur
+
+
+def _isci_hazirla(durum):
+    global _baslangic_durumu
+    _baslangic_durumu = durum
+
+
+def _deneme_calistir(ayar, iterasyon, seed_seq):
+    """Başlangıç durumunun kopyasında tek tavlama koşusu: (en iyi skor, CPU saniyesi)."""
+    from algo_heuristic_annealing import tavlama
+    from telemetri import Telemetri
+
+    bas = time.process_time()
+    durum = _baslangic_durumu.kopya()
+    _, skor, _ = tavlama(durum, iterasyon, rng=np.random.default_rng(seed_seq), yazdir=False,
+                         telemetri=Telemetri(iz_boyutu=1, ornekleme=iterasyon, zamanlama=False), **ayar)
+    return skor, time.process_time() - bas
+
+
+def _verim(kazanc, cpu):
+    return kazanc / cpu if cpu > 0 else 0.0
+
+
+def _butce_sec(gecmis):
+    """
+    Kazananın basamak geçmişinden iterasyon bütçesi: ilk basamaktan başlayıp, bir sonraki basamağın
+    ek puanı / ek CPU saniyesi ilk basamağın verimlilik oranının VERIM_ESIGI katından azsa durur.
+    """
+    secilen = gecmis[0]
+    taban = max(_verim(secilen["Kazanc"], secilen["CPU_Sn"]), 0.0)
+    for sonraki in gecmis[1:]:
+        ek_cpu = sonraki["CPU_Sn"] - secilen["CPU_Sn"]
+        ek_kazanc = sonraki["Kazanc"] - secilen["Kazanc"]
+        if ek_kazanc <= 0 or ek_cpu <= 0 or ek_kazanc / ek_cpu < VERIM_ESIGI * taban:
+            break
+        secilen = sonraki
+    return secilen
+
+
+def tavlama_ayarla(ogrenciler_df, firmalar_df, deneme_sayisi=27, eta=3, en_az_iterasyon=None, seed=None,
+                   max_workers=None, kaydet=True, yol=None, ilerleme=None):
+    """
+    Successive halving ile tavlama parametrelerini verinin profili için ayarlar.
+
+    Girdi bir atama içermelidir (arayüzdeki gibi genelde Greedy sonucu); tüm denemeler aynı
+    başlangıçtan çalışır. İlk basamakta deneme_sayisi parametre kümesi en_az_iterasyon
+    (varsayılan max(1000, N // 10)) iterasyonla koşar; her basamakta skoru en iyi
+    ceil(n / eta) deneme, eta katı bütçeyle bir sonraki basamağa geçer. Aynı basamaktaki
+    denemeler aynı SeedSequence akışını kullanır (ortak rastgele sayılar, karşılaştırma adil).
+    Denemeler süreç havuzunda paralel çalışır; max_workers=1 ise aynı süreçte.
+
+    İterasyon bütçesi kazananın basamaklarından azalan getiri kuralıyla seçilir (bkz. _butce_sec).
+    kaydet=True ise sonuç önbelleğe yazılır. ilerleme(basamak, iterasyon, deneme sayısı) her
+    basamak başında çağrılır. Önbellek kaydını döndürür.
+    """
+    from atama_durumu import AtamaDurumu
+
+    durum = AtamaDurumu.dataframe_den(ogrenciler_df.reset_index(drop=True), firmalar_df.reset_index(drop=True))
+    profil = veri_profili(ogrenciler_df, firmalar_df)
+    baslangic_skoru = durum.skor()
+    if en_az_iterasyon is None:
+        en_az_iterasyon = max(1000, profil["ogrenci_sayisi"] // 10)
+
+    ayar_seed, *basamak_seedleri = np.random.SeedSequence(seed).spawn(1 + len(basamaklar(1, deneme_sayisi, eta)))
+    ayarlar = ayar_orneklemi(np.random.default_rng(ayar_seed), deneme_sayisi)
+    gecmis = {i: [] for i in range(deneme_sayisi)}
+    hayatta = list(range(deneme_sayisi))
+
+    havuz = None
+    if max_workers != 1:
+        havuz = ProcessPoolExecutor(max_workers=max_workers, initializer=_isci_hazirla, initargs=(durum,))
+    else:
+        _isci_hazirla(durum)
+    bas = time.perf_counter()
+    try:
+        for basamak, ((iterasyon, _), seed_seq) in enumerate(zip(basamaklar(en_az_iterasyon, deneme_sayisi, eta),
+                                                                basamak_seedleri)):
+            if ilerleme is not None:
+                ilerleme(basamak, iterasyon, len(hayatta))
+            isler = [(ayarlar[i], iterasyon, seed_seq) for i in hayatta]
+            if havuz is None:
+                sonuclar = [_deneme_calistir(*is_) for is_ in isler]
+            else:
+                sonuclar = list(havuz.map(_deneme_calistir, *zip(*isler)))
+
+            for i, (skor, cpu) in zip(hayatta, sonuclar):
+                kazanc = int(skor - baslangic_skoru)
+                gecmis[i].append({"Iterasyon": iterasyon, "Skor": int(skor), "Kazanc": kazanc, "CPU_Sn": cpu,
+                                  "Verim": _verim(kazanc, cpu)})
+            # Eşit bütçede skor sıralaması (CPU süresi ölçüm gürültüsü içerir, sadece bütçe seçiminde
+            # kullanılır); sıralama kararlı, eşitlikte önce örneklenen deneme kalır
+            hayatta.sort(key=lambda i: gecmis[i][-1]["Skor"], reverse=True)
+            hayatta = hayatta[:max(1, math.ceil(len(hayatta) / eta))]
+    finally:
+        if havuz is not None:
+            havuz.shutdown()
+
+    kazanan = hayatta[0]
+    butce = _butce_sec(gecmis[kazanan])
+    kayit = {
+        "profil": profil,
+        "parametreler": {"iterasyon": butce["Iterasyon"], **ayarlar[kazanan]},
+        "Baslangic_Skoru": int(baslangic_skoru),
+        "Skor": butce["Skor"],
+        "Verim": butce["Verim"],
+        # Eski varsayılanların (ilk deneme) elendiği ana kadarki sonucu, karşılaştırma için
+        "Varsayilan": gecmis[0][-1],
+        "Gecmis": gecmis[kazanan],
+        "Deneme_Sayisi": deneme_sayisi,
+        "Eta": eta,
+        "Sure": time.perf_counter() - bas,
+        "Tarih": datetime.now().isoformat(timespec="seconds"),
+    }
+    if kaydet:
+        onbellege_yaz(profil_anahtari(profil), kayit, yol)
+    return kayit
+
+
+# --- KOMUT SATIRI ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulated Annealing parametre ayarı")
+    parser.add_argument("--onbellek", default=None, help=f"önbellek dosyası (varsayılan {ONBELLEK_DOSYASI})")
+    alt = parser.add_subparsers(dest="komut", required=True)
+
+    p_ayarla = alt.add_parser("ayarla", help="Bir veri seti (.npz) için ayar yapar ve önbelleğe yazar")
+    p_ayarla.add_argument("veri", help="veri_formati ile kaydedilmiş veri seti (.npz)")
+    p_ayarla.add_argument("--deneme", type=int, default=27, help="ilk basamaktaki parametre kümesi sayısı")
+    p_ayarla.add_argument("--eta", type=int, default=3, help="basamak başına eleme oranı")
+    p_ayarla.add_argument("--en-az-iterasyon", type=int, default=None)
+    p_ayarla.add_argument("--seed", type=int, default=None)
+    p_ayarla.add_argument("--max-workers", type=int, default=None)
+    alt.add_parser("listele", help="Önbellekteki profilleri listeler")
+    args = parser.parse_args(argv)
+
+    if args.komut == "listele":
+        for anahtar, kayit in onbellek_oku(args.onbellek).items():
+            p = kayit["parametreler"]
+            print(f"{anahtar:<36}iterasyon {p['iterasyon']}, sicaklik {p['sicaklik']:.1f}, "
+                  f"soguma_orani {p['soguma_orani']:.7f}, tercih_egilimi {p['tercih_egilimi']:.2f} "
+                  f"({kayit['Verim']:.0f} puan/CPU sn, {kayit['Tarih']})")
+        return 0
+
+    if args.deneme < 1 or args.eta < 2:
+        parser.error("--deneme en az 1, --eta en az 2 olmalı")
+
+    import veri_formati
+    from cozucu_kayit import cozucu
+
+    ogrenciler, firmalar = veri_formati.veri_yukle(args.veri)
+    if "Yerleştiği_Firma" not in ogrenciler.columns or ogrenciler["Yerleştiği_Firma"].isna().all():
+        print("Girdide atama yok, Greedy başlangıcı kullanılıyor.")
+        ogrenciler, firmalar = cozucu("greedy")(ogrenciler, firmalar)
+
+    kayit = tavlama_ayarla(ogrenciler, firmalar, args.deneme, args.eta, args.en_az_iterasyon, args.seed,
+                           args.max_workers, yol=args.onbellek,
+                           ilerleme=lambda b, it, n: print(f"Basamak {b}: {n} deneme x {it} iterasyon"))
+    p, v = kayit["parametreler"], kayit["Varsayilan"]
+    print(f"Profil {profil_anahtari(kayit['profil'])} ({kayit['Sure']:.1f} sn)")
+    print(f"Ayar: iterasyon {p['iterasyon']}, sicaklik {p['sicaklik']:.1f}, soguma_orani {p['soguma_orani']:.7f}, "
+          f"tercih_egilimi {p['tercih_egilimi']:.2f} -> +{kayit['Skor'] - kayit['Baslangic_Skoru']} puan, "
+          f"{kayit['Verim']:.0f} puan/CPU sn")
+    print(f"Eski varsayılanlar ({v['Iterasyon']} iterasyon): +{v['Kazanc']} puan, {v['Verim']:.0f} puan/CPU sn")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+import math
+import time
+
+import numpy as np
+
+# İz (trace) sütunları: her örnekte iterasyon, mevcut skor, en iyi skor ve sıcaklık tutulur
+IZ_ALANLARI = ("Iterasyon", "Skor", "En_Iyi", "Sicaklik")
+
+
+class Telemetri:
+    """
+    Yerel arama çözücüleri için yapılandırılmış telemetri (print yerine).
+
+    - Sayaçlar: önerilen / kabul edilen / reddedilen / atlanan hamleler, MOVE / SWAP dağılımı,
+      en iyi skorun kaç kez geliştiği.
+    - Süreler: hamle üretimi (rastgele seçim, komşu bulma) ve skorlama (delta hesabı) ayrı ölçülür.
+    - İz: her 'ornekleme' iterasyonda bir (iterasyon, skor, en iyi, sıcaklık) örneği sabit
+      boyutlu halka tampona (ring buffer) yazılır; tampon dolunca en eski örneklerin üstüne yazılır.
+    - callback verilirse her 'callback_araligi' iterasyonda ozet() ile çağrılır.
+
+    Döngü içinde sadece sayaç artırma ve dizi yazma yapılır, stdout'a bir şey yazılmaz.
+    """
+
+    def __init__(self, iz_boyutu=1000, ornekleme=10, callback=None, callback_araligi=500, zamanlama=True):
+        self.ornekleme = max(1, int(ornekleme))
+        self.callback = callback
+        self.callback_araligi = max(1, int(callback_araligi))
+        self.zamanlama = zamanlama
+        # Çözücü adim()'ı sadece bu aralıkta çağırır (örnekleme ve callback anlarını kapsar)
+        self.adim_araligi = math.gcd(self.ornekleme, self.callback_araligi) if callback else self.ornekleme
+
+        self.onerilen = 0
+        self.kabul = 0
+        self.red = 0
+        self.atlanan = 0
+        self.move = 0
+        self.swap = 0
+        self.gelisme = 0
+        self.uretim_suresi = 0.0
+        self.skorlama_suresi = 0.0
+        self._baslangic = None
+        self._bitis = None
+        self.son_iterasyon = 0
+        self.son_skor = None
+        self.en_iyi_skor = None
+
+        self._iz = np.zeros((max(1, int(iz_boyutu)), len(IZ_ALANLARI)), dtype=np.float64)
+        self._iz_sayisi = 0  # şimdiye kadar yazılan toplam örnek (tampon boyutunu aşabilir)
+
+    def baslat(self, skor=None):
+        """Süreyi başlatır; skor (başlangıç skoru) verilirse ilk adim()'dan önce de mevcut / en iyi skordur."""
+        self._baslangic = time.perf_counter()
+        self._bitis = None
+        if skor is not None:
+            self.son_skor = self.en_iyi_skor = skor
+
+    def bitir(self):
+        self._bitis = time.perf_counter()
+
+    @property
+    def sure(self):
+        if self._baslangic is None:
+            return 0.0
+        return (self._bitis or time.perf_counter()) - self._baslangic
+
+    def adim(self, i, skor, en_iyi, sicaklik):
+        """
+        i % adim_araligi == 0 olan her iterasyonun başında (iterasyon nasıl biterse bitsin)
+        çağrılır: iz örneklemesi ve callback.
+        """
+        self.son_iterasyon = i + 1
+        self.son_skor, self.en_iyi_skor = skor, en_iyi
+        if i % self.ornekleme == 0:
+            self._iz[self._iz_sayisi % len(self._iz)] = (i, skor, en_iyi, sicaklik)
+            self._iz_sayisi += 1
+        if self.callback is not None and i % self.callback_araligi == 0:
+            self.callback(self.ozet(iz=False))
+
+    def iz(self):
+        """Örneklenmiş izi kronolojik sırayla {alan: dizi} olarak döndürür."""
+        boyut = len(self._iz)
+        if self._iz_sayisi <= boyut:
+            satirlar = self._iz[:self._iz_sayisi]
+        else:
+            bas = self._iz_sayisi % boyut
+            satirlar = np.concatenate([self._iz[bas:], self._iz[:bas]])
+        return {alan: satirlar[:, k].copy() for k, alan in enumerate(IZ_ALANLARI)}
+
+    def ozet(self, iz=True):
+        """Sayaçların ve sürelerin anlık görüntüsü (sözlük, pickle edilebilir)."""
+        sure = self.sure
+        ozet = {
+            "Iterasyon": self.son_iterasyon,
+            "Onerilen": self.onerilen,
+            "Kabul": self.kabul,
+            "Red": self.red,
+            "Atlanan": self.atlanan,
+            "MOVE": self.move,
+            "SWAP": self.swap,
+            "Gelisme": self.gelisme,
+            "Skor": self.son_skor,
+            "En_Iyi": self.en_iyi_skor,
+            "Kabul_Orani": self.kabul / self.onerilen if self.onerilen else 0.0,
+            "Sure": sure,
+            "Uretim_Suresi": self.uretim_suresi,
+            "Skorlama_Suresi": self.skorlama_suresi,
+            "Iterasyon_Hizi": self.son_iterasyon / sure if sure > 0 else 0.0,
+        }
+        if iz:
+            ozet["Iz"] = self.iz()
+        return ozet
@@ -0,0 +1,126 @@
+import json
+
+import pandas as pd
+import numpy as np
+
+from atama_durumu import AtamaDurumu, BOS
+
+# Dosya biçimi: <ad>.npz (sayısal diziler) + <ad>.json (manifest: sürüm, boyutlar, firma isimleri)
+BICIM_SURUMU = 1
+VARSAYILAN_VERI = "proje_veri"
+OGRENCI_ON_EKI = "Ogrenci_"
+
+
+def _yollar(yol):
+    """'veri', 'veri.npz' veya 'veri.json' -> ('veri.npz', 'veri.json')"""
+    yol = str(yol)
+    for uzanti in (".npz", ".json"):
+        if yol.endswith(uzanti):
+            yol = yol[:-len(uzanti)]
+    return yol + ".npz", yol + ".json"
+
+
+def tercih_tipi(firma_sayisi):
+    """Tercih matrisinin tipi: 32767 firmaya kadar int16, fazlası int32."""
+    return np.int16 if firma_sayisi < np.iinfo(np.int16).max else np.int32
+
+
+def _sirali_isimler(isimler):
+    """Öğrenci isimleri Ogrenci_1 ... Ogrenci_N ise dosyaya yazılmaz, yüklerken yeniden üretilir."""
+    beklenen = OGRENCI_ON_EKI + pd.Series(np.arange(1, len(isimler) + 1)).astype(str)
+    return bool((pd.Series(isimler, dtype=object).to_numpy() == beklenen.to_numpy()).all())
+
+
+def dizileri_kaydet(yol, firma_isimleri, kontenjan, tercihler, gno, ogrenci_isimleri=None, atama=None):
+    """
+    Veri setini dizilerden yazar. Firma isimleri manifestte bir kere tutulur,
+    tercihler firma id matrisi olarak saklanır (listede olmayan tercih -1).
+    ogrenci_isimleri verilmezse Ogrenci_1 ... Ogrenci_N kabul edilir.
+    """
+    npz_yolu, json_yolu = _yollar(yol)
+    firma_isimleri = [str(isim) for isim in firma_isimleri]
+    tercihler = np.asarray(tercihler)
+
+    diziler = {
+        "tercihler": tercihler.astype(tercih_tipi(len(firma_isimleri))),
+        "kontenjan": np.asarray(kontenjan, dtype=np.int64),
+        "gno": np.asarray(gno, dtype=np.float64),
+    }
+    if ogrenci_isimleri is not None and not _sirali_isimler(ogrenci_isimleri):
+        diziler["ogrenci_isimleri"] = np.asarray(ogrenci_isimleri, dtype=str)
+    if atama is not None and (np.asarray(atama) != BOS).any():
+        diziler["atama"] = np.asarray(atama, dtype=np.int32)
+    np.savez(npz_yolu, **diziler)
+
+    manifest = {
+        "surum": BICIM_SURUMU,
+        "ogrenci_sayisi": int(tercihler.shape[0]),
+        "firma_sayisi": len(firma_isimleri),
+        "tercih_sayisi": int(tercihler.shape[1]),
+        "diziler": sorted(diziler),
+        "firmalar": firma_isimleri,
+    }
+    with open(json_yolu, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    return npz_yolu, json_yolu
+
+
+def veri_kaydet(yol, ogrenciler_df, firmalar_df):
+    """
+    (ogrenciler, firmalar) DataFrame'lerini ikili biçimde kaydeder.
+    Yerleştiği_Firma varsa atama da saklanır; türetilmiş sütunlar
+    (Tercih_Sırası, Yerlesenler, Kalan_Kontenjan) saklanmaz.
+    """
+    durum = AtamaDurumu.dataframe_den(ogrenciler_df, firmalar_df)
+    tercih_sayisi = sum(f'Tercih{i}' in ogrenciler_df.columns for i in range(1, durum.tercihler.shape[1] + 1))
+    return dizileri_kaydet(yol, durum.firma_isimleri, durum.kontenjan, durum.tercihler[:, :tercih_sayisi],
+                           ogrenciler_df['GNO'].to_numpy(), ogrenciler_df['Öğrenci'].to_numpy(), durum.atama)
+
+
+def dizileri_yukle(yol):
+    """Manifest ve dizileri okur; (manifest, diziler) döndürür. Öğrenci isimleri hep dizilerde olur."""
+    npz_yolu, json_yolu = _yollar(yol)
+    with open(json_yolu, encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("surum") != BICIM_SURUMU:
+        raise ValueError(f"Desteklenmeyen veri biçimi sürümü: {manifest.get('surum')}")
+
+    with np.load(npz_yolu) as npz:
+        diziler = {anahtar: npz[anahtar] for anahtar in npz.files}
+    if "ogrenci_isimleri" not in diziler:
+        diziler["ogrenci_isimleri"] = (OGRENCI_ON_EKI + pd.Series(
+            np.arange(1, manifest["ogrenci_sayisi"] + 1)).astype(str)).to_numpy(dtype=object)
+    return manifest, diziler
+
+
+def durum_yukle(yol):
+    """
+    Çözücülerin dizi tabanlı motorları için: DataFrame kurmadan (AtamaDurumu, gno) döndürür.
+    Kontenjan dosyadaki haliyle (atama varsa kalan kontenjan) yüklenir.
+    """
+    manifest, diziler = dizileri_yukle(yol)
+    durum = AtamaDurumu(manifest["firmalar"], diziler["kontenjan"], diziler["tercihler"], diziler.get("atama"))
+    return durum, diziler["gno"]
+
+
+def veri_yukle(yol):
+    """
+    Kaydedilmiş veri setini (ogrenciler, firmalar) DataFrame'leri olarak yükler.
+    Tercih sütunları firma listesi üzerinde Categorical'dır: string ayrıştırma yapılmaz,
+    AtamaDurumu.dataframe_den firma id'lerini doğrudan kategori kodlarından alır.
+    """
+    manifest, diziler = dizileri_yukle(yol)
+    firma_tipi = pd.CategoricalDtype(manifest["firmalar"])
+
+    ogrenciler = pd.DataFrame({"Öğrenci": diziler["ogrenci_isimleri"].astype(object), "GNO": diziler["gno"]})
+    for i in range(manifest["tercih_sayisi"]):
+        ogrenciler[f'Tercih{i + 1}'] = pd.Categorical.from_codes(diziler["tercihler"][:, i], dtype=firma_tipi)
+
+    if "atama" in diziler:
+        atama = diziler["atama"]
+        yerlesen = np.empty(len(atama), dtype=object)
+        yerlesen[atama != BOS] = np.asarray(manifest["firmalar"], dtype=object)[atama[atama != BOS]]
+        ogrenciler['Yerleştiği_Firma'] = yerlesen
+
+    firmalar = pd.DataFrame({"Firma": manifest["firmalar"], "Kontenjan": diziler["kontenjan"]})
+    return ogrenciler, firmalar
@@ -1,7 +1,10 @@
 import pandas as pd
 import numpy as np
 
-def veri_seti_olustur(ogrenci_sayisi, firma_sayisi, tercih_sayisi=5, seed=46):
+import veri_formati
+
+def veri_seti_olustur(ogrenci_sayisi, firma_sayisi, tercih_sayisi=5, seed=46, bicim="csv", kaydet=True):
+    # kaydet=False: sadece DataFrame'ler döner, diske yazılmaz (arayüz önbelleği için)
     if firma_sayisi > ogrenci_sayisi:
         raise ValueError("firma_sayisi, ogrenci_sayisi'ndan büyük olamaz.")
     if firma_sayisi < tercih_sayisi:
@@ -52,11 +55,19 @@ def veri_seti_olustur(ogrenci_sayisi, firma_sayisi, tercih_sayisi=5, seed=46):
         columns=["Öğrenci", "GNO"] + [f"Tercih{j}" for j in range(1, tercih_sayisi + 1)]
     )
 
-    df_firmalar.to_csv("proje_firmalar.csv", index=False, encoding="utf-8-sig")
-    df_ogrenciler.to_csv("proje_ogrenciler.csv", index=False, encoding="utf-8-sig")
+    if not kaydet:
+        return df_firmalar, df_ogrenciler
+
+    if bicim == "npz":
+        # İkili biçim (veri_formati): firma isimleri bir kere, tercihler tamsayı matrisi
+        dosyalar = " ve ".join(veri_formati.veri_kaydet(veri_formati.VARSAYILAN_VERI, df_ogrenciler, df_firmalar))
+    else:
+        df_firmalar.to_csv("proje_firmalar.csv", index=False, encoding="utf-8-sig")
+        df_ogrenciler.to_csv("proje_ogrenciler.csv", index=False, encoding="utf-8-sig")
+        dosyalar = "proje_firmalar.csv ve proje_ogrenciler.csv"
 
     print(
-        "Oluşturuldu: proje_firmalar.csv ve proje_ogrenciler.csv\n"
+        "Oluşturuldu: " + dosyalar + "\n"
         + "Toplam kontenjan: "
         + str(int(df_firmalar["Kontenjan"].sum()))
         + " (Öğrenci Sayısı: " + str(ogrenci_sayisi) + ")"
@@ -64,5 +75,127 @@ def veri_seti_olustur(ogrenci_sayisi, firma_sayisi, tercih_sayisi=5, seed=46):
     return df_firmalar, df_ogrenciler
 
 
+# Büyük veri setleri bu büyüklükte bloklar halinde üretilir; her blok kendi
+# (SeedSequence'tan türetilmiş) üretecini kullanır, aynı seed aynı dosyayı verir
+URETIM_BLOGU = 100_000
+# argpartition yolunda (öğrenci x firma) anahtar matrisinin eleman sınırı
+ANAHTAR_ELEMAN_SINIRI = 4_000_000
+
+
+def tercih_orneklemi(rng, ogrenci_sayisi, firma_sayisi, tercih_sayisi=5):
+    """
+    Tüm öğrenciler için tek seferde tekrarsız tercih örneklemi, (ogrenci_sayisi x tercih_sayisi) firma id'si.
+
+    Az firma varsa her satıra rastgele anahtarlar verilir ve en küçük tercih_sayisi anahtar
+    (argpartition) seçilir. Çok firma varsa tekrarlı çekilir, tekrar içeren satırlar yeniden çekilir
+    (tekrar olasılığı ~ tercih_sayisi^2 / firma_sayisi olduğu için birkaç turda biter).
+    """
+    if firma_sayisi <= 16 * tercih_sayisi:
+        parcalar = []
+        satir = max(1, ANAHTAR_ELEMAN_SINIRI // firma_sayisi)
+        for bas in range(0, ogrenci_sayisi, satir):
+            anahtar = rng.random((min(satir, ogrenci_sayisi - bas), firma_sayisi))
+            secilen = np.argpartition(anahtar, tercih_sayisi - 1, axis=1)[:, :tercih_sayisi]
+            # Seçilenler anahtara göre dizilir: tercih sırası da rastgele olur
+            sira = np.take_along_axis(anahtar, secilen, axis=1).argsort(axis=1)
+            parcalar.append(np.take_along_axis(secilen, sira, axis=1))
+        return np.concatenate(parcalar) if parcalar else np.empty((0, tercih_sayisi), dtype=np.int64)
+
+    secilen = rng.integers(0, firma_sayisi, size=(ogrenci_sayisi, tercih_sayisi))
+    while True:
+        sirali = np.sort(secilen, axis=1)
+        tekrarli = (sirali[:, 1:] == sirali[:, :-1]).any(axis=1)
+        if not tekrarli.any():
+            return secilen
+        secilen[tekrarli] = rng.integers(0, firma_sayisi, size=(int(tekrarli.sum()), tercih_sayisi))
+
+
+def _blok_dizileri(ogrenci_sayisi, firma_sayisi, tercih_sayisi, seed):
+    """Her URETIM_BLOGU için (başlangıç indeksi, gno, tercih firma id'leri) üretir."""
+    blok_sayisi = -(-ogrenci_sayisi // URETIM_BLOGU)
+    # İlk çocuk seed firmalar içindir (buyuk_veri_seti_olustur)
+    blok_seedleri = np.random.SeedSequence(seed).spawn(blok_sayisi + 1)[1:]
+
+    for blok, ss in enumerate(blok_seedleri):
+        rng = np.random.default_rng(ss)
+        bas = blok * URETIM_BLOGU
+        boyut = min(URETIM_BLOGU, ogrenci_sayisi - bas)
+        gno = np.round(rng.uniform(2.0, 4.0, size=boyut), 2)
+        yield bas, gno, tercih_orneklemi(rng, boyut, firma_sayisi, tercih_sayisi)
+
+
+def ogrenci_bloklari(ogrenci_sayisi, firma_sayisi, tercih_sayisi=5, seed=46):
+    """
+    Öğrencileri URETIM_BLOGU'luk DataFrame blokları halinde üretir (generator).
+    Döngü yoktur: GNO'lar ve tercihler blok başına tek seferde çekilir.
+    """
+    firma_isimleri = np.array([f"Firma_{i + 1}" for i in range(firma_sayisi)], dtype=object)
+
+    for bas, gno, tercih_idleri in _blok_dizileri(ogrenci_sayisi, firma_sayisi, tercih_sayisi, seed):
+        df = pd.DataFrame({
+            "Öğrenci": "Ogrenci_" + pd.Series(np.arange(bas + 1, bas + len(gno) + 1)).astype(str),
+            "GNO": gno,
+        })
+        tercihler = firma_isimleri[tercih_idleri]
+        for j in range(tercih_sayisi):
+            df[f"Tercih{j + 1}"] = tercihler[:, j]
+        yield df
+
+
+def buyuk_veri_seti_olustur(ogrenci_sayisi, firma_sayisi, tercih_sayisi=5, seed=46,
+                            ogrenci_dosyasi="proje_ogrenciler.csv", firma_dosyasi="proje_firmalar.csv", bicim="csv",
+                            veri_dosyasi=veri_formati.VARSAYILAN_VERI):
+    """
+    veri_seti_olustur'un yük testleri için büyük (milyonlarca öğrenci) sürümü.
+
+    Öğrenciler bloklar halinde üretilip CSV'ye eklenerek yazılır, bellek kullanımı
+    öğrenci sayısından bağımsızdır. Aynı seed her zaman aynı dosyaları üretir
+    (veri_seti_olustur ile aynı seed aynı veriyi vermez). (df_firmalar, ogrenci_dosyasi) döndürür.
+
+    bicim="npz" ise CSV yerine veri_formati ile veri_dosyasi (.npz + .json) yazılır; bellekte
+    sadece tamsayı/ondalık diziler birikir (öğrenci başına ~18 bayt), .npz yolu döner.
+    """
+    if firma_sayisi > ogrenci_sayisi:
+        raise ValueError("firma_sayisi, ogrenci_sayisi'ndan büyük olamaz.")
+    if firma_sayisi < tercih_sayisi:
+        raise ValueError("firma_sayisi, tercih_sayisi'ndan küçük olamaz.")
+
+    rng = np.random.default_rng(np.random.SeedSequence(seed).spawn(1)[0])
+
+    # Her firmaya en az 1 kontenjan, kalanlar eşit olasılıkla (bincount yerine multinomial, O(firma) bellek)
+    kontenjanlar = 1 + rng.multinomial(ogrenci_sayisi - firma_sayisi, np.full(firma_sayisi, 1 / firma_sayisi))
+    df_firmalar = pd.DataFrame({
+        "Firma": [f"Firma_{i + 1}" for i in range(firma_sayisi)],
+        "Kontenjan": kontenjanlar
+    })
+    df_firmalar["Kalan_Kontenjan"] = df_firmalar["Kontenjan"]
+
+    if bicim == "npz":
+        tercih_tipi = veri_formati.tercih_tipi(firma_sayisi)
+        gnolar, tercihler = [], []
+        for _, gno, tercih_idleri in _blok_dizileri(ogrenci_sayisi, firma_sayisi, tercih_sayisi, seed):
+            gnolar.append(gno)
+            tercihler.append(tercih_idleri.astype(tercih_tipi))
+        npz_yolu, json_yolu = veri_formati.dizileri_kaydet(veri_dosyasi, df_firmalar["Firma"], kontenjanlar,
+                                                          np.concatenate(tercihler), np.concatenate(gnolar))
+        print(f"Oluşturuldu: {npz_yolu} ve {json_yolu} (Öğrenci Sayısı: {ogrenci_sayisi})")
+        return df_firmalar, npz_yolu
+
+    df_firmalar.to_csv(firma_dosyasi, index=False, encoding="utf-8-sig")
+    for blok, df in enumerate(ogrenci_bloklari(ogrenci_sayisi, firma_sayisi, tercih_sayisi, seed)):
+        if blok == 0:
+            df.to_csv(ogrenci_dosyasi, index=False, encoding="utf-8-sig")
+        else:
+            df.to_csv(ogrenci_dosyasi, mode="a", header=False, index=False, encoding="utf-8")
+
+    print(
+        f"Oluşturuldu: {firma_dosyasi} ve {ogrenci_dosyasi}\n"
+        + "Toplam kontenjan: "
+        + str(int(df_firmalar["Kontenjan"].sum()))
+        + " (Öğrenci Sayısı: " + str(ogrenci_sayisi) + ")"
+    )
+    return df_firmalar, ogrenci_dosyasi
+
+
 if __name__ == "__main__":
     veri_seti_olustur(ogrenci_sayisi=150, firma_sayisi=40)